@@ -17,6 +17,14 @@ from models.user import User  # Import models to register them
 from models.project import Project
 from models.task import Task
 from models.label import Label
+from models.document import DocumentText
+from models.sync import SyncTombstone
+from models.activity import TaskActivity
+from models.snapshot import ProjectSnapshot
+from models.job_run import JobRun
+from models.time_entry import TimeEntry, TimeRollup
+from models.task_dependency import TaskDependency
+from models.comment import TaskComment, CommentRead
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
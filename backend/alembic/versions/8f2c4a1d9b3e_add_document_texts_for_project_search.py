@@ -0,0 +1,41 @@
+"""Add document_texts for project document search
+
+Revision ID: 8f2c4a1d9b3e
+Revises: db7a10026aa4
+Create Date: 2026-10-19 09:12:31.402118
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8f2c4a1d9b3e'
+down_revision: Union[str, Sequence[str], None] = 'db7a10026aa4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('document_texts',
+    sa.Column('sha256', sa.String(length=64), nullable=False),
+    sa.Column('text', sa.Text(), nullable=False),
+    sa.Column('search_vector', postgresql.TSVECTOR(), sa.Computed("to_tsvector('english', text)", persisted=True), nullable=True),
+    sa.Column('extracted_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.PrimaryKeyConstraint('sha256')
+    )
+    op.create_index('ix_document_texts_search_vector', 'document_texts', ['search_vector'], unique=False, postgresql_using='gin')
+    op.add_column('projects', sa.Column('document_sha256', sa.String(length=64), nullable=True))
+    op.create_index(op.f('ix_projects_document_sha256'), 'projects', ['document_sha256'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_projects_document_sha256'), table_name='projects')
+    op.drop_column('projects', 'document_sha256')
+    op.drop_index('ix_document_texts_search_vector', table_name='document_texts', postgresql_using='gin')
+    op.drop_table('document_texts')
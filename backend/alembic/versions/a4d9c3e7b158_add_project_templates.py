@@ -0,0 +1,30 @@
+"""Add project templates
+
+Revision ID: a4d9c3e7b158
+Revises: f3b8d61a2c47
+Create Date: 2026-10-19 18:34:51.117283
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a4d9c3e7b158'
+down_revision: Union[str, Sequence[str], None] = 'f3b8d61a2c47'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('projects', sa.Column('is_template', sa.Boolean(), server_default=sa.false(), nullable=False))
+    op.create_index(op.f('ix_projects_is_template'), 'projects', ['is_template'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_projects_is_template'), table_name='projects')
+    op.drop_column('projects', 'is_template')
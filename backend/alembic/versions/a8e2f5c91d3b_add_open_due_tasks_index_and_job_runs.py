@@ -0,0 +1,37 @@
+"""Add partial index on open tasks by due date and job_runs
+
+Revision ID: a8e2f5c91d3b
+Revises: f19c3d7e2a54
+Create Date: 2026-10-19 15:10:52.294417
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a8e2f5c91d3b'
+down_revision: Union[str, Sequence[str], None] = 'f19c3d7e2a54'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_tasks_open_due', 'tasks', ['due_date', 'id'], unique=False,
+                    postgresql_where=sa.text("status <> 'DONE' AND due_date IS NOT NULL"))
+    op.create_table('job_runs',
+    sa.Column('name', sa.String(), nullable=False),
+    sa.Column('last_run_on', sa.Date(), nullable=False),
+    sa.Column('finished_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.PrimaryKeyConstraint('name')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('job_runs')
+    op.drop_index('ix_tasks_open_due', table_name='tasks',
+                  postgresql_where=sa.text("status <> 'DONE' AND due_date IS NOT NULL"))
@@ -0,0 +1,102 @@
+"""Add change sequence and sync tombstones for delta sync
+
+Revision ID: b41e7c2f5a08
+Revises: 8f2c4a1d9b3e
+Create Date: 2026-10-19 11:03:47.915204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b41e7c2f5a08'
+down_revision: Union[str, Sequence[str], None] = '8f2c4a1d9b3e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SYNCED_TABLES = ['projects', 'tasks', 'labels', 'project_members']
+
+# Writers hold this advisory lock (shared) from the moment they draw a change
+# number until commit. GET /sync briefly takes it exclusively, so every number
+# up to the sequence's last_value is known to be committed.
+SYNC_LOCK_KEY = 720_031_032
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE SEQUENCE sync_change_seq")
+
+    for table in SYNCED_TABLES:
+        op.add_column(table, sa.Column('change_seq', sa.BigInteger(), server_default=sa.text("nextval('sync_change_seq')"), nullable=False))
+        op.create_index(op.f(f'ix_{table}_change_seq'), table, ['change_seq'], unique=False)
+
+    op.create_table('sync_tombstones',
+    sa.Column('id', sa.BigInteger(), sa.Identity(), nullable=False),
+    sa.Column('entity_type', sa.String(), nullable=False),
+    sa.Column('entity_id', sa.Integer(), nullable=False),
+    sa.Column('project_id', sa.Integer(), nullable=True),
+    sa.Column('user_id', sa.Integer(), nullable=True),
+    sa.Column('change_seq', sa.BigInteger(), server_default=sa.text("nextval('sync_change_seq')"), nullable=False),
+    sa.Column('deleted_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_sync_tombstones_change_seq'), 'sync_tombstones', ['change_seq'], unique=False)
+
+    op.execute(f"""
+        CREATE FUNCTION sync_bump_change_seq() RETURNS trigger AS $$
+        BEGIN
+            PERFORM pg_advisory_xact_lock_shared({SYNC_LOCK_KEY});
+            NEW.change_seq := nextval('sync_change_seq');
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute(f"""
+        CREATE FUNCTION sync_record_tombstone() RETURNS trigger AS $$
+        BEGIN
+            PERFORM pg_advisory_xact_lock_shared({SYNC_LOCK_KEY});
+            IF TG_TABLE_NAME = 'tasks' THEN
+                INSERT INTO sync_tombstones (entity_type, entity_id, project_id, change_seq)
+                VALUES ('task', OLD.id, OLD.project_id, nextval('sync_change_seq'));
+            ELSIF TG_TABLE_NAME = 'projects' THEN
+                INSERT INTO sync_tombstones (entity_type, entity_id, project_id, change_seq)
+                VALUES ('project', OLD.id, OLD.id, nextval('sync_change_seq'));
+            ELSIF TG_TABLE_NAME = 'labels' THEN
+                INSERT INTO sync_tombstones (entity_type, entity_id, change_seq)
+                VALUES ('label', OLD.id, nextval('sync_change_seq'));
+            ELSIF TG_TABLE_NAME = 'project_members' THEN
+                INSERT INTO sync_tombstones (entity_type, entity_id, project_id, user_id, change_seq)
+                VALUES ('membership', OLD.project_id, OLD.project_id, OLD.user_id, nextval('sync_change_seq'));
+            END IF;
+            RETURN OLD;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    for table in SYNCED_TABLES:
+        op.execute(f"""
+            CREATE TRIGGER {table}_sync_change_seq BEFORE INSERT OR UPDATE ON {table}
+            FOR EACH ROW EXECUTE FUNCTION sync_bump_change_seq()
+        """)
+        op.execute(f"""
+            CREATE TRIGGER {table}_sync_tombstone AFTER DELETE ON {table}
+            FOR EACH ROW EXECUTE FUNCTION sync_record_tombstone()
+        """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in SYNCED_TABLES:
+        op.execute(f"DROP TRIGGER IF EXISTS {table}_sync_tombstone ON {table}")
+        op.execute(f"DROP TRIGGER IF EXISTS {table}_sync_change_seq ON {table}")
+    op.execute("DROP FUNCTION IF EXISTS sync_record_tombstone()")
+    op.execute("DROP FUNCTION IF EXISTS sync_bump_change_seq()")
+
+    op.drop_index(op.f('ix_sync_tombstones_change_seq'), table_name='sync_tombstones')
+    op.drop_table('sync_tombstones')
+    for table in SYNCED_TABLES:
+        op.drop_index(op.f(f'ix_{table}_change_seq'), table_name=table)
+        op.drop_column(table, 'change_seq')
+    op.execute("DROP SEQUENCE sync_change_seq")
@@ -0,0 +1,34 @@
+"""Add trigram index for user lookup
+
+Revision ID: b6e1f8a2d473
+Revises: a4d9c3e7b158
+Create Date: 2026-10-19 19:02:26.845120
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b6e1f8a2d473'
+down_revision: Union[str, Sequence[str], None] = 'a4d9c3e7b158'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    # Must match models.user.USER_SEARCH_TEXT exactly
+    op.execute("""
+        CREATE INDEX ix_users_search_trgm ON users
+        USING gin (lower(first_name || ' ' || last_name || ' ' || email) gin_trgm_ops)
+        WHERE is_active
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_users_search_trgm', table_name='users')
@@ -0,0 +1,106 @@
+"""Add time_entries and incrementally maintained time_rollups
+
+Revision ID: b93d0e4c7f16
+Revises: a8e2f5c91d3b
+Create Date: 2026-10-19 15:48:20.771035
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b93d0e4c7f16'
+down_revision: Union[str, Sequence[str], None] = 'a8e2f5c91d3b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('time_entries',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('task_id', sa.Integer(), nullable=False),
+    sa.Column('project_id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=True),
+    sa.Column('entry_date', sa.Date(), nullable=False),
+    sa.Column('minutes', sa.Integer(), nullable=False),
+    sa.Column('billable', sa.Boolean(), nullable=False),
+    sa.Column('hourly_rate', sa.Numeric(precision=10, scale=2), nullable=True),
+    sa.Column('note', sa.String(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.CheckConstraint('minutes > 0', name='ck_time_entries_minutes_positive'),
+    sa.ForeignKeyConstraint(['project_id'], ['projects.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['task_id'], ['tasks.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='SET NULL'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_time_entries_id'), 'time_entries', ['id'], unique=False)
+    op.create_index(op.f('ix_time_entries_task_id'), 'time_entries', ['task_id'], unique=False)
+    op.create_index('ix_time_entries_user_date', 'time_entries', ['user_id', 'entry_date'], unique=False)
+
+    op.create_table('time_rollups',
+    sa.Column('scope', sa.String(), nullable=False),
+    sa.Column('scope_id', sa.Integer(), nullable=False),
+    sa.Column('month', sa.Date(), nullable=False),
+    sa.Column('entry_count', sa.Integer(), nullable=False),
+    sa.Column('total_minutes', sa.BigInteger(), nullable=False),
+    sa.Column('billable_minutes', sa.BigInteger(), nullable=False),
+    sa.Column('billable_amount', sa.Numeric(precision=14, scale=2), nullable=False),
+    sa.PrimaryKeyConstraint('scope', 'scope_id', 'month')
+    )
+
+    # Adds (sign = 1) or removes (sign = -1) one entry's contribution to its
+    # task, project and user rollups for the entry's month
+    op.execute("""
+        CREATE FUNCTION time_rollup_apply(entry time_entries, sign integer) RETURNS void AS $$
+        DECLARE
+            entry_month date := date_trunc('month', entry.entry_date)::date;
+            billed_minutes integer := CASE WHEN entry.billable THEN entry.minutes ELSE 0 END;
+            billed_amount numeric := CASE WHEN entry.billable
+                THEN round(entry.minutes * coalesce(entry.hourly_rate, 0) / 60.0, 2) ELSE 0 END;
+        BEGIN
+            INSERT INTO time_rollups AS r
+                (scope, scope_id, month, entry_count, total_minutes, billable_minutes, billable_amount)
+            SELECT s.scope, s.scope_id, entry_month, sign, sign * entry.minutes, sign * billed_minutes, sign * billed_amount
+            FROM (VALUES ('task', entry.task_id), ('project', entry.project_id), ('user', entry.user_id)) AS s (scope, scope_id)
+            WHERE s.scope_id IS NOT NULL
+            ON CONFLICT (scope, scope_id, month) DO UPDATE SET
+                entry_count = r.entry_count + EXCLUDED.entry_count,
+                total_minutes = r.total_minutes + EXCLUDED.total_minutes,
+                billable_minutes = r.billable_minutes + EXCLUDED.billable_minutes,
+                billable_amount = r.billable_amount + EXCLUDED.billable_amount;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE FUNCTION time_entries_rollup() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP IN ('UPDATE', 'DELETE') THEN
+                PERFORM time_rollup_apply(OLD, -1);
+            END IF;
+            IF TG_OP IN ('INSERT', 'UPDATE') THEN
+                PERFORM time_rollup_apply(NEW, 1);
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER time_entries_rollup AFTER INSERT OR UPDATE OR DELETE ON time_entries
+        FOR EACH ROW EXECUTE FUNCTION time_entries_rollup()
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP TRIGGER IF EXISTS time_entries_rollup ON time_entries")
+    op.execute("DROP FUNCTION IF EXISTS time_entries_rollup()")
+    op.execute("DROP FUNCTION IF EXISTS time_rollup_apply(time_entries, integer)")
+    op.drop_table('time_rollups')
+    op.drop_index('ix_time_entries_user_date', table_name='time_entries')
+    op.drop_index(op.f('ix_time_entries_task_id'), table_name='time_entries')
+    op.drop_index(op.f('ix_time_entries_id'), table_name='time_entries')
+    op.drop_table('time_entries')
@@ -0,0 +1,41 @@
+"""Add task rank for board ordering
+
+Revision ID: c2f7a9d14e85
+Revises: b93d0e4c7f16
+Create Date: 2026-10-19 16:20:33.408156
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c2f7a9d14e85'
+down_revision: Union[str, Sequence[str], None] = 'b93d0e4c7f16'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('tasks', sa.Column('rank', sa.String(collation='C'), nullable=True))
+    # Existing cards keep their insertion order: fixed-width decimal ranks,
+    # suffixed so none ends in the lowest digit (see core/ranking.py)
+    op.execute("""
+        UPDATE tasks SET rank = ordered.rank
+        FROM (
+            SELECT id, 'V' || lpad(row_number() OVER (PARTITION BY project_id, status ORDER BY created_at, id)::text, 9, '0') || 'V' AS rank
+            FROM tasks
+        ) AS ordered
+        WHERE tasks.id = ordered.id
+    """)
+    op.alter_column('tasks', 'rank', nullable=False)
+    op.create_index('ix_tasks_board_order', 'tasks', ['project_id', 'status', 'rank'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_tasks_board_order', table_name='tasks')
+    op.drop_column('tasks', 'rank')
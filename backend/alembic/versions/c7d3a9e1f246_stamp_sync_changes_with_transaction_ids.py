@@ -0,0 +1,114 @@
+"""Stamp sync changes with transaction IDs instead of a global lock
+
+Revision ID: c7d3a9e1f246
+Revises: b6e1f8a2d473
+Create Date: 2026-10-19 21:14:08.530917
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c7d3a9e1f246'
+down_revision: Union[str, Sequence[str], None] = 'b6e1f8a2d473'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SYNCED_TABLES = ['projects', 'tasks', 'labels', 'project_members']
+
+# xid8 as bigint, comparable with pg_snapshot_xmin() in GET /sync
+CHANGE_XID = "pg_current_xact_id()::text::bigint"
+
+# From b41e7c2f5a08, restored on downgrade
+SYNC_LOCK_KEY = 720_031_032
+
+
+def record_tombstone_function(stamp_xid: bool, lock: str = "") -> str:
+    """sync_record_tombstone(), with or without the change_xid stamp."""
+    xid_column = ", change_xid" if stamp_xid else ""
+    xid_value = f", {CHANGE_XID}" if stamp_xid else ""
+    return f"""
+        CREATE OR REPLACE FUNCTION sync_record_tombstone() RETURNS trigger AS $$
+        BEGIN
+            {lock}
+            IF TG_TABLE_NAME = 'tasks' THEN
+                INSERT INTO sync_tombstones (entity_type, entity_id, project_id, change_seq{xid_column})
+                VALUES ('task', OLD.id, OLD.project_id, nextval('sync_change_seq'){xid_value});
+            ELSIF TG_TABLE_NAME = 'projects' THEN
+                INSERT INTO sync_tombstones (entity_type, entity_id, project_id, change_seq{xid_column})
+                VALUES ('project', OLD.id, OLD.id, nextval('sync_change_seq'){xid_value});
+            ELSIF TG_TABLE_NAME = 'labels' THEN
+                INSERT INTO sync_tombstones (entity_type, entity_id, change_seq{xid_column})
+                VALUES ('label', OLD.id, nextval('sync_change_seq'){xid_value});
+            ELSIF TG_TABLE_NAME = 'project_members' THEN
+                INSERT INTO sync_tombstones (entity_type, entity_id, project_id, user_id, change_seq{xid_column})
+                VALUES ('membership', OLD.project_id, OLD.project_id, OLD.user_id, nextval('sync_change_seq'){xid_value});
+            END IF;
+            RETURN OLD;
+        END;
+        $$ LANGUAGE plpgsql
+    """
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Existing rows predate every running transaction, so 0 keeps them below any sync bound
+    for table in SYNCED_TABLES + ['sync_tombstones']:
+        op.add_column(table, sa.Column('change_xid', sa.BigInteger(), server_default=sa.text('0'), nullable=False))
+        op.create_index(op.f(f'ix_{table}_change_xid'), table, ['change_xid'], unique=False)
+
+    # Writers no longer take the shared advisory lock
+    op.execute(f"""
+        CREATE OR REPLACE FUNCTION sync_bump_change_seq() RETURNS trigger AS $$
+        BEGIN
+            NEW.change_seq := nextval('sync_change_seq');
+            NEW.change_xid := {CHANGE_XID};
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute(record_tombstone_function(True))
+
+    # A replaced team lead loses access unless they are also a member;
+    # GET /sync tells their client to drop the project
+    op.execute(f"""
+        CREATE FUNCTION sync_record_lost_lead() RETURNS trigger AS $$
+        BEGIN
+            INSERT INTO sync_tombstones (entity_type, entity_id, project_id, user_id, change_seq, change_xid)
+            VALUES ('lead', OLD.id, OLD.id, OLD.team_lead_id, nextval('sync_change_seq'), {CHANGE_XID});
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER projects_sync_lost_lead AFTER UPDATE OF team_lead_id ON projects
+        FOR EACH ROW
+        WHEN (OLD.team_lead_id IS NOT NULL AND OLD.team_lead_id IS DISTINCT FROM NEW.team_lead_id)
+        EXECUTE FUNCTION sync_record_lost_lead()
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP TRIGGER IF EXISTS projects_sync_lost_lead ON projects")
+    op.execute("DROP FUNCTION IF EXISTS sync_record_lost_lead()")
+    op.execute("DELETE FROM sync_tombstones WHERE entity_type = 'lead'")
+
+    lock = f"PERFORM pg_advisory_xact_lock_shared({SYNC_LOCK_KEY});"
+    op.execute(f"""
+        CREATE OR REPLACE FUNCTION sync_bump_change_seq() RETURNS trigger AS $$
+        BEGIN
+            {lock}
+            NEW.change_seq := nextval('sync_change_seq');
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute(record_tombstone_function(False, lock))
+
+    for table in SYNCED_TABLES + ['sync_tombstones']:
+        op.drop_index(op.f(f'ix_{table}_change_xid'), table_name=table)
+        op.drop_column(table, 'change_xid')
@@ -0,0 +1,62 @@
+"""Add month-partitioned task_activity log
+
+Revision ID: c7d93e0a6f14
+Revises: b41e7c2f5a08
+Create Date: 2026-10-19 13:26:05.118734
+
+"""
+from datetime import date
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c7d93e0a6f14'
+down_revision: Union[str, Sequence[str], None] = 'b41e7c2f5a08'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _add_months(month_start: date, months: int) -> date:
+    index = month_start.year * 12 + month_start.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('task_activity',
+    sa.Column('id', sa.BigInteger(), sa.Identity(), nullable=False),
+    sa.Column('task_id', sa.Integer(), nullable=False),
+    sa.Column('project_id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=True),
+    sa.Column('action', sa.String(), nullable=False),
+    sa.Column('field', sa.String(), nullable=True),
+    sa.Column('old_value', sa.Text(), nullable=True),
+    sa.Column('new_value', sa.Text(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.PrimaryKeyConstraint('id', 'created_at'),
+    postgresql_partition_by='RANGE (created_at)'
+    )
+    op.create_index('ix_task_activity_task_feed', 'task_activity', ['task_id', sa.text('created_at DESC'), sa.text('id DESC')], unique=False)
+    op.create_index('ix_task_activity_project_feed', 'task_activity', ['project_id', sa.text('created_at DESC'), sa.text('id DESC')], unique=False)
+
+    # Catch-all so inserts never fail if maintenance falls behind
+    op.execute("CREATE TABLE task_activity_default PARTITION OF task_activity DEFAULT")
+
+    # Current month plus two ahead; the app creates later ones as time passes
+    month_start = date.today().replace(day=1)
+    for offset in range(3):
+        start = _add_months(month_start, offset)
+        end = _add_months(month_start, offset + 1)
+        op.execute(
+            f"CREATE TABLE task_activity_y{start.year}m{start.month:02d} PARTITION OF task_activity "
+            f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Dropping the parent drops every partition
+    op.drop_table('task_activity')
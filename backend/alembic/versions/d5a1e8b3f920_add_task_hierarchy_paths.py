@@ -0,0 +1,61 @@
+"""Add task parent and materialized path
+
+Revision ID: d5a1e8b3f920
+Revises: c2f7a9d14e85
+Create Date: 2026-10-19 16:52:07.215934
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd5a1e8b3f920'
+down_revision: Union[str, Sequence[str], None] = 'c2f7a9d14e85'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('tasks', sa.Column('parent_id', sa.Integer(), nullable=True))
+    op.create_foreign_key('tasks_parent_id_fkey', 'tasks', 'tasks', ['parent_id'], ['id'], ondelete='CASCADE')
+    op.create_index(op.f('ix_tasks_parent_id'), 'tasks', ['parent_id'], unique=False)
+
+    # Every existing task is top-level
+    op.add_column('tasks', sa.Column('path', sa.String(collation='C'), nullable=True))
+    op.execute("UPDATE tasks SET path = id || '/'")
+    op.alter_column('tasks', 'path', nullable=False)
+    op.create_index('ix_tasks_path', 'tasks', ['path'], unique=False)
+
+    # New tasks take their parent's path plus their own ID. FOR SHARE makes an
+    # insert wait for a concurrent move of the parent's subtree to commit.
+    op.execute("""
+        CREATE FUNCTION tasks_set_path() RETURNS trigger AS $$
+        BEGIN
+            IF NEW.parent_id IS NULL THEN
+                NEW.path := NEW.id || '/';
+            ELSE
+                SELECT path || NEW.id || '/' INTO NEW.path FROM tasks WHERE id = NEW.parent_id FOR SHARE;
+            END IF;
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER tasks_set_path BEFORE INSERT ON tasks
+        FOR EACH ROW EXECUTE FUNCTION tasks_set_path()
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP TRIGGER IF EXISTS tasks_set_path ON tasks")
+    op.execute("DROP FUNCTION IF EXISTS tasks_set_path()")
+    op.drop_index('ix_tasks_path', table_name='tasks')
+    op.drop_column('tasks', 'path')
+    op.drop_index(op.f('ix_tasks_parent_id'), table_name='tasks')
+    op.drop_constraint('tasks_parent_id_fkey', 'tasks', type_='foreignkey')
+    op.drop_column('tasks', 'parent_id')
@@ -0,0 +1,38 @@
+"""Add project_snapshots for burndown charts
+
+Revision ID: e4b8a61f0c27
+Revises: c7d93e0a6f14
+Create Date: 2026-10-19 14:02:47.530921
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e4b8a61f0c27'
+down_revision: Union[str, Sequence[str], None] = 'c7d93e0a6f14'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('project_snapshots',
+    sa.Column('project_id', sa.Integer(), nullable=False),
+    sa.Column('snapshot_date', sa.Date(), nullable=False),
+    sa.Column('todo_tasks', sa.Integer(), nullable=False),
+    sa.Column('in_progress_tasks', sa.Integer(), nullable=False),
+    sa.Column('review_tasks', sa.Integer(), nullable=False),
+    sa.Column('done_tasks', sa.Integer(), nullable=False),
+    sa.Column('timeline_percentage', sa.Float(), nullable=False),
+    sa.ForeignKeyConstraint(['project_id'], ['projects.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('project_id', 'snapshot_date')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('project_snapshots')
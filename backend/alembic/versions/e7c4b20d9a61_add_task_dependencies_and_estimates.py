@@ -0,0 +1,44 @@
+"""Add task dependencies and estimates
+
+Revision ID: e7c4b20d9a61
+Revises: d5a1e8b3f920
+Create Date: 2026-10-19 17:21:46.530417
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e7c4b20d9a61'
+down_revision: Union[str, Sequence[str], None] = 'd5a1e8b3f920'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('tasks', sa.Column('estimate_days', sa.Integer(), nullable=True))
+    op.create_table('task_dependencies',
+    sa.Column('blocker_id', sa.Integer(), nullable=False),
+    sa.Column('blocked_id', sa.Integer(), nullable=False),
+    sa.Column('project_id', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.CheckConstraint('blocker_id <> blocked_id', name='ck_task_dependencies_not_self'),
+    sa.ForeignKeyConstraint(['blocked_id'], ['tasks.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['blocker_id'], ['tasks.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['project_id'], ['projects.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('blocker_id', 'blocked_id')
+    )
+    op.create_index(op.f('ix_task_dependencies_project_id'), 'task_dependencies', ['project_id'], unique=False)
+    op.create_index('ix_task_dependencies_blocked', 'task_dependencies', ['blocked_id', 'blocker_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_task_dependencies_blocked', table_name='task_dependencies')
+    op.drop_index(op.f('ix_task_dependencies_project_id'), table_name='task_dependencies')
+    op.drop_table('task_dependencies')
+    op.drop_column('tasks', 'estimate_days')
@@ -0,0 +1,32 @@
+"""Index project timeline columns
+
+Revision ID: f19c3d7e2a54
+Revises: e4b8a61f0c27
+Create Date: 2026-10-19 14:41:09.662370
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f19c3d7e2a54'
+down_revision: Union[str, Sequence[str], None] = 'e4b8a61f0c27'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(op.f('ix_projects_start_date'), 'projects', ['start_date'], unique=False)
+    op.create_index(op.f('ix_projects_end_date'), 'projects', ['end_date'], unique=False)
+    op.create_index(op.f('ix_projects_status'), 'projects', ['status'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_projects_status'), table_name='projects')
+    op.drop_index(op.f('ix_projects_end_date'), table_name='projects')
+    op.drop_index(op.f('ix_projects_start_date'), table_name='projects')
@@ -0,0 +1,57 @@
+"""Add task comments, read markers and denormalized comment counts
+
+Revision ID: f3b8d61a2c47
+Revises: e7c4b20d9a61
+Create Date: 2026-10-19 17:58:12.604391
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3b8d61a2c47'
+down_revision: Union[str, Sequence[str], None] = 'e7c4b20d9a61'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('tasks', sa.Column('comment_count', sa.Integer(), server_default='0', nullable=False))
+    op.create_table('task_comments',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('task_id', sa.Integer(), nullable=False),
+    sa.Column('project_id', sa.Integer(), nullable=False),
+    sa.Column('author_id', sa.Integer(), nullable=True),
+    sa.Column('body', sa.Text(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+    sa.ForeignKeyConstraint(['author_id'], ['users.id'], ondelete='SET NULL'),
+    sa.ForeignKeyConstraint(['project_id'], ['projects.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['task_id'], ['tasks.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_task_comments_id'), 'task_comments', ['id'], unique=False)
+    op.create_index('ix_task_comments_thread', 'task_comments', ['task_id', sa.text('created_at DESC'), sa.text('id DESC')], unique=False)
+    op.create_index('ix_task_comments_project', 'task_comments', ['project_id', 'task_id', 'created_at'], unique=False)
+    op.create_table('comment_reads',
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('task_id', sa.Integer(), nullable=False),
+    sa.Column('last_read_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['task_id'], ['tasks.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('user_id', 'task_id')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('comment_reads')
+    op.drop_index('ix_task_comments_project', table_name='task_comments')
+    op.drop_index('ix_task_comments_thread', table_name='task_comments')
+    op.drop_index(op.f('ix_task_comments_id'), table_name='task_comments')
+    op.drop_table('task_comments')
+    op.drop_column('tasks', 'comment_count')
@@ -6,6 +6,8 @@ from database import get_db
 from models.user import User, UserRole, Department
 from schemas.user import UserRegister, UserLogin, Token, UserResponse
 from core.security import hash_password, verify_password, create_access_token, decode_token
+from core.event_bus import invalidate_cache
+from core.writes import save
 from datetime import datetime
 
 router = APIRouter(prefix="/auth", tags=["Authentication"])
@@ -71,10 +73,9 @@ async def register(user_data: UserRegister, db: AsyncSession = Depends(get_db)):
         department=Department(user_data.department) if user_data.department else None
     )
     
-    db.add(new_user)
-    await db.commit()
-    await db.refresh(new_user)
+    await save(db, new_user)
     
+    invalidate_cache("user_lookup")
     return new_user
 
 @router.post("/login", response_model=Token)
@@ -0,0 +1,163 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, update, func, and_, or_
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import selectinload
+from typing import Optional
+from database import get_db
+from models.comment import TaskComment, CommentRead
+from models.task import Task
+from models.project import Project
+from models.user import User, UserRole
+from schemas.comment import CommentCreate, CommentUpdate, CommentResponse, CommentPage, UnreadComments
+from api.v1.users import get_current_user
+from api.v1.projects import accessible_project_ids
+from api.v1.tasks import has_project_access
+from core.events import publish_event
+from core.pagination import fetch_newest_first
+from core.writes import save
+
+router = APIRouter(tags=["Comments"])
+
+
+async def get_accessible_task(task_id: int, current_user: User, db: AsyncSession) -> Task:
+    result = await db.execute(
+        select(Task)
+        .options(
+            selectinload(Task.project).selectinload(Project.members)
+        )
+        .where(Task.id == task_id)
+    )
+    task = result.scalar_one_or_none()
+    if not task:
+        raise HTTPException(status_code=404, detail="Task not found")
+    if not task.project or not has_project_access(task.project, current_user):
+        raise HTTPException(status_code=403, detail="Not authorized to view this task")
+    return task
+
+
+async def get_own_comment(comment_id: int, current_user: User, db: AsyncSession, allow_managers: bool) -> TaskComment:
+    """Authors edit their own comments; admins/PMs may also delete any comment."""
+    comment = (await db.execute(select(TaskComment).where(TaskComment.id == comment_id))).scalar_one_or_none()
+    if not comment:
+        raise HTTPException(status_code=404, detail="Comment not found")
+    managers = [UserRole.ADMIN, UserRole.PROJECT_MANAGER] if allow_managers else []
+    if comment.author_id != current_user.id and current_user.role not in managers:
+        raise HTTPException(status_code=403, detail="Not authorized to modify this comment")
+    return comment
+
+
+async def adjust_comment_count(db: AsyncSession, task_id: int, project_id: int, delta: int, *instances) -> None:
+    """
+    Update the task's denormalized count and save `instances` in the same
+    transaction, then push the new value to boards.
+    """
+    comment_count = (await db.execute(
+        update(Task)
+        .where(Task.id == task_id)
+        .values(comment_count=Task.comment_count + delta)
+        .returning(Task.comment_count)
+    )).scalar()
+    await save(db, *instances)
+    if comment_count is not None:
+        publish_event("task.updated", project_id, task_id=task_id, changes={"comment_count": comment_count})
+
+
+@router.get("/tasks/{task_id}/comments", response_model=CommentPage)
+async def list_comments(
+    task_id: int,
+    cursor: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=200),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """A task's comments, newest first."""
+    await get_accessible_task(task_id, current_user, db)
+    items, next_cursor = await fetch_newest_first(db, TaskComment, TaskComment.task_id == task_id, cursor, limit)
+    return CommentPage(items=items, next_cursor=next_cursor)
+
+
+@router.post("/tasks/{task_id}/comments", response_model=CommentResponse, status_code=status.HTTP_201_CREATED)
+async def create_comment(
+    task_id: int,
+    comment_data: CommentCreate,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    task = await get_accessible_task(task_id, current_user, db)
+    comment = TaskComment(task_id=task.id, project_id=task.project_id, author_id=current_user.id, body=comment_data.body)
+    await adjust_comment_count(db, task.id, task.project_id, 1, comment)
+    return comment
+
+
+@router.patch("/comments/{comment_id}", response_model=CommentResponse)
+async def update_comment(
+    comment_id: int,
+    comment_update: CommentUpdate,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    comment = await get_own_comment(comment_id, current_user, db, allow_managers=False)
+    comment.body = comment_update.body
+    await save(db)
+    return comment
+
+
+@router.delete("/comments/{comment_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_comment(
+    comment_id: int,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    comment = await get_own_comment(comment_id, current_user, db, allow_managers=True)
+    task_id, project_id = comment.task_id, comment.project_id
+    await db.delete(comment)
+    await adjust_comment_count(db, task_id, project_id, -1)
+    return None
+
+
+@router.post("/tasks/{task_id}/comments/read", status_code=status.HTTP_204_NO_CONTENT)
+async def mark_comments_read(
+    task_id: int,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """Mark every comment on the task as read by the current user."""
+    await get_accessible_task(task_id, current_user, db)
+    statement = insert(CommentRead).values(user_id=current_user.id, task_id=task_id, last_read_at=func.now())
+    await db.execute(statement.on_conflict_do_update(
+        index_elements=[CommentRead.user_id, CommentRead.task_id],
+        set_={"last_read_at": statement.excluded.last_read_at},
+    ))
+    await db.commit()
+    return None
+
+
+@router.get("/comments/unread", response_model=UnreadComments)
+async def get_unread_comments(
+    project_id: int,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Unread comment counts for every task on a project's board, in one query.
+    Comments by the current user never count as unread.
+    """
+    allowed = await accessible_project_ids(current_user, db)
+    if allowed is not None and project_id not in allowed:
+        raise HTTPException(status_code=404, detail="Project not found")
+
+    result = await db.execute(
+        select(TaskComment.task_id, func.count())
+        .outerjoin(CommentRead, and_(
+            CommentRead.task_id == TaskComment.task_id,
+            CommentRead.user_id == current_user.id,
+        ))
+        .where(
+            TaskComment.project_id == project_id,
+            TaskComment.author_id.is_distinct_from(current_user.id),
+            or_(CommentRead.last_read_at.is_(None), TaskComment.created_at > CommentRead.last_read_at),
+        )
+        .group_by(TaskComment.task_id)
+    )
+    return UnreadComments(project_id=project_id, counts=dict(result.all()))
@@ -0,0 +1,102 @@
+import asyncio
+from fastapi import APIRouter, HTTPException, Request, WebSocket, WebSocketDisconnect, status
+from fastapi.responses import StreamingResponse
+from database import AsyncSessionLocal
+from api.v1.users import get_user_from_token
+from api.v1.projects import accessible_project_ids
+from core.events import broker, Subscription, CLOSE_MESSAGE
+
+router = APIRouter(prefix="/events", tags=["Events"])
+
+# SSE comment sent when idle so proxies keep the connection open
+HEARTBEAT_SECONDS = 15
+
+
+async def open_subscription(token: str, project_id: int | None) -> Subscription:
+    """
+    Authenticate a push connection and subscribe it with its project scope.
+    Uses a short-lived session so the long-running stream holds no DB connection.
+    """
+    async with AsyncSessionLocal() as db:
+        current_user = await get_user_from_token(token, db)
+        if not current_user.is_active:
+            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="User account is inactive")
+        project_ids = await accessible_project_ids(current_user, db)
+
+    if project_id is not None:
+        if project_ids is not None and project_id not in project_ids:
+            raise HTTPException(status_code=403, detail="Not authorized to view this project")
+        project_ids = {project_id}
+    return broker.subscribe(current_user.id, project_ids, pinned_project_id=project_id)
+
+
+@router.get("/stream")
+async def stream_events(
+    request: Request,
+    token: str,
+    project_id: int | None = None,
+):
+    """
+    Server-Sent Events stream of task changes for the projects the user can access.
+    Pass `project_id` to follow a single board. Events:
+    task.created (full task), task.updated (changed fields only), task.deleted, resync.
+    """
+    subscription = await open_subscription(token, project_id)
+
+    async def event_source():
+        try:
+            yield "retry: 3000\n\n"
+            while True:
+                try:
+                    message = await asyncio.wait_for(subscription.queue.get(), timeout=HEARTBEAT_SECONDS)
+                except asyncio.TimeoutError:
+                    if await request.is_disconnected():
+                        break
+                    yield ": heartbeat\n\n"
+                    continue
+                yield f"data: {message}\n\n"
+                if message == CLOSE_MESSAGE:
+                    break
+        finally:
+            broker.unsubscribe(subscription)
+
+    return StreamingResponse(
+        event_source(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.websocket("/ws")
+async def websocket_events(
+    websocket: WebSocket,
+    token: str,
+    project_id: int | None = None,
+):
+    """WebSocket variant of /events/stream; sends the same JSON messages."""
+    try:
+        subscription = await open_subscription(token, project_id)
+    except HTTPException:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        return
+
+    await websocket.accept()
+
+    async def forward():
+        while True:
+            message = await subscription.queue.get()
+            await websocket.send_text(message)
+            if message == CLOSE_MESSAGE:
+                await websocket.close()
+                return
+
+    sender = asyncio.create_task(forward())
+    try:
+        # Clients don't send anything; receiving just detects disconnects promptly
+        while True:
+            await websocket.receive_text()
+    except WebSocketDisconnect:
+        pass
+    finally:
+        sender.cancel()
+        broker.unsubscribe(subscription)
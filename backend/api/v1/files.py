@@ -1,27 +1,219 @@
 import os
 import shutil
-from fastapi import APIRouter, UploadFile, File, HTTPException, status
-from typing import List
-import uuid
+from fastapi import APIRouter, BackgroundTasks, Depends, UploadFile, File, Header, HTTPException, Request, status
+from fastapi.responses import RedirectResponse
+from starlette.concurrency import run_in_threadpool
+from core import images, uploads
+from core.cache import TTLCache
+from core.static import IMMUTABLE_CACHE_CONTROL
+from core.uploads import UPLOAD_DIR, UploadSessionError, OffsetMismatchError
+from core.workers import run_in_process
+from models.user import User
+from schemas.file import FileUploadResponse, UploadSessionCreate, UploadSessionResponse
+from api.v1.users import get_current_user
 
 router = APIRouter(prefix="/files", tags=["Files"])
 
-UPLOAD_DIR = "uploads"
-os.makedirs(UPLOAD_DIR, exist_ok=True)
+# (filename, size, format) -> rendition filename, for renditions known to exist on disk
+rendition_cache = TTLCache(maxsize=4096)
 
-@router.post("/upload")
-async def upload_file(file: UploadFile = File(...)):
+
+def _copy_upload(source, file_path: str):
+    with open(file_path, "wb") as buffer:
+        shutil.copyfileobj(source, buffer)
+
+
+@router.post("/upload", response_model=FileUploadResponse)
+async def upload_file(background_tasks: BackgroundTasks, file: UploadFile = File(...)):
     """Upload a file and return its URL."""
     try:
         # Generate unique filename
-        file_extension = os.path.splitext(file.filename)[1]
-        unique_filename = f"{uuid.uuid4()}{file_extension}"
+        unique_filename = uploads.new_stored_filename(file.filename)
         file_path = os.path.join(UPLOAD_DIR, unique_filename)
-        
-        with open(file_path, "wb") as buffer:
-            shutil.copyfileobj(file.file, buffer)
-            
+
+        # Copy off the event loop so large files don't stall other requests
+        await run_in_threadpool(_copy_upload, file.file, file_path)
+        background_tasks.add_task(uploads.post_process_upload, unique_filename)
+
         # Return relative URL (assuming static file serving is set up)
         return {"url": f"/static/{unique_filename}", "filename": file.filename}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"File upload failed: {str(e)}")
+
+
+# --- Resumable uploads ---
+# 1. POST   /files/uploads                      -> create session
+# 2. PATCH  /files/uploads/{id}  (Upload-Offset) -> append a chunk at the current offset
+# 3. GET    /files/uploads/{id}                 -> current offset (resume after a dropped connection)
+# 4. POST   /files/uploads/{id}/complete        -> finalize and get the file URL
+
+
+def session_response(state: dict) -> UploadSessionResponse:
+    return UploadSessionResponse(
+        upload_id=state["upload_id"],
+        filename=state["filename"],
+        total_size=state["total_size"],
+        offset=state.get("offset", 0),
+        max_chunk_size=uploads.MAX_CHUNK_SIZE,
+    )
+
+
+async def get_owned_session(upload_id: str, current_user: User) -> dict:
+    """Load an upload session and make sure it belongs to the current user."""
+    try:
+        state = await run_in_threadpool(uploads.load_session, upload_id)
+    except UploadSessionError:
+        raise HTTPException(status_code=404, detail="Upload session not found")
+    if state["owner_id"] != current_user.id:
+        raise HTTPException(status_code=404, detail="Upload session not found")
+    return state
+
+
+@router.post("/uploads", response_model=UploadSessionResponse, status_code=status.HTTP_201_CREATED)
+async def create_upload_session(
+    session_data: UploadSessionCreate,
+    current_user: User = Depends(get_current_user),
+):
+    """Start a resumable upload session."""
+    if session_data.total_size > uploads.MAX_UPLOAD_SIZE:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"File exceeds the maximum upload size of {uploads.MAX_UPLOAD_SIZE} bytes"
+        )
+
+    state = await run_in_threadpool(
+        uploads.create_session,
+        session_data.filename,
+        session_data.total_size,
+        current_user.id,
+        session_data.content_type,
+    )
+    return session_response(state)
+
+
+@router.get("/uploads/{upload_id}", response_model=UploadSessionResponse)
+async def get_upload_session(
+    upload_id: str,
+    current_user: User = Depends(get_current_user),
+):
+    """Return the session's current offset so a client can resume."""
+    state = await get_owned_session(upload_id, current_user)
+    return session_response(state)
+
+
+@router.patch("/uploads/{upload_id}", response_model=UploadSessionResponse)
+async def upload_chunk(
+    upload_id: str,
+    request: Request,
+    upload_offset: int = Header(..., alias="Upload-Offset"),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Append a chunk (raw request body) to the session.
+    Upload-Offset must equal the session's current offset; otherwise 409 is
+    returned with the expected offset so the client can resume from there.
+    """
+    state = await get_owned_session(upload_id, current_user)
+
+    if upload_offset != state["offset"]:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Chunk must start at offset {state['offset']}",
+            headers={"Upload-Offset": str(state["offset"])},
+        )
+
+    # Read the chunk with a hard cap so one request can't hold a worker indefinitely
+    chunk = bytearray()
+    async for part in request.stream():
+        chunk.extend(part)
+        if len(chunk) > uploads.MAX_CHUNK_SIZE:
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail=f"Chunk exceeds the maximum chunk size of {uploads.MAX_CHUNK_SIZE} bytes"
+            )
+    if not chunk:
+        raise HTTPException(status_code=400, detail="Empty chunk")
+
+    try:
+        state["offset"] = await run_in_threadpool(
+            uploads.write_chunk, upload_id, upload_offset, bytes(chunk), state["total_size"]
+        )
+    except OffsetMismatchError as e:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=str(e),
+            headers={"Upload-Offset": str(e.expected)},
+        )
+    except UploadSessionError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return session_response(state)
+
+
+@router.post("/uploads/{upload_id}/complete", response_model=FileUploadResponse)
+async def complete_upload(
+    upload_id: str,
+    background_tasks: BackgroundTasks,
+    current_user: User = Depends(get_current_user),
+):
+    """Finalize a fully received upload and return its URL."""
+    state = await get_owned_session(upload_id, current_user)
+    try:
+        stored_filename = await run_in_threadpool(uploads.finalize_session, upload_id)
+    except UploadSessionError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    background_tasks.add_task(uploads.post_process_upload, stored_filename)
+    return {"url": f"/static/{stored_filename}", "filename": state["filename"]}
+
+
+@router.delete("/uploads/{upload_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def abort_upload(
+    upload_id: str,
+    current_user: User = Depends(get_current_user),
+):
+    """Abort an upload session and discard its partial data."""
+    await get_owned_session(upload_id, current_user)
+    await run_in_threadpool(uploads.abort_session, upload_id)
+    return None
+
+
+@router.get("/avatars/{filename}")
+async def get_avatar_rendition(
+    filename: str,
+    size: str = images.DEFAULT_RENDITION_SIZE,
+    format: str = images.DEFAULT_RENDITION_FORMAT,
+):
+    """
+    Redirect to a fixed-size rendition of an uploaded image.
+    Renditions are normally generated at upload time; missing ones are
+    generated on first request. The redirect itself is cacheable forever.
+    """
+    if size not in images.RENDITION_SIZES:
+        raise HTTPException(status_code=400, detail=f"Unknown size '{size}'. Use one of: {', '.join(images.RENDITION_SIZES)}")
+    if format not in images.RENDITION_FORMATS:
+        raise HTTPException(status_code=400, detail=f"Unknown format '{format}'. Use one of: {', '.join(images.RENDITION_FORMATS)}")
+    if os.path.basename(filename) != filename or filename.startswith(".") or not images.is_image(filename):
+        raise HTTPException(status_code=404, detail="Image not found")
+
+    cache_key = (filename, size, format)
+    rendition = rendition_cache.get(cache_key)
+    if rendition is None:
+        source_path = os.path.join(UPLOAD_DIR, filename)
+        if not os.path.isfile(source_path):
+            raise HTTPException(status_code=404, detail="Image not found")
+        rendition = images.rendition_filename(filename, size, format)
+        if not os.path.exists(os.path.join(UPLOAD_DIR, rendition)):
+            if images.Image is None:
+                # No imaging support installed; fall back to the original
+                return RedirectResponse(f"/static/{filename}", status_code=status.HTTP_307_TEMPORARY_REDIRECT)
+            try:
+                await run_in_process(images.generate_rendition, source_path, size, format)
+            except Exception:
+                raise HTTPException(status_code=415, detail="File is not a supported image")
+        rendition_cache.set(cache_key, rendition)
+
+    return RedirectResponse(
+        f"/static/{rendition}",
+        status_code=status.HTTP_301_MOVED_PERMANENTLY,
+        headers={"Cache-Control": IMMUTABLE_CACHE_CONTROL},
+    )
@@ -7,6 +7,7 @@ from models.label import Label
 from models.user import User, UserRole
 from schemas.label import LabelCreate, LabelUpdate, LabelResponse
 from api.v1.users import get_current_user
+from core.writes import save
 
 router = APIRouter(prefix="/labels", tags=["Labels"])
 
@@ -41,9 +42,7 @@ async def create_label(
         raise HTTPException(status_code=400, detail="Label already exists")
     
     new_label = Label(name=label_data.name, color=label_data.color)
-    db.add(new_label)
-    await db.commit()
-    await db.refresh(new_label)
+    await save(db, new_label)
     return new_label
 
 @router.patch("/{label_id}", response_model=LabelResponse)
@@ -65,8 +64,7 @@ async def update_label(
     for key, value in update_data.items():
         setattr(label, key, value)
         
-    await db.commit()
-    await db.refresh(label)
+    await save(db)
     return label
 
 @router.delete("/{label_id}", status_code=status.HTTP_204_NO_CONTENT)
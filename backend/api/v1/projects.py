@@ -1,17 +1,149 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, or_, func
 from sqlalchemy.orm import selectinload
-from typing import List
+from typing import List, Optional
+from datetime import timedelta
 from database import get_db
-from models.project import Project, project_members
+from models.project import Project, ProjectStatus, project_members
+from models.document import DocumentText
+from models.activity import TaskActivity
 from models.user import User, UserRole
-from schemas.project import ProjectCreate, ProjectUpdate, ProjectResponse, ProjectMemberAdd, ProjectMemberRemove
-from api.v1.users import get_current_user
+from schemas.project import ProjectCreate, ProjectUpdate, ProjectResponse, ProjectListCompact, ProjectClone, ProjectMemberAdd, ProjectMemberRemove
+from schemas.activity import ActivityPage
+from schemas.dependency import CriticalPathReport, ScheduledTask
+from api.v1.users import get_current_user, USER_BRIEF_COLUMNS, user_row, escape_like
+from core.loaders import UserLoader, get_user_loader
+from core.writes import save
+from core.serialization import FastJSONResponse
+from core.fieldsets import parse_fields, select_columns
+from core.documents import index_project_document
+from core.events import publish_access_change
+from core.event_bus import invalidate_cache
+from core.activity import fetch_activity_page
+from core.cache import TTLCache, register_cache
+from core.critical_path import DependencyCycleError, project_schedule
+from core.cloning import clone_project
 
 router = APIRouter(prefix="/projects", tags=["Projects"])
 
+# Sort keys accepted by GET /projects; prefix with "-" for descending
+PROJECT_SORT_FIELDS = {
+    "name": Project.name,
+    "created_at": Project.created_at,
+    "start_date": Project.start_date,
+    "end_date": Project.end_date,
+    "progress": Project.progress_percentage,
+    "duration": Project.duration_days,
+    "time_used": Project.time_used,
+}
+CLOSED_PROJECT_STATUSES = [ProjectStatus.COMPLETED, ProjectStatus.CANCELLED]
+# Columns behind ProjectResponse, timeline properties computed in SQL; users
+# and task counts are attached by attach_project_details()
+PROJECT_LIST_COLUMNS = (
+    Project.id, Project.name, Project.description, Project.client_id, Project.team_lead_id,
+    Project.start_date, Project.end_date, Project.status, Project.document_url,
+    Project.is_template, Project.created_at,
+    Project.progress_percentage.label("progress_percentage"),
+    Project.duration_days.label("duration_days"),
+    Project.time_used.label("time_used"),
+)
+# Names accepted by GET /projects?fields=
+PROJECT_LIST_FIELDS = [column.key for column in PROJECT_LIST_COLUMNS] + ["task_count", "team_lead", "client", "members"]
+
+# project_id -> schedule in day offsets; dropped whenever the project's tasks or
+# dependencies change (see api/v1/tasks.py). The TTL bounds the damage if an
+# invalidation is ever lost (e.g. NOTIFY failing while the bus reconnects).
+critical_path_cache = register_cache("critical_path", TTLCache(maxsize=256, ttl=600))
+
 
+def project_access_user_ids(project: Project) -> set[int]:
+    """Non-admin users who can see the project: its team lead and members."""
+    user_ids = {m.id for m in project.members}
+    if project.team_lead_id:
+        user_ids.add(project.team_lead_id)
+    return user_ids
+
+
+async def accessible_project_ids(current_user: User, db: AsyncSession) -> set[int] | None:
+    """IDs of projects the user can view; None means all projects (admins/PMs)."""
+    if current_user.role in [UserRole.ADMIN, UserRole.PROJECT_MANAGER]:
+        return None
+    result = await db.execute(
+        select(Project.id).where(
+            or_(
+                Project.team_lead_id == current_user.id,
+                Project.id.in_(
+                    select(project_members.c.project_id).where(project_members.c.user_id == current_user.id)
+                ),
+            )
+        )
+    )
+    return set(result.scalars().all())
+
+
+async def attach_project_details(
+    db: AsyncSession, projects: list[dict], fields: set[str] | None = None, compact: bool = False
+) -> dict[str, dict]:
+    """
+    Add task_count, team_lead, client and members (UserBrief-shaped) to
+    project rows, or only those of them in `fields`: one query for counts,
+    one for members and one for leads and clients. Each user's dict is built
+    once and shared between projects. With `compact` the rows get user IDs
+    instead; the users are returned once each, keyed by ID.
+    """
+    from models.task import Task  # Import here to avoid circular imports
+
+    def wanted(name: str) -> bool:
+        return fields is None or name in fields
+
+    by_id = {project["id"]: project for project in projects}
+    if not by_id:
+        return {}
+
+    if wanted("task_count"):
+        for project in projects:
+            project["task_count"] = 0
+        counts = await db.execute(
+            select(Task.project_id, func.count(Task.id))
+            .where(Task.project_id.in_(by_id))
+            .group_by(Task.project_id)
+        )
+        for project_id, task_count in counts.all():
+            by_id[project_id]["task_count"] = task_count
+
+    users = {}
+    if wanted("members"):
+        for project in projects:
+            project["members"] = []
+        members = await db.execute(
+            select(project_members.c.project_id, *USER_BRIEF_COLUMNS)
+            .join(User, User.id == project_members.c.user_id)
+            .where(project_members.c.project_id.in_(by_id))
+        )
+        for row in members.mappings():
+            user_id = row["id"]
+            if user_id not in users:
+                users[user_id] = user_row({column.key: row[column.key] for column in USER_BRIEF_COLUMNS})
+            by_id[row["project_id"]]["members"].append(user_id if compact else users[user_id])
+
+    roles = [role for role in ("team_lead", "client") if wanted(role)]
+    if roles:
+        lead_ids = {project[f"{role}_id"] for project in projects for role in roles} - {None}
+        missing = lead_ids - users.keys()
+        if missing:
+            leads = await db.execute(select(*USER_BRIEF_COLUMNS).where(User.id.in_(missing)))
+            for row in leads.mappings():
+                users[row["id"]] = user_row(row)
+        for project in projects:
+            for role in roles:
+                user_id = project[f"{role}_id"]
+                project[role] = user_id if compact else users.get(user_id)
+
+    # JSON object keys are strings
+    return {str(user_id): user for user_id, user in users.items()}
+
+
 def can_manage_project(project: Project, current_user: User) -> bool:
     """Admins/PMs can manage any; team leads can manage their own projects."""
     if current_user.role in [UserRole.ADMIN, UserRole.PROJECT_MANAGER]:
@@ -20,12 +152,11 @@ def can_manage_project(project: Project, current_user: User) -> bool:
         return True
     return False
 
-async def validate_team_lead(user_id: int, db: AsyncSession):
+async def validate_team_lead(user_id: int, users: UserLoader):
     """
     Scenario 5: Validate that team_lead has role TEAM_LEAD or STAFF.
     """
-    result = await db.execute(select(User).where(User.id == user_id))
-    user = result.scalar_one_or_none()
+    user = await users.load(user_id)
     
     if not user:
         raise HTTPException(status_code=404, detail=f"User {user_id} not found")
@@ -37,12 +168,11 @@ async def validate_team_lead(user_id: int, db: AsyncSession):
         )
     return user
 
-async def validate_client(user_id: int, db: AsyncSession):
+async def validate_client(user_id: int, users: UserLoader):
     """
     Scenario 5: Validate that client has role CLIENT.
     """
-    result = await db.execute(select(User).where(User.id == user_id))
-    user = result.scalar_one_or_none()
+    user = await users.load(user_id)
     
     if not user:
         raise HTTPException(status_code=404, detail=f"User {user_id} not found")
@@ -57,20 +187,24 @@ async def validate_client(user_id: int, db: AsyncSession):
 @router.post("/", response_model=ProjectResponse, status_code=status.HTTP_201_CREATED)
 async def create_project(
     project_data: ProjectCreate,
+    background_tasks: BackgroundTasks,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db),
+    users: UserLoader = Depends(get_user_loader)
 ):
     """Create a new project with role validation."""
     if current_user.role not in [UserRole.ADMIN, UserRole.PROJECT_MANAGER]:
         raise HTTPException(status_code=403, detail="Not authorized to create projects")
     
+    # Fetch every referenced user with one query
+    users.prime(project_data.team_lead_id, project_data.client_id, *project_data.member_ids)
     # Validate team lead role if provided
     if project_data.team_lead_id:
-        await validate_team_lead(project_data.team_lead_id, db)
+        await validate_team_lead(project_data.team_lead_id, users)
     
     # Validate client role if provided
     if project_data.client_id:
-        await validate_client(project_data.client_id, db)
+        await validate_client(project_data.client_id, users)
     
     # Create project
     project = Project(
@@ -80,24 +214,23 @@ async def create_project(
         team_lead_id=project_data.team_lead_id,
         start_date=project_data.start_date,
         end_date=project_data.end_date,
-        status=project_data.status
+        status=ProjectStatus(project_data.status),
+        document_url=project_data.document_url,
+        is_template=project_data.is_template
     )
     
-    db.add(project)
-    await db.commit()
-    await db.refresh(project)
-    
     # Add members if provided
     if project_data.member_ids:
         unique_member_ids = list(dict.fromkeys(project_data.member_ids))
-        result = await db.execute(select(User).where(User.id.in_(unique_member_ids)))
-        members = result.scalars().all()
+        loaded = await users.load_many(unique_member_ids)
+        members = [m for m in loaded if m is not None]
         if len(members) != len(unique_member_ids):
             missing = set(unique_member_ids) - {m.id for m in members}
             raise HTTPException(status_code=404, detail=f"Member(s) not found: {missing}")
         project.members.extend(members)
-        await db.commit()
-        await db.refresh(project)
+
+    # Project and member links are written in one transaction
+    await save(db, project)
     
     # Add computed properties
     response_dict = {
@@ -109,86 +242,120 @@ async def create_project(
         "start_date": project.start_date,
         "end_date": project.end_date,
         "status": project.status.value,
+        "document_url": project.document_url,
+        "is_template": project.is_template,
         "created_at": project.created_at.isoformat(),
         "progress_percentage": project.progress_percentage,
         "duration_days": project.duration_days
     }
+
+    granted = set(project_data.member_ids)
+    if project.team_lead_id:
+        granted.add(project.team_lead_id)
+    publish_access_change(project.id, granted=granted, revoked=set())
+
+    # Extract and index the document text off the request path
+    if project.document_url:
+        background_tasks.add_task(index_project_document, project.id, project.document_url)
     
     return ProjectResponse(**response_dict)
 
-@router.get("/", response_model=List[ProjectResponse])
+@router.get("/", response_model=List[ProjectResponse] | ProjectListCompact)
 async def list_projects(
     skip: int = 0,
     limit: int = 100,
+    q: str | None = None,
+    sort: str | None = None,
+    status: ProjectStatus | None = None,
+    ending_within_days: int | None = Query(None, ge=0),
+    overdue: bool | None = None,
+    min_progress: float | None = None,
+    max_progress: float | None = None,
+    templates: bool = False,
+    fields: str | None = Query(None, description="Comma-separated project fields to return, e.g. name,status,end_date"),
+    compact: bool = False,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
-    """List all projects with team lead, client, and member details."""
-    from models.task import Task  # Import here to avoid circular imports
-    from schemas.project import UserBrief
+    """
+    List all projects with team lead, client, and member details.
+    `q` searches project name, description and the attached document's text.
+    `sort` is one of PROJECT_SORT_FIELDS, optionally prefixed with "-", e.g.
+    `-progress` for the furthest-along timelines first. `ending_within_days`
+    and `overdue` only consider projects that are not completed or cancelled.
+    Templates are listed only with `templates=true`. `fields` limits both
+    the columns read and the keys returned (id is always included).
+    `compact=true` returns {"items", "users"}: team_lead, client and members
+    are user IDs and each user appears once in `users` (ProjectListCompact).
+    Read as plain rows and encoded directly (see core/serialization.py).
+    """
+    wanted = parse_fields(fields, PROJECT_LIST_FIELDS)
+    # team_lead/client are resolved from their ID columns, returned or not
+    needed = wanted and wanted | {f"{role}_id" for role in ("team_lead", "client") if role in wanted}
+    base_query = select(*select_columns(PROJECT_LIST_COLUMNS, needed))
 
-    base_query = (
-        select(Project)
-        .options(
-            selectinload(Project.team_lead),
-            selectinload(Project.client),
-            selectinload(Project.members)
+    if q:
+        document_matches = select(DocumentText.sha256).where(
+            DocumentText.search_vector.op("@@")(func.plainto_tsquery("english", q))
+        )
+        pattern = f"%{escape_like(q)}%"
+        base_query = base_query.where(
+            or_(
+                Project.name.ilike(pattern, escape="\\"),
+                Project.description.ilike(pattern, escape="\\"),
+                Project.document_sha256.in_(document_matches),
+            )
         )
-        .offset(skip)
-        .limit(limit)
-    )
 
-    if current_user.role in [UserRole.ADMIN, UserRole.PROJECT_MANAGER]:
-        result = await db.execute(base_query)
+    base_query = base_query.where(Project.is_template.is_(templates))
+
+    # Timeline filters and sorts are evaluated in SQL via the hybrid properties
+    if status:
+        base_query = base_query.where(Project.status == status)
+    if ending_within_days is not None:
+        base_query = base_query.where(
+            Project.status.notin_(CLOSED_PROJECT_STATUSES),
+            Project.end_date.between(func.current_date(), func.current_date() + ending_within_days),
+        )
+    if overdue is not None:
+        is_overdue = (Project.end_date < func.current_date()) & Project.status.notin_(CLOSED_PROJECT_STATUSES)
+        base_query = base_query.where(is_overdue if overdue else ~is_overdue)
+    if min_progress is not None:
+        base_query = base_query.where(Project.progress_percentage >= min_progress)
+    if max_progress is not None:
+        base_query = base_query.where(Project.progress_percentage <= max_progress)
+
+    if sort:
+        sort_column = PROJECT_SORT_FIELDS.get(sort.lstrip("-"))
+        if sort_column is None:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Unknown sort '{sort}'. Use one of: {', '.join(PROJECT_SORT_FIELDS)}"
+            )
+        base_query = base_query.order_by(sort_column.desc() if sort.startswith("-") else sort_column, Project.id)
     else:
+        base_query = base_query.order_by(Project.id)
+
+    if current_user.role not in [UserRole.ADMIN, UserRole.PROJECT_MANAGER]:
         # Restrict to projects where user is team lead or member
-        result = await db.execute(
-            base_query
-            .outerjoin(project_members, project_members.c.project_id == Project.id)
-            .where(
-                or_(
-                    Project.team_lead_id == current_user.id,
-                    project_members.c.user_id == current_user.id,
-                )
+        base_query = base_query.where(
+            or_(
+                Project.team_lead_id == current_user.id,
+                Project.id.in_(
+                    select(project_members.c.project_id).where(project_members.c.user_id == current_user.id)
+                ),
             )
-            .distinct()
-        )
-
-    projects = result.scalars().all()
-    
-    # Bulk task counts to avoid N+1
-    project_ids = [p.id for p in projects]
-    task_counts = {}
-    if project_ids:
-        counts_result = await db.execute(
-            select(Task.project_id, func.count(Task.id))
-            .where(Task.project_id.in_(project_ids))
-            .group_by(Task.project_id)
         )
-        task_counts = {pid: cnt for pid, cnt in counts_result.all()}
-
-    # Add computed properties to each project
-    project_responses = []
-    for project in projects:
-        task_count = task_counts.get(project.id, 0)
-
-        response = ProjectResponse.model_validate(project)
-        response.progress_percentage = project.progress_percentage
-        response.duration_days = project.duration_days
-        response.time_used = project.time_used
-        response.task_count = task_count
-        
-        # Add user details
-        if project.team_lead:
-            response.team_lead = UserBrief.model_validate(project.team_lead)
-        if project.client:
-            response.client = UserBrief.model_validate(project.client)
-        if project.members:
-            response.members = [UserBrief.model_validate(m) for m in project.members]
-        
-        project_responses.append(response)
-    
-    return project_responses
+    result = await db.execute(base_query.offset(skip).limit(limit))
+    projects = [dict(row) for row in result.mappings()]
+    users = await attach_project_details(db, projects, wanted, compact)
+    if wanted is not None:
+        for project in projects:
+            for key in needed - wanted:
+                del project[key]
+    if compact:
+        return FastJSONResponse({"items": projects, "users": users})
+    return FastJSONResponse(projects)
 
 @router.get("/{project_id}", response_model=ProjectResponse)
 async def get_project(
@@ -246,8 +413,10 @@ async def get_project(
 async def update_project(
     project_id: int,
     project_update: ProjectUpdate,
+    background_tasks: BackgroundTasks,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db),
+    users: UserLoader = Depends(get_user_loader)
 ):
     """Update a project."""
     # FIX: Eager load members to prevent MissingGreenlet error
@@ -278,14 +447,18 @@ async def update_project(
                 detail="Team Leads cannot change the client; contact an Admin or Project Manager."
             )
 
+    # Fetch every referenced user with one query
+    users.prime(project_update.team_lead_id, project_update.client_id, *(project_update.member_ids or []))
     # Validate team lead role if updating
     if project_update.team_lead_id:
-        await validate_team_lead(project_update.team_lead_id, db)
+        await validate_team_lead(project_update.team_lead_id, users)
     
     # Validate client role if updating
     if project_update.client_id:
-        await validate_client(project_update.client_id, db)
+        await validate_client(project_update.client_id, users)
     
+    previous_access = project_access_user_ids(project)
+
     # Update fields with timeline safety if only one date provided
     update_data = project_update.model_dump(exclude_unset=True)
     member_ids = update_data.pop('member_ids', None)
@@ -298,22 +471,35 @@ async def update_project(
             detail=f"End date ({new_end}) must be after start date ({new_start})."
         )
 
+    document_changed = "document_url" in update_data and update_data["document_url"] != project.document_url
+    if document_changed:
+        # Unlinked until the new document has been indexed
+        project.document_sha256 = None
+
+    # The schema takes plain strings; keep the loaded row's enum type (nothing is refreshed)
+    if update_data.get("status") is not None:
+        update_data["status"] = ProjectStatus(update_data["status"])
     for key, value in update_data.items():
         setattr(project, key, value)
     
     # Update members if provided
     if member_ids is not None:
         unique_member_ids = list(dict.fromkeys(member_ids))
-        result = await db.execute(select(User).where(User.id.in_(unique_member_ids)))
-        members = result.scalars().all()
+        loaded = await users.load_many(unique_member_ids)
+        members = [m for m in loaded if m is not None]
         if len(members) != len(unique_member_ids):
             missing = set(unique_member_ids) - {m.id for m in members}
             raise HTTPException(status_code=404, detail=f"Member(s) not found: {missing}")
         project.members.clear()
         project.members.extend(members)
     
-    await db.commit()
-    await db.refresh(project)
+    await save(db)
+
+    current_access = project_access_user_ids(project)
+    publish_access_change(project.id, granted=current_access - previous_access, revoked=previous_access - current_access)
+
+    if document_changed and project.document_url:
+        background_tasks.add_task(index_project_document, project.id, project.document_url)
     
     response = ProjectResponse.model_validate(project)
     response.progress_percentage = project.progress_percentage
@@ -328,7 +514,11 @@ async def delete_project(
     db: AsyncSession = Depends(get_db)
 ):
     """Delete a project."""
-    result = await db.execute(select(Project).where(Project.id == project_id))
+    result = await db.execute(
+        select(Project)
+        .options(selectinload(Project.members))
+        .where(Project.id == project_id)
+    )
     project = result.scalar_one_or_none()
     
     if not project:
@@ -336,6 +526,114 @@ async def delete_project(
     if not can_manage_project(project, current_user):
         raise HTTPException(status_code=403, detail="Not authorized to delete this project")
     
+    previous_access = project_access_user_ids(project)
     await db.delete(project)
     await db.commit()
+
+    publish_access_change(project_id, granted=set(), revoked=previous_access)
+    # The project's tasks went with it
+    invalidate_cache("workload")
     return None
+
+
+@router.get("/{project_id}/activity", response_model=ActivityPage)
+async def get_project_activity(
+    project_id: int,
+    cursor: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=200),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """Task activity across a project, newest first."""
+    allowed = await accessible_project_ids(current_user, db)
+    if allowed is not None and project_id not in allowed:
+        raise HTTPException(status_code=404, detail="Project not found")
+
+    items, next_cursor = await fetch_activity_page(db, TaskActivity.project_id == project_id, cursor, limit)
+    return ActivityPage(items=items, next_cursor=next_cursor)
+
+
+@router.get("/{project_id}/critical-path", response_model=CriticalPathReport)
+async def get_critical_path(
+    project_id: int,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Earliest/latest dates and slack for every task, and the critical path,
+    from task estimates and blocking dependencies.
+    """
+    allowed = await accessible_project_ids(current_user, db)
+    if allowed is not None and project_id not in allowed:
+        raise HTTPException(status_code=404, detail="Project not found")
+    start_date = (await db.execute(select(Project.start_date).where(Project.id == project_id))).scalar()
+    if start_date is None:
+        raise HTTPException(status_code=404, detail="Project not found")
+
+    cached = critical_path_cache.get(project_id)
+    if cached is None:
+        # Taken before reading, so a write committed meanwhile keeps this result out of the cache
+        version = critical_path_cache.version(project_id)
+        try:
+            cached = await project_schedule(db, project_id)
+        except DependencyCycleError as e:
+            raise HTTPException(status_code=409, detail=str(e))
+        critical_path_cache.set(project_id, cached, version=version)
+    nodes, duration, chain = cached
+
+    # Offsets are kept in the cache so a changed start date needs no invalidation
+    def day(offset: int):
+        return start_date + timedelta(days=offset)
+
+    return CriticalPathReport(
+        project_id=project_id,
+        start_date=start_date,
+        finish_date=day(duration),
+        duration_days=duration,
+        critical_path=chain,
+        tasks=[
+            ScheduledTask(
+                task_id=node.task_id,
+                title=node.title,
+                duration_days=node.duration,
+                earliest_start=day(node.earliest_start),
+                earliest_finish=day(node.earliest_finish),
+                latest_start=day(node.latest_start),
+                latest_finish=day(node.latest_finish),
+                slack_days=node.slack,
+                critical=node.slack == 0,
+            )
+            for node in nodes
+        ],
+    )
+
+
+@router.post("/{project_id}/clone", response_model=ProjectResponse, status_code=status.HTTP_201_CREATED)
+async def clone_project_endpoint(
+    project_id: int,
+    clone_data: ProjectClone,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Create a project from an existing one (usually a template): members,
+    tasks with subtasks, dependencies and labels are copied in one transaction.
+    """
+    if current_user.role not in [UserRole.ADMIN, UserRole.PROJECT_MANAGER]:
+        raise HTTPException(status_code=403, detail="Not authorized to create projects")
+    source = (await db.execute(select(Project).where(Project.id == project_id))).scalar_one_or_none()
+    if not source:
+        raise HTTPException(status_code=404, detail="Project not found")
+
+    end_date = clone_data.end_date or clone_data.start_date + (source.end_date - source.start_date)
+    new_project_id, member_ids = await clone_project(
+        db, source, clone_data.name, clone_data.start_date, end_date, clone_data.is_template
+    )
+    await db.commit()
+
+    granted = set(member_ids)
+    if source.team_lead_id:
+        granted.add(source.team_lead_id)
+    publish_access_change(new_project_id, granted=granted, revoked=set())
+    invalidate_cache("workload")
+    return await get_project(new_project_id, current_user, db)
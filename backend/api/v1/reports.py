@@ -0,0 +1,384 @@
+from datetime import date, datetime, time, timedelta, timezone
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, func, extract, cast, literal_column, Float
+from sqlalchemy.dialects.postgresql import ARRAY
+from typing import Optional
+from database import get_db
+from models.activity import TaskActivity
+from models.task import Task, TaskStatus
+from models.snapshot import ProjectSnapshot
+from models.time_entry import TimeRollup
+from models.project import Project, TEMPLATE_PROJECT_IDS
+from models.user import User, UserRole
+from schemas.report import (
+    DurationStats, FlowMetrics, FlowReport, BurndownReport, WorkloadGroup, WorkloadReport,
+    ProfitabilityRow, ProfitabilityReport,
+)
+from api.v1.users import get_current_user
+from api.v1.projects import accessible_project_ids
+from core.cache import TTLCache, register_cache
+
+router = APIRouter(prefix="/reports", tags=["Reports"])
+
+PERCENTILES = [0.5, 0.85, 0.95]
+# Statuses a task waits in before it is done
+ACTIVE_STATUSES = [TaskStatus.TODO.value, TaskStatus.IN_PROGRESS.value, TaskStatus.REVIEW.value]
+DEFAULT_RANGE_DAYS = 28
+
+# Reports for ranges that include today change as work completes; closed ranges rarely do
+reports_cache = register_cache("reports", TTLCache(maxsize=512, ttl=300))
+CLOSED_RANGE_TTL_SECONDS = 6 * 60 * 60
+
+# Cleared (in every worker) whenever a task's assignee, status or due date changes
+workload_cache = register_cache("workload", TTLCache(maxsize=128, ttl=60))
+
+
+def report_range(start: date | None, end: date | None) -> tuple[date, date]:
+    end = end or date.today()
+    start = start or end - timedelta(days=DEFAULT_RANGE_DAYS - 1)
+    if start > end:
+        raise HTTPException(status_code=400, detail="start must be on or before end")
+    return start, end
+
+
+def report_cache_ttl(end: date) -> float | None:
+    return CLOSED_RANGE_TTL_SECONDS if end < date.today() else None
+
+
+async def report_scope(project_id: int | None, current_user: User, db: AsyncSession) -> tuple | None:
+    """Project IDs the report may cover (sorted, hashable); None means all projects."""
+    allowed = await accessible_project_ids(current_user, db)
+    if project_id is not None:
+        if allowed is not None and project_id not in allowed:
+            raise HTTPException(status_code=404, detail="Project not found")
+        return (project_id,)
+    return None if allowed is None else tuple(sorted(allowed))
+
+
+def hours(interval):
+    return cast(extract("epoch", interval), Float) / 3600.0
+
+
+def flow_query(start_at: datetime, end_at: datetime, group_by: str, project_ids: tuple | None):
+    """
+    Lead/cycle/time-in-status percentiles for tasks completed in [start_at, end_at).
+    Status rows of the activity log are turned into segments with LEAD() so
+    each segment knows when the task left that status.
+    """
+    status_rows = (TaskActivity.field == "status") & TaskActivity.action.in_(["created", "updated"])
+
+    # Tasks that reached DONE inside the range (partition-pruned by created_at)
+    completed_tasks = (
+        select(TaskActivity.task_id)
+        .where(
+            status_rows,
+            TaskActivity.new_value == TaskStatus.DONE.value,
+            TaskActivity.created_at >= start_at,
+            TaskActivity.created_at < end_at,
+            TaskActivity.project_id.notin_(TEMPLATE_PROJECT_IDS),
+        )
+    )
+    if project_ids is not None:
+        completed_tasks = completed_tasks.where(TaskActivity.project_id.in_(project_ids))
+
+    segments = (
+        select(
+            TaskActivity.task_id,
+            TaskActivity.new_value.label("status"),
+            TaskActivity.created_at.label("entered_at"),
+            func.lead(TaskActivity.created_at).over(
+                partition_by=TaskActivity.task_id,
+                order_by=(TaskActivity.created_at, TaskActivity.id),
+            ).label("left_at"),
+            # Last completion inside the range; anything after it is ignored
+            func.max(TaskActivity.created_at)
+            .filter(TaskActivity.new_value == TaskStatus.DONE.value)
+            .over(partition_by=TaskActivity.task_id)
+            .label("completed_at"),
+        )
+        .where(status_rows, TaskActivity.created_at < end_at, TaskActivity.task_id.in_(completed_tasks))
+        .cte("segments")
+    )
+
+    per_task = (
+        select(
+            segments.c.task_id,
+            func.min(segments.c.completed_at).label("completed_at"),
+            func.min(segments.c.entered_at).filter(segments.c.status == TaskStatus.IN_PROGRESS.value).label("started_at"),
+            *[
+                func.sum(hours(segments.c.left_at - segments.c.entered_at))
+                .filter(segments.c.status == status)
+                .label(f"in_{status.lower()}")
+                for status in ACTIVE_STATUSES
+            ],
+        )
+        .where(segments.c.entered_at <= segments.c.completed_at)
+        .group_by(segments.c.task_id)
+        .cte("per_task")
+    )
+
+    # Inlined so the planner sees a float8[] constant rather than untyped parameters
+    percentile_array = literal_column(f"ARRAY[{', '.join(map(str, PERCENTILES))}]::float8[]")
+
+    def stats(value):
+        return (
+            func.percentile_cont(percentile_array, type_=ARRAY(Float)).within_group(value),
+            func.avg(value),
+        )
+
+    group_column = Task.project_id if group_by == "project" else Task.assignee_id
+    columns = [group_column.label("group_id"), func.count().label("completed")]
+    columns += stats(hours(per_task.c.completed_at - Task.created_at))
+    columns += stats(hours(per_task.c.completed_at - per_task.c.started_at))
+    for status in ACTIVE_STATUSES:
+        columns += stats(per_task.c[f"in_{status.lower()}"])
+
+    # Joining tasks drops deleted tasks and gives the current assignee
+    return (
+        select(*columns)
+        .select_from(per_task.join(Task, Task.id == per_task.c.task_id))
+        .group_by(group_column)
+        .order_by(group_column)
+    )
+
+
+def duration_stats(percentiles, average) -> DurationStats:
+    values = [round(v, 2) if v is not None else None for v in (percentiles or [None] * len(PERCENTILES))]
+    return DurationStats(
+        p50=values[0], p85=values[1], p95=values[2],
+        avg=round(average, 2) if average is not None else None,
+    )
+
+
+@router.get("/flow", response_model=FlowReport)
+async def get_flow_report(
+    group_by: str = Query("project", pattern="^(project|assignee)$"),
+    start: Optional[date] = None,
+    end: Optional[date] = None,
+    project_id: Optional[int] = None,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Lead time, cycle time and time-in-status percentiles for tasks completed
+    between start and end (inclusive, default the last 4 weeks), per project
+    or per assignee.
+    """
+    start, end = report_range(start, end)
+    scope = await report_scope(project_id, current_user, db)
+
+    cache_key = ("flow", group_by, start, end, scope)
+    report = reports_cache.get(cache_key)
+    if report is not None:
+        return report
+
+    start_at = datetime.combine(start, time.min, tzinfo=timezone.utc)
+    end_at = datetime.combine(end + timedelta(days=1), time.min, tzinfo=timezone.utc)
+    result = await db.execute(flow_query(start_at, end_at, group_by, scope))
+
+    groups = []
+    for row in result.all():
+        group_id, completed, *values = row
+        lead_time = duration_stats(*values[0:2])
+        cycle_time = duration_stats(*values[2:4])
+        time_in_status = {
+            status: duration_stats(*values[4 + 2 * i: 6 + 2 * i])
+            for i, status in enumerate(ACTIVE_STATUSES)
+        }
+        groups.append(FlowMetrics(
+            group_id=group_id,
+            completed=completed,
+            lead_time=lead_time,
+            cycle_time=cycle_time,
+            time_in_status=time_in_status,
+        ))
+
+    report = FlowReport(start=start, end=end, group_by=group_by, groups=groups)
+    reports_cache.set(cache_key, report, ttl=report_cache_ttl(end))
+    return report
+
+
+@router.get("/projects/{project_id}/burndown", response_model=BurndownReport)
+async def get_project_burndown(
+    project_id: int,
+    start: Optional[date] = None,
+    end: Optional[date] = None,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """Daily open/done counts and timeline % from the stored snapshots (default: all history)."""
+    await report_scope(project_id, current_user, db)
+    if start and end and start > end:
+        raise HTTPException(status_code=400, detail="start must be on or before end")
+
+    query = select(ProjectSnapshot).where(ProjectSnapshot.project_id == project_id)
+    if start:
+        query = query.where(ProjectSnapshot.snapshot_date >= start)
+    if end:
+        query = query.where(ProjectSnapshot.snapshot_date <= end)
+    result = await db.execute(query.order_by(ProjectSnapshot.snapshot_date))
+    return BurndownReport(project_id=project_id, points=result.scalars().all())
+
+
+@router.get("/workload", response_model=WorkloadReport)
+async def get_workload_report(
+    group_by: str = Query("assignee", pattern="^(assignee|department|role)$"),
+    project_id: Optional[int] = None,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """Open, in-progress, overdue and due-this-week task counts per assignee, department or role."""
+    if current_user.role not in [UserRole.ADMIN, UserRole.PROJECT_MANAGER, UserRole.TEAM_LEAD]:
+        raise HTTPException(status_code=403, detail="Not authorized to view workload reports")
+    scope = await report_scope(project_id, current_user, db)
+    today = date.today()
+
+    cache_key = (group_by, scope, today)
+    report = workload_cache.get(cache_key)
+    if report is not None:
+        return report
+
+    week_end = today + timedelta(days=6 - today.weekday())
+    if group_by == "assignee":
+        group_columns = [User.id, User.first_name, User.last_name]
+    elif group_by == "department":
+        group_columns = [User.department]
+    else:
+        group_columns = [User.role]
+
+    # Only open tasks are scanned; every count is a subset of them
+    query = (
+        select(
+            *group_columns,
+            func.count().label("open_tasks"),
+            func.count().filter(Task.status == TaskStatus.IN_PROGRESS).label("in_progress_tasks"),
+            func.count().filter(Task.due_date < today).label("overdue_tasks"),
+            func.count().filter(Task.due_date.between(today, week_end)).label("due_this_week_tasks"),
+        )
+        .select_from(Task)
+        .outerjoin(User, User.id == Task.assignee_id)
+        .where(Task.status != TaskStatus.DONE, Task.project_id.notin_(TEMPLATE_PROJECT_IDS))
+        .group_by(*group_columns)
+    )
+    if scope is not None:
+        query = query.where(Task.project_id.in_(scope))
+    result = await db.execute(query)
+
+    groups = []
+    for row in result.all():
+        counts = row[len(group_columns):]
+        if group_by == "assignee":
+            user_id, first_name, last_name = row[:3]
+            key, label = user_id, f"{first_name} {last_name}" if user_id else "Unassigned"
+        else:
+            value = row[0]
+            key = value.value if value else None
+            label = key or ("Unassigned" if group_by == "role" else "No department")
+        groups.append(WorkloadGroup(
+            key=key,
+            label=label,
+            open_tasks=counts[0],
+            in_progress_tasks=counts[1],
+            overdue_tasks=counts[2],
+            due_this_week_tasks=counts[3],
+        ))
+    groups.sort(key=lambda g: (-g.open_tasks, g.label))
+
+    report = WorkloadReport(group_by=group_by, as_of=today, groups=groups)
+    workload_cache.set(cache_key, report)
+    return report
+
+
+def month_start(day: date) -> date:
+    return day.replace(day=1)
+
+
+@router.get("/profitability", response_model=ProfitabilityReport)
+async def get_profitability_report(
+    group_by: str = Query("project", pattern="^(project|task|user)$"),
+    start: Optional[date] = None,
+    end: Optional[date] = None,
+    project_id: Optional[int] = None,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Logged and billable hours and billed amount per project, task or user,
+    read from the monthly time rollups (whole months covering start..end,
+    default the past year).
+    """
+    if current_user.role not in [UserRole.ADMIN, UserRole.PROJECT_MANAGER, UserRole.TEAM_LEAD]:
+        raise HTTPException(status_code=403, detail="Not authorized to view profitability reports")
+    if group_by == "user" and current_user.role == UserRole.TEAM_LEAD:
+        # User rollups span projects, so they can't be limited to the lead's projects
+        raise HTTPException(status_code=403, detail="Per-user profitability is limited to admins and project managers")
+    if group_by == "user" and project_id is not None:
+        raise HTTPException(status_code=400, detail="project_id can't be combined with group_by=user")
+
+    end = end or date.today()
+    start = start or month_start(end).replace(year=month_start(end).year - 1)
+    if start > end:
+        raise HTTPException(status_code=400, detail="start must be on or before end")
+    first_month, last_month = month_start(start), month_start(end)
+    scope = await report_scope(project_id, current_user, db)
+
+    if group_by == "project":
+        label = Project.name
+        label_join = (Project, Project.id == TimeRollup.scope_id)
+        scope_column = Project.id
+    elif group_by == "task":
+        label = Task.title
+        label_join = (Task, Task.id == TimeRollup.scope_id)
+        scope_column = Task.project_id
+    else:
+        label = func.concat(User.first_name, " ", User.last_name)
+        label_join = (User, User.id == TimeRollup.scope_id)
+        scope_column = None
+
+    query = (
+        select(
+            TimeRollup.scope_id,
+            label,
+            func.sum(TimeRollup.entry_count),
+            func.sum(TimeRollup.total_minutes),
+            func.sum(TimeRollup.billable_minutes),
+            func.sum(TimeRollup.billable_amount),
+        )
+        .join(*label_join)
+        .where(
+            TimeRollup.scope == group_by,
+            TimeRollup.month.between(first_month, last_month),
+        )
+        .group_by(TimeRollup.scope_id, label)
+        .having(func.sum(TimeRollup.entry_count) > 0)
+        .order_by(func.sum(TimeRollup.billable_amount).desc(), TimeRollup.scope_id)
+    )
+    if scope_column is not None:
+        # Per-user rollups span projects and can't leave template time out
+        query = query.where(scope_column.notin_(TEMPLATE_PROJECT_IDS))
+    if scope is not None and scope_column is not None:
+        query = query.where(scope_column.in_(scope))
+    result = await db.execute(query)
+
+    rows = []
+    for key, row_label, entry_count, total_minutes, billable_minutes, billable_amount in result.all():
+        rows.append(ProfitabilityRow(
+            key=key,
+            label=row_label,
+            entry_count=entry_count,
+            hours=round(total_minutes / 60, 2),
+            billable_hours=round(billable_minutes / 60, 2),
+            billable_amount=float(billable_amount),
+            billable_ratio=round(billable_minutes / total_minutes, 4) if total_minutes else None,
+        ))
+
+    next_month = last_month.replace(year=last_month.year + last_month.month // 12, month=last_month.month % 12 + 1)
+    return ProfitabilityReport(
+        start=first_month,
+        end=next_month - timedelta(days=1),
+        group_by=group_by,
+        rows=rows,
+        total_hours=round(sum(r.hours for r in rows), 2),
+        total_billable_amount=round(sum(r.billable_amount for r in rows), 2),
+    )
@@ -0,0 +1,193 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, and_, or_, text, tuple_
+from sqlalchemy.orm import selectinload
+from database import get_db
+from models.task import Task
+from models.project import Project, project_members
+from models.label import Label
+from models.sync import SyncTombstone
+from models.user import User
+from schemas.sync import SyncResponse, SyncMembership, SyncMembershipKey, SyncDeleted
+from schemas.task import TaskResponse
+from schemas.project import ProjectResponse
+from schemas.label import LabelResponse
+from api.v1.users import get_current_user
+from api.v1.projects import accessible_project_ids
+
+router = APIRouter(prefix="/sync", tags=["Sync"])
+
+
+async def committed_xid_bound(db: AsyncSession) -> int:
+    """
+    Transaction ID below which every writer has finished.
+    Changes are stamped with the ID of the transaction that made them, and a
+    transaction still running has an ID at or above its snapshot's xmin, so
+    every change stamped below the bound is settled and visible. Readers wait
+    for nobody: a long transaction only holds the bound back.
+    """
+    return (await db.execute(text("SELECT pg_snapshot_xmin(pg_current_snapshot())::text::bigint"))).scalar_one()
+
+
+def parse_cursor(since: str) -> tuple[int, int]:
+    """A `since` cursor as (transaction ID, change number); "0" starts from scratch."""
+    try:
+        position = tuple(int(part) for part in since.split("."))
+    except ValueError:
+        position = ()
+    if position == (0,):
+        return 0, 0
+    if len(position) != 2 or min(position) < 0:
+        raise HTTPException(status_code=400, detail="Invalid sync cursor")
+    return position
+
+
+def format_cursor(position: tuple[int, int]) -> str:
+    return f"{position[0]}.{position[1]}"
+
+
+def sync_position(row) -> tuple[int, int]:
+    return row.change_xid, row.change_seq
+
+
+@router.get("", response_model=SyncResponse)
+async def sync_changes(
+    since: str = Query("0"),
+    limit: int = Query(500, ge=1, le=5000),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Tasks, projects, labels and memberships created, changed or deleted since
+    the `since` cursor. Start with since=0 for a full copy, then pass back the
+    returned (opaque) cursor. If has_more is true, call again with the new cursor.
+    Changes are ordered by (transaction ID, change number) and only returned
+    once their transaction and every older one have finished, so a slow
+    writer's changes are never skipped.
+    Clients should apply `deleted` before the upserts: a row that still exists
+    always has a newer position than any earlier delete of the same key.
+    """
+    since_position = parse_cursor(since)
+    bound = await committed_xid_bound(db)
+    project_ids = await accessible_project_ids(current_user, db)
+
+    def changed(table):
+        return and_(
+            tuple_(table.change_xid, table.change_seq) > tuple_(*since_position),
+            table.change_xid < bound
+        )
+
+    def in_order(table):
+        return table.change_xid, table.change_seq
+
+    task_query = select(Task).where(changed(Task))
+    project_query = (
+        select(Project)
+        .options(
+            selectinload(Project.team_lead),
+            selectinload(Project.client),
+            selectinload(Project.members)
+        )
+        .where(changed(Project))
+    )
+    membership_query = select(project_members).where(changed(project_members.c))
+    label_query = select(Label).where(changed(Label))
+    tombstone_query = select(SyncTombstone).where(changed(SyncTombstone))
+
+    if project_ids is not None:
+        task_query = task_query.where(Task.project_id.in_(project_ids))
+        project_query = project_query.where(Project.id.in_(project_ids))
+        membership_query = membership_query.where(project_members.c.project_id.in_(project_ids))
+        # Deleted projects and labels are reported by ID only; deleted tasks and
+        # memberships only for projects the user can see, plus their own lost
+        # memberships and team lead assignments
+        tombstone_query = tombstone_query.where(
+            or_(
+                SyncTombstone.entity_type.in_(["project", "label"]),
+                and_(SyncTombstone.entity_type != "lead", SyncTombstone.project_id.in_(project_ids)),
+                and_(SyncTombstone.entity_type.in_(["membership", "lead"]), SyncTombstone.user_id == current_user.id),
+            )
+        )
+    else:
+        tombstone_query = tombstone_query.where(SyncTombstone.entity_type != "lead")
+
+    tasks = (await db.execute(task_query.order_by(*in_order(Task)).limit(limit))).scalars().all()
+    projects = (await db.execute(project_query.order_by(*in_order(Project)).limit(limit))).scalars().all()
+    memberships = (await db.execute(membership_query.order_by(*in_order(project_members.c)).limit(limit))).all()
+    labels = (await db.execute(label_query.order_by(*in_order(Label)).limit(limit))).scalars().all()
+    tombstones = (await db.execute(tombstone_query.order_by(*in_order(SyncTombstone)).limit(limit))).scalars().all()
+
+    # If any stream was truncated, stop every stream at the lowest truncation
+    # point so the cursor never skips changes. Otherwise resume at the bound
+    # (never moving backwards), where the next unfinished transaction starts.
+    cursor, has_more = max(since_position, (bound, 0)), False
+    for rows in [tasks, projects, memberships, labels, tombstones]:
+        if len(rows) == limit:
+            cursor, has_more = min(cursor, sync_position(rows[-1])), True
+    if has_more:
+        tasks = [r for r in tasks if sync_position(r) <= cursor]
+        projects = [r for r in projects if sync_position(r) <= cursor]
+        memberships = [r for r in memberships if sync_position(r) <= cursor]
+        labels = [r for r in labels if sync_position(r) <= cursor]
+        tombstones = [r for r in tombstones if sync_position(r) <= cursor]
+
+    # Projects that may have just become visible (new membership or team lead
+    # assignment) are sent with all their tasks, which the client has never seen
+    if project_ids is not None and since_position > (0, 0):
+        newly_visible = {m.project_id for m in memberships if m.user_id == current_user.id}
+        newly_visible |= {p.id for p in projects if p.team_lead_id == current_user.id}
+        if newly_visible:
+            known_task_ids = {t.id for t in tasks}
+            snapshot = await db.execute(select(Task).where(Task.project_id.in_(newly_visible)))
+            tasks = list(tasks) + [t for t in snapshot.scalars().all() if t.id not in known_task_ids]
+            known_project_ids = {p.id for p in projects}
+            missing = newly_visible - known_project_ids
+            if missing:
+                extra = await db.execute(
+                    select(Project)
+                    .options(
+                        selectinload(Project.team_lead),
+                        selectinload(Project.client),
+                        selectinload(Project.members)
+                    )
+                    .where(Project.id.in_(missing))
+                )
+                projects = list(projects) + list(extra.scalars().all())
+
+    project_responses = []
+    for project in projects:
+        response = ProjectResponse.model_validate(project)
+        response.progress_percentage = project.progress_percentage
+        response.duration_days = project.duration_days
+        response.time_used = project.time_used
+        project_responses.append(response)
+
+    deleted = SyncDeleted()
+    for tombstone in tombstones:
+        if tombstone.entity_type == "task":
+            deleted.tasks.append(tombstone.entity_id)
+        elif tombstone.entity_type == "project":
+            deleted.projects.append(tombstone.entity_id)
+        elif tombstone.entity_type == "label":
+            deleted.labels.append(tombstone.entity_id)
+        elif tombstone.entity_type == "membership":
+            deleted.memberships.append(SyncMembershipKey(project_id=tombstone.project_id, user_id=tombstone.user_id))
+        if (
+            tombstone.entity_type in ("membership", "lead")
+            and tombstone.user_id == current_user.id
+            and project_ids is not None
+            and tombstone.project_id not in project_ids
+            and tombstone.project_id not in deleted.projects
+        ):
+            # The user lost access; the client drops the project and its tasks
+            deleted.projects.append(tombstone.project_id)
+
+    return SyncResponse(
+        cursor=format_cursor(cursor),
+        has_more=has_more,
+        tasks=[TaskResponse.model_validate(t) for t in tasks],
+        projects=project_responses,
+        labels=[LabelResponse.model_validate(l) for l in labels],
+        memberships=[SyncMembership.model_validate(m) for m in memberships],
+        deleted=deleted,
+    )
@@ -1,17 +1,51 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+import zlib
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, or_
+from sqlalchemy import select, update, delete, distinct, func, or_, text, true, tuple_
+from sqlalchemy.dialects.postgresql import insert
 from typing import List, Optional
-from database import get_db
-from models.task import Task
-from models.project import Project, project_members
+from database import get_db, AsyncSessionLocal
+from models.task import Task, TaskStatus
+from models.task_dependency import TaskDependency
+from models.label import Label, task_labels
+from models.project import Project, TEMPLATE_PROJECT_IDS
 from models.user import User, UserRole
-from schemas.task import TaskCreate, TaskUpdate, TaskResponse
+from schemas.task import TaskCreate, TaskUpdate, TaskResponse, TaskMove, TaskRollup, TaskLabelsChange, TaskFacets, FacetCount
+from schemas.label import LabelResponse
+from schemas.dependency import TaskDependencyCreate, TaskDependencies
+from schemas.activity import ActivityPage
 from api.v1.users import get_current_user
+from api.v1.projects import accessible_project_ids
+from core.events import publish_event
+from core.event_bus import invalidate_cache
+from core.activity import activity_writer, fetch_activity_page
+from models.activity import TaskActivity
+from core.ranking import rank_between, evenly_spaced_ranks, MAX_RANK_LENGTH
+from core.critical_path import creates_cycle, lock_project_dependencies
+from core.loaders import UserLoader, get_user_loader
+from core.writes import save
+from core.serialization import FastJSONResponse
+from core.fieldsets import parse_fields, select_columns
+from core.task_tree import TaskTreeError, MAX_TASK_DEPTH, descendants_of, move_subtree, path_depth, subtree_status_counts
 from sqlalchemy.orm import selectinload
 
 router = APIRouter(prefix="/tasks", tags=["Tasks"])
 
+# Changes to these fields affect /reports/workload
+WORKLOAD_FIELDS = {"assignee_id", "status", "due_date"}
+# Board position changes are pushed to subscribers but not kept in the activity log
+UNLOGGED_FIELDS = {"rank"}
+# Changes to these fields (or to the set of tasks) affect /projects/{id}/critical-path
+CRITICAL_PATH_FIELDS = {"title", "estimate_days"}
+# Columns behind TaskResponse (labels are attached separately), for Core list reads
+TASK_LIST_COLUMNS = (
+    Task.id, Task.project_id, Task.title, Task.description, Task.status, Task.priority,
+    Task.due_date, Task.estimate_days, Task.assignee_id, Task.parent_id, Task.rank,
+    Task.comment_count, Task.created_at, Task.updated_at,
+)
+# Names accepted by GET /tasks?fields=
+TASK_LIST_FIELDS = [column.key for column in TASK_LIST_COLUMNS] + ["labels"]
+
 
 def has_project_access(project: Project, current_user: User) -> bool:
     """Check if the user can manage/view tasks for this project."""
@@ -24,23 +58,144 @@ def has_project_access(project: Project, current_user: User) -> bool:
     return False
 
 
-async def validate_assignee(assignee_id: int | None, project: Project, db: AsyncSession):
+async def validate_assignee(assignee_id: int | None, project: Project, users: UserLoader):
     """Ensure assignee exists and is part of the project (or is a lead/manager)."""
     if assignee_id is None:
         return
-    result = await db.execute(select(User).where(User.id == assignee_id))
-    assignee = result.scalar_one_or_none()
+    # Project members are usually in the session already, so this rarely queries
+    assignee = await users.load(assignee_id)
     if not assignee:
         raise HTTPException(status_code=404, detail="Assignee not found")
     member_ids = {m.id for m in getattr(project, "members", [])}
     if assignee.id != project.team_lead_id and assignee.id not in member_ids and assignee.role not in [UserRole.ADMIN, UserRole.PROJECT_MANAGER]:
         raise HTTPException(status_code=400, detail="Assignee must be a project member or team lead")
 
+async def validate_parent(parent_id: int | None, project_id: int, db: AsyncSession):
+    if parent_id is None:
+        return
+    parent = (await db.execute(select(Task.project_id, Task.path).where(Task.id == parent_id))).one_or_none()
+    if not parent or parent.project_id != project_id:
+        raise HTTPException(status_code=400, detail="Parent task must be in the same project")
+    if path_depth(parent.path) >= MAX_TASK_DEPTH:
+        raise HTTPException(status_code=400, detail=f"Subtasks can be nested at most {MAX_TASK_DEPTH} levels deep")
+
+async def task_filters(
+    current_user: User,
+    db: AsyncSession,
+    project_id: Optional[int],
+    label_ids: Optional[List[int]],
+    label_match: str,
+) -> list:
+    """WHERE conditions shared by the task list and its facet counts."""
+    conditions = []
+    allowed = await accessible_project_ids(current_user, db)
+    if allowed is not None:
+        conditions.append(Task.project_id.in_(allowed))
+    if project_id:
+        conditions.append(Task.project_id == project_id)
+    else:
+        # A template's tasks are only listed on its own board
+        conditions.append(Task.project_id.notin_(TEMPLATE_PROJECT_IDS))
+    if label_ids:
+        labelled = select(task_labels.c.task_id).where(task_labels.c.label_id.in_(set(label_ids)))
+        if label_match == "all":
+            labelled = labelled.group_by(task_labels.c.task_id).having(func.count() == len(set(label_ids)))
+        conditions.append(Task.id.in_(labelled))
+    return conditions
+
+async def load_task_labels(db: AsyncSession, tasks: list[dict], conditions: list) -> None:
+    """Set each task row's `labels` (LabelResponse-shaped) from one query over the same filters."""
+    by_id = {}
+    for task in tasks:
+        task["labels"] = []
+        by_id[task["id"]] = task
+    if not by_id:
+        return
+    result = await db.execute(
+        select(task_labels.c.task_id, Label.id, Label.name, Label.color)
+        .join(Label, Label.id == task_labels.c.label_id)
+        .join(Task, Task.id == task_labels.c.task_id)
+        .where(*conditions)
+    )
+    for task_id, label_id, name, color in result.all():
+        by_id[task_id]["labels"].append({"name": name, "color": color, "id": label_id})
+
+async def lock_board_column(db: AsyncSession, project_id: int, task_status: TaskStatus) -> None:
+    """
+    Serialize rank assignment within a board column until the transaction
+    ends, so concurrent creates and moves never compute the same rank.
+    """
+    key = zlib.crc32(f"board_column:{project_id}:{TaskStatus(task_status).value}".encode())
+    await db.execute(select(func.pg_advisory_xact_lock(key)))
+
+
+async def column_end_rank(db: AsyncSession, project_id: int, task_status: TaskStatus, exclude_id: int | None = None) -> str:
+    """Rank that places a card at the bottom of its board column; hold lock_board_column first."""
+    query = select(Task.rank).where(Task.project_id == project_id, Task.status == task_status)
+    if exclude_id is not None:
+        query = query.where(Task.id != exclude_id)
+    last_rank = (await db.execute(query.order_by(Task.rank.desc()).limit(1))).scalar()
+    return rank_between(last_rank, None)
+
+
+async def adjacent_rank(db: AsyncSession, task: Task, task_status: TaskStatus, rank: str, below: bool) -> str | None:
+    """Rank of the card directly below (or above) `rank` in a column, ignoring `task` itself."""
+    query = select(Task.rank).where(
+        Task.project_id == task.project_id,
+        Task.status == task_status,
+        Task.id != task.id,
+    )
+    if below:
+        query = query.where(Task.rank > rank).order_by(Task.rank)
+    else:
+        query = query.where(Task.rank < rank).order_by(Task.rank.desc())
+    return (await db.execute(query.limit(1))).scalar()
+
+
+async def rebalance_column(project_id: int, task_status: TaskStatus) -> None:
+    """
+    Respace a column's ranks evenly once they have grown long. Runs in the
+    background; rows are locked so concurrent moves wait rather than interleave.
+    """
+    async with AsyncSessionLocal() as db:
+        await lock_board_column(db, project_id, task_status)
+        result = await db.execute(
+            select(Task.id)
+            .where(Task.project_id == project_id, Task.status == task_status)
+            .order_by(Task.rank, Task.id)
+            .with_for_update()
+        )
+        task_ids = result.scalars().all()
+        if not task_ids:
+            return
+        await db.execute(
+            update(Task),
+            [{"id": task_id, "rank": rank} for task_id, rank in zip(task_ids, evenly_spaced_ranks(len(task_ids)))],
+        )
+        await db.commit()
+    # Every card in the column changed rank; have boards reload
+    publish_event("resync", project_id)
+
+
+def announce_task_changes(task: Task, previous: dict, changes: dict, current_user: User) -> None:
+    """Push, log and invalidate after a task update has been committed."""
+    if not changes:
+        return
+    publish_event("task.updated", task.project_id, task_id=task.id, changes=changes, updated_at=task.updated_at)
+    logged = {key: (previous[key], value) for key, value in changes.items() if key not in UNLOGGED_FIELDS}
+    if logged:
+        activity_writer.record_changes(task, current_user.id, logged)
+    if WORKLOAD_FIELDS & changes.keys():
+        invalidate_cache("workload")
+    if CRITICAL_PATH_FIELDS & changes.keys():
+        invalidate_cache("critical_path", task.project_id)
+
 @router.post("/", response_model=TaskResponse, status_code=status.HTTP_201_CREATED)
 async def create_task(
     task_data: TaskCreate,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db),
+    users: UserLoader = Depends(get_user_loader)
 ):
     # Verify project exists and user has access
     result = await db.execute(
@@ -54,41 +209,142 @@ async def create_task(
     if not has_project_access(project, current_user):
         raise HTTPException(status_code=403, detail="Not authorized to create tasks for this project")
 
-    await validate_assignee(task_data.assignee_id, project, db)
+    await validate_assignee(task_data.assignee_id, project, users)
+    await validate_parent(task_data.parent_id, project.id, db)
 
-    new_task = Task(**task_data.model_dump())
-    db.add(new_task)
-    await db.commit()
-    await db.refresh(new_task)
-    return new_task
+    # No labels yet; set so serializing the new task needs no lazy load
+    new_task = Task(**task_data.model_dump(), labels=[])
+    await lock_board_column(db, new_task.project_id, new_task.status)
+    new_task.rank = await column_end_rank(db, new_task.project_id, new_task.status)
+    await save(db, new_task)
+
+    response = TaskResponse.model_validate(new_task)
+    publish_event("task.created", new_task.project_id, task=response)
+    activity_writer.record_created(new_task, current_user.id)
+    invalidate_cache("workload")
+    invalidate_cache("critical_path", new_task.project_id)
+    return response
 
 @router.get("/", response_model=List[TaskResponse])
 async def list_tasks(
     project_id: Optional[int] = None,
+    label_ids: Optional[List[int]] = Query(None),
+    label_match: str = Query("any", pattern="^(any|all)$"),
+    fields: Optional[str] = Query(None, description="Comma-separated task fields to return, e.g. title,status,assignee_id"),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
-    if current_user.role in [UserRole.ADMIN, UserRole.PROJECT_MANAGER]:
-        query = select(Task)
-    else:
-        query = (
-            select(Task)
-            .join(Project, Task.project_id == Project.id)
-            .outerjoin(project_members, project_members.c.project_id == Project.id)
-            .where(
-                or_(
-                    Project.team_lead_id == current_user.id,
-                    project_members.c.user_id == current_user.id,
-                )
-            )
-            .distinct()
-        )
-    if project_id:
-        query = query.where(Task.project_id == project_id)
+    """
+    Tasks visible to the user, in board order. `label_ids` (repeatable)
+    keeps tasks with any (default) or all of the given labels. `fields`
+    limits both the columns read and the keys returned (id is always
+    included). Read as plain rows and encoded directly (see
+    core/serialization.py).
+    """
+    wanted = parse_fields(fields, TASK_LIST_FIELDS)
+    conditions = await task_filters(current_user, db, project_id, label_ids, label_match)
+    query = select(*select_columns(TASK_LIST_COLUMNS, wanted)).where(*conditions)
+    # Board order: served by ix_tasks_board_order
+    query = query.order_by(Task.project_id, Task.status, Task.rank, Task.id)
     
     result = await db.execute(query)
-    return result.scalars().all()
+    tasks = [dict(row) for row in result.mappings()]
+    if wanted is None or "labels" in wanted:
+        await load_task_labels(db, tasks, conditions)
+    return FastJSONResponse(tasks)
 
+@router.get("/facets", response_model=TaskFacets)
+async def get_task_facets(
+    project_id: Optional[int] = None,
+    label_ids: Optional[List[int]] = Query(None),
+    label_match: str = Query("any", pattern="^(any|all)$"),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Task counts per label, status and priority for the filter sidebar, over
+    the same filters as GET /tasks. Computed in one GROUPING SETS query.
+    """
+    conditions = await task_filters(current_user, db, project_id, label_ids, label_match)
+    label_id, grouping = task_labels.c.label_id, func.grouping(task_labels.c.label_id, Task.status, Task.priority)
+    result = await db.execute(
+        select(grouping, label_id, Task.status, Task.priority, func.count(distinct(Task.id)))
+        .select_from(Task)
+        .outerjoin(task_labels, task_labels.c.task_id == Task.id)
+        .where(*conditions)
+        .group_by(func.grouping_sets(tuple_(label_id), tuple_(Task.status), tuple_(Task.priority), text("()")))
+    )
+    facets = TaskFacets(total=0)
+    # grouping() sets a bit for each column not grouped on: label_id=4, status=2, priority=1
+    for group, label, task_status, priority, count in result.all():
+        if group == 0b011:
+            facets.labels.append(FacetCount(value=label, count=count))
+        elif group == 0b101:
+            facets.status.append(FacetCount(value=task_status.value, count=count))
+        elif group == 0b110:
+            facets.priority.append(FacetCount(value=priority.value, count=count))
+        else:
+            facets.total = count
+    return facets
+
+async def change_task_labels(change: TaskLabelsChange, attach: bool, current_user: User, db: AsyncSession) -> list:
+    task_ids, label_ids = set(change.task_ids), set(change.label_ids)
+    result = await db.execute(select(Task.id, Task.project_id).where(Task.id.in_(task_ids)))
+    project_ids = dict(result.all())
+    if len(project_ids) != len(task_ids):
+        raise HTTPException(status_code=404, detail="Task not found")
+    allowed = await accessible_project_ids(current_user, db)
+    if allowed is not None and not set(project_ids.values()) <= allowed:
+        raise HTTPException(status_code=403, detail="Not authorized to update these tasks")
+    found = (await db.execute(select(func.count()).select_from(Label).where(Label.id.in_(label_ids)))).scalar()
+    if found != len(label_ids):
+        raise HTTPException(status_code=404, detail="Label not found")
+
+    if attach:
+        await db.execute(
+            insert(task_labels)
+            .from_select(
+                ["task_id", "label_id"],
+                select(Task.id, Label.id).join(Label, true()).where(Task.id.in_(task_ids), Label.id.in_(label_ids)),
+            )
+            .on_conflict_do_nothing()
+        )
+    else:
+        await db.execute(
+            delete(task_labels)
+            .where(task_labels.c.task_id.in_(task_ids), task_labels.c.label_id.in_(label_ids))
+        )
+    # Touch the tasks so incremental sync picks up the new labels
+    await db.execute(update(Task).where(Task.id.in_(task_ids)).values(updated_at=func.now()))
+    await db.commit()
+
+    result = await db.execute(select(Task).where(Task.id.in_(task_ids)).order_by(Task.id).execution_options(populate_existing=True))
+    tasks = result.scalars().all()
+    for task in tasks:
+        publish_event(
+            "task.updated", task.project_id, task_id=task.id,
+            changes={"labels": [LabelResponse.model_validate(l) for l in task.labels]}, updated_at=task.updated_at,
+        )
+    return tasks
+
+@router.post("/labels/attach", response_model=List[TaskResponse])
+async def attach_labels(
+    change: TaskLabelsChange,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """Add every given label to every given task; labels already present are left alone."""
+    return await change_task_labels(change, True, current_user, db)
+
+@router.post("/labels/detach", response_model=List[TaskResponse])
+async def detach_labels(
+    change: TaskLabelsChange,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """Remove every given label from every given task."""
+    return await change_task_labels(change, False, current_user, db)
+
 @router.get("/{task_id}", response_model=TaskResponse)
 async def get_task(
     task_id: int,
@@ -114,7 +370,8 @@ async def update_task(
     task_id: int,
     task_update: TaskUpdate,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db),
+    users: UserLoader = Depends(get_user_loader)
 ):
     result = await db.execute(
         select(Task)
@@ -131,14 +388,267 @@ async def update_task(
         
     update_data = task_update.model_dump(exclude_unset=True)
     if "assignee_id" in update_data:
-        await validate_assignee(update_data["assignee_id"], task.project, db)
+        await validate_assignee(update_data["assignee_id"], task.project, users)
+    if "status" in update_data and update_data["status"] != task.status:
+        # A status change without an explicit move puts the card at the bottom of its new column
+        await lock_board_column(db, task.project_id, update_data["status"])
+        update_data["rank"] = await column_end_rank(db, task.project_id, update_data["status"])
+    if "parent_id" in update_data and update_data["parent_id"] != task.parent_id:
+        try:
+            await move_subtree(db, task, update_data["parent_id"])
+        except TaskTreeError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+    # Only fields that actually change are pushed to subscribers and logged
+    previous = {key: getattr(task, key) for key in update_data}
+    changes = {key: value for key, value in update_data.items() if previous[key] != value}
     for key, value in update_data.items():
         setattr(task, key, value)
         
-    await db.commit()
-    await db.refresh(task)
+    await save(db)
+
+    announce_task_changes(task, previous, changes, current_user)
     return task
 
+@router.post("/{task_id}/move", response_model=TaskResponse)
+async def move_task(
+    task_id: int,
+    move: TaskMove,
+    background_tasks: BackgroundTasks,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Move a card to a position on the board. Give the card that should end up
+    above it (before_id), below it (after_id), or both; with neither the card
+    goes to the bottom of the column. Only the moved task's row is written.
+    """
+    result = await db.execute(
+        select(Task)
+        .options(
+            selectinload(Task.project).selectinload(Project.members)
+        )
+        .where(Task.id == task_id)
+    )
+    task = result.scalar_one_or_none()
+    if not task:
+        raise HTTPException(status_code=404, detail="Task not found")
+    if not task.project or not has_project_access(task.project, current_user):
+        raise HTTPException(status_code=403, detail="Not authorized to update this task")
+
+    target_status = move.status or task.status
+    # Neighbouring ranks are read under the lock so they can't change before the write
+    await lock_board_column(db, task.project_id, target_status)
+    neighbour_ids = {i for i in (move.before_id, move.after_id) if i is not None}
+    ranks = {}
+    if neighbour_ids:
+        result = await db.execute(
+            select(Task.id, Task.rank)
+            .where(
+                Task.id.in_(neighbour_ids),
+                Task.id != task.id,
+                Task.project_id == task.project_id,
+                Task.status == target_status,
+            )
+        )
+        ranks = dict(result.all())
+        if len(ranks) != len(neighbour_ids):
+            raise HTTPException(status_code=400, detail="Neighbouring tasks must be other cards in the target column")
+
+    before_rank = ranks.get(move.before_id)
+    after_rank = ranks.get(move.after_id)
+    if before_rank is not None and after_rank is None:
+        after_rank = await adjacent_rank(db, task, target_status, before_rank, below=True)
+    elif after_rank is not None and before_rank is None:
+        before_rank = await adjacent_rank(db, task, target_status, after_rank, below=False)
+
+    if before_rank is None and after_rank is None:
+        new_rank = await column_end_rank(db, task.project_id, target_status, exclude_id=task.id)
+    else:
+        try:
+            new_rank = rank_between(before_rank, after_rank)
+        except ValueError:
+            # Tied or crossed ranks (e.g. concurrent moves); respace the column now, as
+            # background tasks don't run when the endpoint raises, and let the client retry.
+            # End this transaction first: it holds the column lock rebalance_column takes.
+            project_id = task.project_id
+            await db.rollback()
+            await rebalance_column(project_id, target_status)
+            raise HTTPException(status_code=409, detail="Board order changed; reload the column and retry")
+
+    update_data = {"status": target_status, "rank": new_rank}
+    previous = {key: getattr(task, key) for key in update_data}
+    changes = {key: value for key, value in update_data.items() if previous[key] != value}
+    for key, value in update_data.items():
+        setattr(task, key, value)
+
+    await save(db)
+
+    announce_task_changes(task, previous, changes, current_user)
+    if len(new_rank) > MAX_RANK_LENGTH:
+        background_tasks.add_task(rebalance_column, task.project_id, target_status)
+    return task
+
+@router.get("/{task_id}/subtasks", response_model=List[TaskResponse])
+async def list_subtasks(
+    task_id: int,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """All descendants of a task at any depth, parents before their children."""
+    result = await db.execute(
+        select(Task)
+        .options(
+            selectinload(Task.project).selectinload(Project.members)
+        )
+        .where(Task.id == task_id)
+    )
+    task = result.scalar_one_or_none()
+    if not task:
+        raise HTTPException(status_code=404, detail="Task not found")
+    if not task.project or not has_project_access(task.project, current_user):
+        raise HTTPException(status_code=403, detail="Not authorized to view this task")
+
+    result = await db.execute(select(Task).where(descendants_of(task.path)).order_by(Task.path))
+    return result.scalars().all()
+
+@router.get("/{task_id}/rollup", response_model=TaskRollup)
+async def get_task_rollup(
+    task_id: int,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """Progress of a task's whole subtree (e.g. an epic), counted in one query."""
+    result = await db.execute(
+        select(Task)
+        .options(
+            selectinload(Task.project).selectinload(Project.members)
+        )
+        .where(Task.id == task_id)
+    )
+    task = result.scalar_one_or_none()
+    if not task:
+        raise HTTPException(status_code=404, detail="Task not found")
+    if not task.project or not has_project_access(task.project, current_user):
+        raise HTTPException(status_code=403, detail="Not authorized to view this task")
+
+    counts = await subtree_status_counts(db, task.path)
+    total = sum(counts.values())
+    done = counts.get(TaskStatus.DONE, 0)
+    return TaskRollup(
+        task_id=task.id,
+        total=total,
+        todo=counts.get(TaskStatus.TODO, 0),
+        in_progress=counts.get(TaskStatus.IN_PROGRESS, 0),
+        review=counts.get(TaskStatus.REVIEW, 0),
+        done=done,
+        progress_percentage=round(done / total * 100, 2) if total else None,
+    )
+
+async def task_dependencies(db: AsyncSession, task_id: int) -> TaskDependencies:
+    result = await db.execute(
+        select(TaskDependency.blocker_id, TaskDependency.blocked_id)
+        .where(or_(TaskDependency.blocker_id == task_id, TaskDependency.blocked_id == task_id))
+    )
+    blocked_by, blocks = [], []
+    for blocker_id, blocked_id in result.all():
+        if blocked_id == task_id:
+            blocked_by.append(blocker_id)
+        else:
+            blocks.append(blocked_id)
+    return TaskDependencies(task_id=task_id, blocked_by=sorted(blocked_by), blocks=sorted(blocks))
+
+@router.get("/{task_id}/dependencies", response_model=TaskDependencies)
+async def get_task_dependencies(
+    task_id: int,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """Tasks blocking this one and tasks it blocks."""
+    result = await db.execute(
+        select(Task)
+        .options(
+            selectinload(Task.project).selectinload(Project.members)
+        )
+        .where(Task.id == task_id)
+    )
+    task = result.scalar_one_or_none()
+    if not task:
+        raise HTTPException(status_code=404, detail="Task not found")
+    if not task.project or not has_project_access(task.project, current_user):
+        raise HTTPException(status_code=403, detail="Not authorized to view this task")
+    return await task_dependencies(db, task.id)
+
+@router.post("/{task_id}/dependencies", response_model=TaskDependencies, status_code=status.HTTP_201_CREATED)
+async def add_task_dependency(
+    task_id: int,
+    dependency: TaskDependencyCreate,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """Mark this task as blocked by another task in the same project."""
+    result = await db.execute(
+        select(Task)
+        .options(
+            selectinload(Task.project).selectinload(Project.members)
+        )
+        .where(Task.id == task_id)
+    )
+    task = result.scalar_one_or_none()
+    if not task:
+        raise HTTPException(status_code=404, detail="Task not found")
+    if not task.project or not has_project_access(task.project, current_user):
+        raise HTTPException(status_code=403, detail="Not authorized to update this task")
+
+    blocker_project_id = (await db.execute(
+        select(Task.project_id).where(Task.id == dependency.blocker_id)
+    )).scalar()
+    if blocker_project_id != task.project_id:
+        raise HTTPException(status_code=400, detail="Blocking task must be in the same project")
+
+    # Two concurrent inserts could each pass the cycle check and close a cycle together
+    await lock_project_dependencies(db, task.project_id)
+    exists = (await db.execute(
+        select(TaskDependency.blocker_id)
+        .where(TaskDependency.blocker_id == dependency.blocker_id, TaskDependency.blocked_id == task.id)
+    )).first()
+    if not exists:
+        if await creates_cycle(db, dependency.blocker_id, task.id):
+            raise HTTPException(status_code=409, detail="Dependency would create a cycle")
+        db.add(TaskDependency(blocker_id=dependency.blocker_id, blocked_id=task.id, project_id=task.project_id))
+        await db.commit()
+        invalidate_cache("critical_path", task.project_id)
+    return await task_dependencies(db, task.id)
+
+@router.delete("/{task_id}/dependencies/{blocker_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def remove_task_dependency(
+    task_id: int,
+    blocker_id: int,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    result = await db.execute(
+        select(Task)
+        .options(
+            selectinload(Task.project).selectinload(Project.members)
+        )
+        .where(Task.id == task_id)
+    )
+    task = result.scalar_one_or_none()
+    if not task:
+        raise HTTPException(status_code=404, detail="Task not found")
+    if not task.project or not has_project_access(task.project, current_user):
+        raise HTTPException(status_code=403, detail="Not authorized to update this task")
+
+    result = await db.execute(
+        delete(TaskDependency)
+        .where(TaskDependency.blocker_id == blocker_id, TaskDependency.blocked_id == task.id)
+    )
+    if result.rowcount == 0:
+        raise HTTPException(status_code=404, detail="Dependency not found")
+    await db.commit()
+    invalidate_cache("critical_path", task.project_id)
+    return None
+
 @router.delete("/{task_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_task(
     task_id: int,
@@ -158,6 +668,42 @@ async def delete_task(
     if not task.project or not has_project_access(task.project, current_user):
         raise HTTPException(status_code=403, detail="Not authorized to delete this task")
         
+    project_id = task.project_id
+    # Subtasks are removed with it by the database
+    has_subtasks = (await db.execute(select(Task.id).where(Task.parent_id == task.id).limit(1))).first() is not None
     await db.delete(task)
     await db.commit()
+
+    publish_event("task.deleted", project_id, task_id=task_id)
+    activity_writer.record_deleted(task_id, project_id, current_user.id)
+    if has_subtasks:
+        publish_event("resync", project_id)
+    invalidate_cache("workload")
+    invalidate_cache("critical_path", project_id)
     return None
+
+
+@router.get("/{task_id}/activity", response_model=ActivityPage)
+async def get_task_activity(
+    task_id: int,
+    cursor: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=200),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """Field-level change history of a task, newest first."""
+    result = await db.execute(
+        select(Task)
+        .options(
+            selectinload(Task.project).selectinload(Project.members)
+        )
+        .where(Task.id == task_id)
+    )
+    task = result.scalar_one_or_none()
+    if not task:
+        raise HTTPException(status_code=404, detail="Task not found")
+    if not task.project or not has_project_access(task.project, current_user):
+        raise HTTPException(status_code=403, detail="Not authorized to view this task")
+
+    items, next_cursor = await fetch_activity_page(db, TaskActivity.task_id == task_id, cursor, limit)
+    return ActivityPage(items=items, next_cursor=next_cursor)
@@ -0,0 +1,118 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, or_
+from sqlalchemy.orm import selectinload
+from typing import List, Optional
+from datetime import date
+from database import get_db
+from models.time_entry import TimeEntry
+from models.task import Task
+from models.project import Project
+from models.user import User, UserRole
+from schemas.time_entry import TimeEntryCreate, TimeEntryUpdate, TimeEntryResponse
+from api.v1.users import get_current_user
+from api.v1.projects import accessible_project_ids
+from api.v1.tasks import has_project_access
+from core.writes import save
+
+router = APIRouter(prefix="/time-entries", tags=["Time Entries"])
+
+
+def can_edit_entry(entry: TimeEntry, current_user: User) -> bool:
+    """Users edit their own entries; admins/PMs can edit any."""
+    return entry.user_id == current_user.id or current_user.role in [UserRole.ADMIN, UserRole.PROJECT_MANAGER]
+
+
+async def get_editable_entry(entry_id: int, current_user: User, db: AsyncSession) -> TimeEntry:
+    result = await db.execute(select(TimeEntry).where(TimeEntry.id == entry_id))
+    entry = result.scalar_one_or_none()
+    if not entry:
+        raise HTTPException(status_code=404, detail="Time entry not found")
+    if not can_edit_entry(entry, current_user):
+        raise HTTPException(status_code=403, detail="Not authorized to modify this time entry")
+    return entry
+
+
+@router.post("/", response_model=TimeEntryResponse, status_code=status.HTTP_201_CREATED)
+async def create_time_entry(
+    entry_data: TimeEntryCreate,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """Log time against a task. Task, project and user rollups are updated in the same transaction."""
+    result = await db.execute(
+        select(Task)
+        .options(selectinload(Task.project).selectinload(Project.members))
+        .where(Task.id == entry_data.task_id)
+    )
+    task = result.scalar_one_or_none()
+    if not task:
+        raise HTTPException(status_code=404, detail="Task not found")
+    if not task.project or not has_project_access(task.project, current_user):
+        raise HTTPException(status_code=403, detail="Not authorized to log time on this task")
+
+    entry = TimeEntry(**entry_data.model_dump(), project_id=task.project_id, user_id=current_user.id)
+    await save(db, entry)
+    return entry
+
+
+@router.get("/", response_model=List[TimeEntryResponse])
+async def list_time_entries(
+    task_id: Optional[int] = None,
+    project_id: Optional[int] = None,
+    user_id: Optional[int] = None,
+    start: Optional[date] = None,
+    end: Optional[date] = None,
+    skip: int = 0,
+    limit: int = 100,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """List time entries, newest first. Non-managers see their own entries and those in their projects."""
+    query = select(TimeEntry)
+    allowed = await accessible_project_ids(current_user, db)
+    if allowed is not None:
+        query = query.where(or_(TimeEntry.user_id == current_user.id, TimeEntry.project_id.in_(allowed)))
+    if task_id:
+        query = query.where(TimeEntry.task_id == task_id)
+    if project_id:
+        query = query.where(TimeEntry.project_id == project_id)
+    if user_id:
+        query = query.where(TimeEntry.user_id == user_id)
+    if start:
+        query = query.where(TimeEntry.entry_date >= start)
+    if end:
+        query = query.where(TimeEntry.entry_date <= end)
+
+    result = await db.execute(
+        query.order_by(TimeEntry.entry_date.desc(), TimeEntry.id.desc()).offset(skip).limit(limit)
+    )
+    return result.scalars().all()
+
+
+@router.patch("/{entry_id}", response_model=TimeEntryResponse)
+async def update_time_entry(
+    entry_id: int,
+    entry_update: TimeEntryUpdate,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """Update a time entry; the rollups move the old contribution out and the new one in."""
+    entry = await get_editable_entry(entry_id, current_user, db)
+    for key, value in entry_update.model_dump(exclude_unset=True).items():
+        setattr(entry, key, value)
+    await save(db)
+    return entry
+
+
+@router.delete("/{entry_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_time_entry(
+    entry_id: int,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """Delete a time entry."""
+    entry = await get_editable_entry(entry_id, current_user, db)
+    await db.delete(entry)
+    await db.commit()
+    return None
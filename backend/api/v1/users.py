@@ -1,23 +1,59 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, func, or_
 from typing import List
 from database import get_db
-from models.user import User, UserRole, Department
-from schemas.user import UserResponse, UserUpdate, UserRegister
+from models.user import User, UserRole, Department, USER_SEARCH_TEXT
+from schemas.user import UserResponse, UserUpdate, UserRegister, UserLookup, UserRoleType
 from core.security import decode_token, hash_password
+from core.events import publish_user_deactivated
+from core.cache import TTLCache, register_cache
+from core.event_bus import invalidate_cache
+from core.images import avatar_rendition_url
+from core.writes import save
+from core.serialization import FastJSONResponse
 
 router = APIRouter(prefix="/users", tags=["Users"])
 security = HTTPBearer()
 
+# (query, role, limit) -> lookup results. Typeaheads send the same short
+# prefixes over and over, so those stay hot; cleared whenever a user changes.
+lookup_cache = register_cache("user_lookup", TTLCache(maxsize=2048, ttl=300))
+
+# Columns behind UserResponse and UserBrief, for Core reads that skip the ORM
+USER_LIST_COLUMNS = (
+    User.id, User.email, User.first_name, User.last_name, User.role,
+    User.department, User.is_active, User.last_login, User.avatar_url,
+)
+USER_BRIEF_COLUMNS = (User.id, User.first_name, User.last_name, User.email, User.role, User.avatar_url)
+
+
+def escape_like(term: str) -> str:
+    """Escape LIKE wildcards so `term` matches literally; pass escape="\\\\" to like()."""
+    return term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def user_row(row) -> dict:
+    """A selected user row as a JSON-ready dict, with the thumbnail URL the schemas compute."""
+    user = dict(row)
+    user["avatar_thumbnail_url"] = avatar_rendition_url(user["avatar_url"])
+    return user
+
 
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: AsyncSession = Depends(get_db),
 ) -> User:
     """Resolve the current user from a Bearer JWT."""
-    token = credentials.credentials
+    return await get_user_from_token(credentials.credentials, db)
+
+
+async def get_user_from_token(token: str, db: AsyncSession) -> User:
+    """
+    Resolve a user from a raw JWT.
+    Used directly by push endpoints, where browsers can't send an Authorization header.
+    """
     payload = decode_token(token)
     if payload is None:
         raise HTTPException(
@@ -66,7 +102,7 @@ async def read_users(
     Retrieve users. Optionally filter by role.
     All authenticated users can view user lists (for dropdowns).
     """
-    query = select(User).where(User.is_active == True)
+    query = select(*USER_LIST_COLUMNS).where(User.is_active == True)
     
     # Filter by role if provided
     if role:
@@ -77,10 +113,55 @@ async def read_users(
             pass  # Invalid role, ignore filter
     
     result = await db.execute(query.offset(skip).limit(limit))
-    users = result.scalars().all()
-    return users
+    return FastJSONResponse([user_row(row) for row in result.mappings()])
 
 
+@router.get("/lookup", response_model=List[UserLookup])
+async def lookup_users(
+    q: str = Query(..., min_length=1, max_length=100),
+    role: UserRoleType | None = None,
+    limit: int = Query(10, ge=1, le=50),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Typeahead search over active users' names and email. Prefix matches come
+    first, then trigram similarity (which also tolerates typos).
+    """
+    term = " ".join(q.lower().split())
+    cache_key = (term, role, limit)
+    cached = lookup_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    escaped = escape_like(term)
+    is_prefix = or_(
+        func.lower(User.first_name).like(f"{escaped}%", escape="\\"),
+        func.lower(User.last_name).like(f"{escaped}%", escape="\\"),
+        func.lower(User.email).like(f"{escaped}%", escape="\\"),
+    )
+    query = (
+        select(User.id, User.first_name, User.last_name, User.avatar_url)
+        .where(
+            User.is_active == True,
+            # Both operators are served by ix_users_search_trgm
+            or_(USER_SEARCH_TEXT.like(f"%{escaped}%", escape="\\"), USER_SEARCH_TEXT.op("%")(term)),
+        )
+        .order_by(is_prefix.desc(), func.similarity(USER_SEARCH_TEXT, term).desc(), User.first_name, User.last_name, User.id)
+        .limit(limit)
+    )
+    if role:
+        query = query.where(User.role == UserRole(role))
+
+    result = await db.execute(query)
+    users = [
+        UserLookup(id=row.id, name=f"{row.first_name} {row.last_name}", avatar_url=avatar_rendition_url(row.avatar_url))
+        for row in result.all()
+    ]
+    lookup_cache.set(cache_key, users)
+    return users
+
+
 @router.get("/{user_id}", response_model=UserResponse)
 async def read_user(
     user_id: int, 
@@ -132,10 +213,9 @@ async def create_user(
         department=Department(user_data.department) if user_data.department else None,
     )
 
-    db.add(new_user)
-    await db.commit()
-    await db.refresh(new_user)
+    await save(db, new_user)
 
+    invalidate_cache("user_lookup")
     return new_user
 
 
@@ -162,11 +242,15 @@ async def update_user(
     if "department" in update_data and update_data["department"]:
         update_data["department"] = Department(update_data["department"])
         
+    deactivated = update_data.get("is_active") is False and user.is_active
     for key, value in update_data.items():
         setattr(user, key, value)
         
-    await db.commit()
-    await db.refresh(user)
+    await save(db)
+
+    if deactivated:
+        publish_user_deactivated(user.id)
+    invalidate_cache("user_lookup")
     return user
 
 
@@ -186,4 +270,7 @@ async def delete_user(
         
     user.is_active = False
     await db.commit()
+
+    publish_user_deactivated(user.id)
+    invalidate_cache("user_lookup")
     return None
@@ -0,0 +1,133 @@
+"""
+Benchmark the ORM and Core read paths of GET /tasks, /projects and /users.
+
+Runs each list query against the configured database both ways, from the
+query to the JSON bytes sent to the client, and reports CPU time and peak
+Python memory per row:
+
+  orm   - ORM entities -> Pydantic models -> response_model validation
+          (as the endpoints worked before the Core fast path)
+  core  - selected columns -> dicts -> core.serialization.dumps
+
+Usage: python benchmark_list_reads.py [--repeat N] [--limit ROWS]
+"""
+import argparse
+import asyncio
+import json
+import logging
+import time
+import tracemalloc
+from typing import List
+from pydantic import TypeAdapter
+from sqlalchemy import select
+from sqlalchemy.orm import selectinload
+from database import AsyncSessionLocal, engine
+from models.project import Project
+from models.task import Task
+from models.user import User
+from schemas.project import ProjectResponse, UserBrief
+from schemas.task import TaskResponse
+from schemas.user import UserResponse
+from api.v1.projects import PROJECT_LIST_COLUMNS, attach_project_details
+from api.v1.tasks import TASK_LIST_COLUMNS, load_task_labels
+from api.v1.users import USER_LIST_COLUMNS, user_row
+from core.serialization import dumps, orjson
+
+
+def response_model_bytes(adapter: TypeAdapter, content) -> bytes:
+    """What FastAPI does with a returned value: validate, dump, json.dumps."""
+    return json.dumps(adapter.dump_python(adapter.validate_python(content, from_attributes=True), mode="json")).encode()
+
+
+async def orm_tasks(db, limit):
+    tasks = (await db.execute(select(Task).order_by(Task.id).limit(limit))).scalars().all()
+    return len(tasks), response_model_bytes(TypeAdapter(List[TaskResponse]), tasks)
+
+
+async def core_tasks(db, limit):
+    # load_task_labels filters by the same conditions as the list; emulate the limit with an ID range
+    rows = [dict(r) for r in (await db.execute(select(*TASK_LIST_COLUMNS).order_by(Task.id).limit(limit))).mappings()]
+    await load_task_labels(db, rows, [Task.id <= rows[-1]["id"]] if rows else [])
+    return len(rows), dumps(rows)
+
+
+async def orm_projects(db, limit):
+    projects = (await db.execute(
+        select(Project)
+        .options(selectinload(Project.team_lead), selectinload(Project.client), selectinload(Project.members))
+        .order_by(Project.id).limit(limit)
+    )).scalars().all()
+    responses = []
+    for project in projects:
+        response = ProjectResponse.model_validate(project)
+        response.progress_percentage = project.progress_percentage
+        response.duration_days = project.duration_days
+        response.time_used = project.time_used
+        if project.team_lead:
+            response.team_lead = UserBrief.model_validate(project.team_lead)
+        if project.client:
+            response.client = UserBrief.model_validate(project.client)
+        response.members = [UserBrief.model_validate(m) for m in project.members]
+        responses.append(response)
+    return len(responses), response_model_bytes(TypeAdapter(List[ProjectResponse]), responses)
+
+
+async def core_projects(db, limit):
+    rows = [dict(r) for r in (await db.execute(select(*PROJECT_LIST_COLUMNS).order_by(Project.id).limit(limit))).mappings()]
+    await attach_project_details(db, rows)
+    return len(rows), dumps(rows)
+
+
+async def orm_users(db, limit):
+    users = (await db.execute(select(User).where(User.is_active == True).limit(limit))).scalars().all()
+    return len(users), response_model_bytes(TypeAdapter(List[UserResponse]), users)
+
+
+async def core_users(db, limit):
+    result = await db.execute(select(*USER_LIST_COLUMNS).where(User.is_active == True).limit(limit))
+    rows = [user_row(row) for row in result.mappings()]
+    return len(rows), dumps(rows)
+
+
+async def measure(read, limit, repeat):
+    """Average CPU seconds and peak traced bytes per run; each run uses a fresh session."""
+    cpu = peak = 0
+    for _ in range(repeat):
+        async with AsyncSessionLocal() as db:
+            tracemalloc.start()
+            started = time.process_time()
+            rows, body = await read(db, limit)
+            cpu += time.process_time() - started
+            peak += tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+    return rows, len(body), cpu / repeat, peak / repeat
+
+
+async def main(repeat: int, limit: int):
+    logging.getLogger("sqlalchemy.engine").setLevel(logging.WARNING)
+    engine.echo = False
+    print(f"encoder: {'orjson' if orjson else 'stdlib json'}, {repeat} runs, up to {limit} rows\n")
+    print(f"{'endpoint':<10}{'path':<6}{'rows':>7}{'bytes':>10}{'us/row':>10}{'KiB/row':>10}")
+    for name, orm_read, core_read in [
+        ("/tasks", orm_tasks, core_tasks),
+        ("/projects", orm_projects, core_projects),
+        ("/users", orm_users, core_users),
+    ]:
+        results = {}
+        for path, read in (("orm", orm_read), ("core", core_read)):
+            await measure(read, limit, 1)  # warm up connections and statement caches
+            rows, size, cpu, peak = results[path] = await measure(read, limit, repeat)
+            per_row = max(rows, 1)
+            print(f"{name:<10}{path:<6}{rows:>7}{size:>10}{cpu / per_row * 1e6:>10.1f}{peak / per_row / 1024:>10.2f}")
+        (_, _, orm_cpu, orm_peak), (_, _, core_cpu, core_peak) = results["orm"], results["core"]
+        if core_cpu and core_peak:
+            print(f"{'':<10}{'':<6}core: {orm_cpu / core_cpu:.1f}x less CPU, {orm_peak / core_peak:.1f}x less memory\n")
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--limit", type=int, default=1000)
+    args = parser.parse_args()
+    asyncio.run(main(args.repeat, args.limit))
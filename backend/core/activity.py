@@ -0,0 +1,254 @@
+import asyncio
+import enum
+import logging
+import os
+import re
+from datetime import date, datetime
+from sqlalchemy import insert, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from database import AsyncSessionLocal
+from models.activity import TaskActivity
+from core.pagination import fetch_newest_first
+
+logger = logging.getLogger(__name__)
+
+# Rows are bulk-inserted once this many are queued or after FLUSH_INTERVAL_SECONDS
+BATCH_SIZE = 500
+FLUSH_INTERVAL_SECONDS = 1.0
+# Beyond this backlog new entries are dropped (and counted) rather than growing memory
+MAX_QUEUE_SIZE = 50_000
+# A failing batch is retried with backoff, then put back on the queue; rows that
+# have failed MAX_ROW_FAILURES times are dropped so one bad row cannot wedge the log
+WRITE_ATTEMPTS = 3
+RETRY_BACKOFF_SECONDS = 0.5
+MAX_ROW_FAILURES = 5
+
+PARTITIONS_AHEAD = 2
+RETENTION_MONTHS = int(os.getenv("ACTIVITY_RETENTION_MONTHS", "24"))
+
+PARTITION_NAME = re.compile(r"^task_activity_y(\d{4})m(\d{2})$")
+
+
+def _add_months(month_start: date, months: int) -> date:
+    index = month_start.year * 12 + month_start.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def _to_text(value) -> str | None:
+    if value is None:
+        return None
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return str(value)
+
+
+class ActivityWriter:
+    """
+    Buffers task activity in memory and bulk-inserts it off the request path.
+    Handlers call record_*() after their commit; a background task drains the
+    queue in batches. Entries that could not be written are counted in
+    `dropped` (see stats()).
+    """
+
+    def __init__(self):
+        self._queue: asyncio.Queue[dict] | None = None
+        self._task: asyncio.Task | None = None
+        self._partition_month: date | None = None
+        self.dropped = 0
+
+    def stats(self) -> dict:
+        return {"queued": self._queue.qsize() if self._queue is not None else 0, "dropped": self.dropped}
+
+    def _drop(self, row: dict, reason: str) -> None:
+        self.dropped += 1
+        logger.warning("Dropping activity %s entry for task %s (%s); %d dropped so far",
+                       row["action"], row["task_id"], reason, self.dropped)
+
+    def _enqueue(self, row: dict) -> None:
+        if self._queue is None:
+            # Writer not started (e.g. scripts); nothing to do
+            return
+        try:
+            self._queue.put_nowait(row)
+        except asyncio.QueueFull:
+            self._drop(row, "queue full")
+
+    def record_created(self, task, user_id: int | None) -> None:
+        self._enqueue({
+            "task_id": task.id, "project_id": task.project_id, "user_id": user_id,
+            "action": "created", "field": "status", "old_value": None, "new_value": _to_text(task.status),
+            "created_at": task.created_at,
+        })
+
+    def record_changes(self, task, user_id: int | None, changes: dict[str, tuple]) -> None:
+        """changes maps field -> (old_value, new_value)."""
+        changed_at = task.updated_at or datetime.now().astimezone()
+        for field, (old_value, new_value) in changes.items():
+            self._enqueue({
+                "task_id": task.id, "project_id": task.project_id, "user_id": user_id,
+                "action": "updated", "field": field,
+                "old_value": _to_text(old_value), "new_value": _to_text(new_value),
+                "created_at": changed_at,
+            })
+
+    def record_deleted(self, task_id: int, project_id: int, user_id: int | None) -> None:
+        self._enqueue({
+            "task_id": task_id, "project_id": project_id, "user_id": user_id,
+            "action": "deleted", "field": None, "old_value": None, "new_value": None,
+            "created_at": datetime.now().astimezone(),
+        })
+
+    async def start(self) -> None:
+        if self._task is None:
+            self._queue = asyncio.Queue(maxsize=MAX_QUEUE_SIZE)
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the background task and flush whatever is still queued."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        remaining = []
+        while not self._queue.empty():
+            remaining.append(self._queue.get_nowait())
+        if remaining and not await self._write(remaining):
+            for row in remaining:
+                self._drop(row, "write failed at shutdown")
+
+    async def _run(self) -> None:
+        while True:
+            batch = [await self._queue.get()]
+            deadline = asyncio.get_running_loop().time() + FLUSH_INTERVAL_SECONDS
+            while len(batch) < BATCH_SIZE:
+                timeout = deadline - asyncio.get_running_loop().time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            if not await self._write(batch):
+                self._requeue(batch)
+                # Give the database time to recover instead of spinning on the same rows
+                await asyncio.sleep(RETRY_BACKOFF_SECONDS * 2 ** WRITE_ATTEMPTS)
+
+    def _requeue(self, rows: list[dict]) -> None:
+        for row in rows:
+            row["_failures"] = row.get("_failures", 0) + 1
+            if row["_failures"] >= MAX_ROW_FAILURES:
+                self._drop(row, f"failed {row['_failures']} times")
+                continue
+            try:
+                self._queue.put_nowait(row)
+            except asyncio.QueueFull:
+                self._drop(row, "queue full on retry")
+
+    async def _write(self, rows: list[dict]) -> bool:
+        """Insert `rows`, retrying with backoff. Returns whether they were written."""
+        values = [{key: value for key, value in row.items() if key != "_failures"} for row in rows]
+        for attempt in range(WRITE_ATTEMPTS):
+            try:
+                async with AsyncSessionLocal() as db:
+                    this_month = date.today().replace(day=1)
+                    if self._partition_month != this_month or attempt > 0:
+                        # After a failure, also cover rows outside the usual window
+                        # (e.g. a month whose partition the scheduler has not made yet)
+                        await ensure_partitions(db, extra_months={row["created_at"] for row in values})
+                        self._partition_month = this_month
+                    # executemany: one round trip for the whole batch
+                    await db.execute(insert(TaskActivity), values)
+                    await db.commit()
+                return True
+            except Exception:
+                logger.exception("Failed to write %d activity entries (attempt %d/%d)",
+                                 len(rows), attempt + 1, WRITE_ATTEMPTS)
+                if attempt + 1 < WRITE_ATTEMPTS:
+                    await asyncio.sleep(RETRY_BACKOFF_SECONDS * 2 ** attempt)
+        return False
+
+
+activity_writer = ActivityWriter()
+
+
+async def ensure_partitions(db: AsyncSession, months_ahead: int = PARTITIONS_AHEAD, extra_months: set = frozenset()) -> None:
+    """
+    Create monthly partitions for the current month and the next few, plus
+    those containing any of the dates in `extra_months`.
+    Postgres refuses to create a partition while the DEFAULT partition holds
+    rows for its range, so those rows are moved into the new partition in the
+    same transaction.
+    """
+    month_start = date.today().replace(day=1)
+    months = {_add_months(month_start, offset) for offset in range(months_ahead + 1)}
+    months.update(date(day.year, day.month, 1) for day in extra_months if day is not None)
+    for start in sorted(months):
+        end = _add_months(start, 1)
+        name = f"task_activity_y{start.year}m{start.month:02d}"
+        if (await db.execute(text(f"SELECT to_regclass('{name}') IS NOT NULL"))).scalar():
+            continue
+        in_range = f"created_at >= '{start.isoformat()}' AND created_at < '{end.isoformat()}'"
+        create = (
+            f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF task_activity "
+            f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+        )
+        stranded = (await db.execute(text(
+            f"SELECT EXISTS (SELECT 1 FROM task_activity_default WHERE {in_range})"
+        ))).scalar()
+        if not stranded:
+            await db.execute(text(create))
+            continue
+        # Detached, the default no longer blocks the new range; inserting through
+        # the parent routes the moved rows into the new partition
+        await db.execute(text("ALTER TABLE task_activity DETACH PARTITION task_activity_default"))
+        await db.execute(text(create))
+        moved = (await db.execute(text(
+            f"WITH moved AS (DELETE FROM task_activity_default WHERE {in_range} RETURNING *) "
+            f"INSERT INTO task_activity SELECT * FROM moved"
+        ))).rowcount
+        await db.execute(text("ALTER TABLE task_activity ATTACH PARTITION task_activity_default DEFAULT"))
+        logger.info("Moved %d activity entries from task_activity_default into %s", moved, name)
+    await db.commit()
+
+
+async def drop_expired_partitions(db: AsyncSession, retention_months: int = RETENTION_MONTHS) -> list[str]:
+    """Detach and drop monthly partitions entirely older than the retention window."""
+    cutoff = _add_months(date.today().replace(day=1), -retention_months)
+    result = await db.execute(text(
+        "SELECT c.relname FROM pg_inherits i "
+        "JOIN pg_class c ON c.oid = i.inhrelid "
+        "JOIN pg_class p ON p.oid = i.inhparent "
+        "WHERE p.relname = 'task_activity'"
+    ))
+    dropped = []
+    for (name,) in result.all():
+        match = PARTITION_NAME.match(name)
+        if not match:
+            continue
+        month_end = _add_months(date(int(match.group(1)), int(match.group(2)), 1), 1)
+        if month_end <= cutoff:
+            await db.execute(text(f"ALTER TABLE task_activity DETACH PARTITION {name}"))
+            await db.execute(text(f"DROP TABLE {name}"))
+            dropped.append(name)
+    await db.commit()
+    return dropped
+
+
+async def fetch_activity_page(db: AsyncSession, condition, cursor: str | None, limit: int) -> tuple[list, str | None]:
+    """One page of activity, newest first. Returns the rows and the next cursor."""
+    return await fetch_newest_first(db, TaskActivity, condition, cursor, limit)
+
+
+async def maintain_partitions_job() -> None:
+    """Scheduled daily: create upcoming partitions and drop expired ones."""
+    async with AsyncSessionLocal() as db:
+        await ensure_partitions(db)
+        dropped = await drop_expired_partitions(db)
+    if dropped:
+        logger.info("Dropped expired activity partitions: %s", ", ".join(dropped))
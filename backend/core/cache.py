@@ -0,0 +1,92 @@
+import threading
+import time
+from collections import OrderedDict
+
+
+class TTLCache:
+    """
+    Small in-process LRU cache with per-entry expiry.
+    Safe to use from both the event loop and threadpool workers.
+
+    Values computed from the database can race with invalidation: take
+    version(key) before reading and pass it to set(), which then skips
+    storing a result the key was invalidated during.
+    """
+
+    _MISSING = object()
+
+    def __init__(self, maxsize: int = 1024, ttl: float | None = None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        # Bumped by clear() and invalidate(); see version()
+        self._epoch = 0
+        self._versions: dict = {}
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._data.get(key, self._MISSING)
+            if entry is self._MISSING:
+                return default
+            value, expires_at = entry
+            if expires_at is not None and expires_at < time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def version(self, key) -> tuple[int, int]:
+        """Token that changes whenever `key` is invalidated."""
+        with self._lock:
+            return self._epoch, self._versions.get(key, 0)
+
+    def set(self, key, value, ttl: float | None = None, version: tuple[int, int] | None = None) -> None:
+        ttl = self.ttl if ttl is None else ttl
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+        with self._lock:
+            if version is not None and version != (self._epoch, self._versions.get(key, 0)):
+                return  # Invalidated while the value was being computed
+            self._data[key] = (value, expires_at)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def invalidate(self, key) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+            self._versions[key] = self._versions.get(key, 0) + 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self._epoch += 1
+            self._versions.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+# Named caches that can be invalidated across workers through the event bus
+_registry: dict[str, TTLCache] = {}
+
+
+def register_cache(name: str, cache: TTLCache) -> TTLCache:
+    _registry[name] = cache
+    return cache
+
+
+def invalidate_local(name: str, key=None) -> None:
+    """Invalidate one key (or the whole cache if key is None) in this worker."""
+    cache = _registry.get(name)
+    if cache is None:
+        return
+    if key is None:
+        cache.clear()
+    else:
+        cache.invalidate(key)
+
+
+def clear_all_local() -> None:
+    for cache in _registry.values():
+        cache.clear()
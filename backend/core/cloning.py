@@ -0,0 +1,113 @@
+"""
+Set-based project cloning.
+
+Everything is copied with INSERT ... SELECT inside the caller's transaction;
+no task is loaded into Python. New task IDs are drawn up front into a
+temporary old -> new mapping table, which the task, subtask, dependency and
+label copies join against.
+"""
+from datetime import date
+from sqlalchemy import select, insert, func, literal, cast, String, Integer, text, table, column
+from sqlalchemy.ext.asyncio import AsyncSession
+from models.project import Project, ProjectStatus, project_members
+from models.task import Task, TaskStatus
+from models.task_dependency import TaskDependency
+from models.label import task_labels
+
+task_map = table("clone_task_map", column("old_id", Integer), column("new_id", Integer))
+
+
+async def clone_project(
+    db: AsyncSession,
+    source: Project,
+    name: str,
+    start_date: date,
+    end_date: date,
+    is_template: bool,
+) -> tuple[int, list[int]]:
+    """
+    Copy `source` with its members, tasks, subtasks, dependencies and label
+    links. Task due dates move with the new start date; tasks start over in
+    TODO, keeping their board order. Returns the new project's ID and its
+    member IDs. The caller commits.
+    """
+    shift = (start_date - source.start_date).days
+
+    new_project_id = (await db.execute(
+        insert(Project)
+        .from_select(
+            ["name", "description", "client_id", "team_lead_id", "start_date", "end_date",
+             "status", "document_url", "document_sha256", "is_template"],
+            select(
+                literal(name), Project.description, Project.client_id, Project.team_lead_id,
+                literal(start_date), literal(end_date), literal(ProjectStatus.PLANNING.value).cast(Project.status.type),
+                Project.document_url, Project.document_sha256, literal(is_template),
+            ).where(Project.id == source.id),
+        )
+        .returning(Project.id)
+    )).scalar_one()
+
+    member_ids = (await db.execute(
+        insert(project_members)
+        .from_select(
+            ["project_id", "user_id"],
+            select(literal(new_project_id), project_members.c.user_id).where(project_members.c.project_id == source.id),
+        )
+        .returning(project_members.c.user_id)
+    )).scalars().all()
+
+    await db.execute(text(
+        "CREATE TEMPORARY TABLE clone_task_map (old_id integer PRIMARY KEY, new_id integer NOT NULL) ON COMMIT DROP"
+    ))
+    await db.execute(
+        insert(task_map).from_select(
+            ["old_id", "new_id"],
+            select(Task.id, func.nextval(func.pg_get_serial_sequence("tasks", "id")))
+            .where(Task.project_id == source.id),
+        )
+    )
+
+    # Parents are inserted before their children (a parent's path is a prefix of
+    # its children's), so the tasks_set_path trigger finds each parent's new path
+    parent_map = task_map.alias("parent_map")
+    position = func.row_number().over(order_by=(Task.status, Task.rank, Task.id))
+    await db.execute(
+        insert(Task).from_select(
+            ["id", "project_id", "parent_id", "title", "description", "status", "priority",
+             "due_date", "estimate_days", "assignee_id", "rank"],
+            select(
+                task_map.c.new_id, literal(new_project_id), parent_map.c.new_id, Task.title, Task.description,
+                literal(TaskStatus.TODO.value).cast(Task.status.type), Task.priority,
+                Task.due_date + shift, Task.estimate_days, Task.assignee_id,
+                # Same fixed-width scheme as the rank backfill; all cards now share the TODO column
+                literal("V") + func.lpad(cast(position, String), 9, "0", type_=String) + literal("V"),
+            )
+            .select_from(Task)
+            .join(task_map, task_map.c.old_id == Task.id)
+            .outerjoin(parent_map, parent_map.c.old_id == Task.parent_id)
+            .where(Task.project_id == source.id)
+            .order_by(Task.path)
+        )
+    )
+
+    blocker_map = task_map.alias("blocker_map")
+    await db.execute(
+        insert(TaskDependency).from_select(
+            ["blocker_id", "blocked_id", "project_id"],
+            select(blocker_map.c.new_id, task_map.c.new_id, literal(new_project_id))
+            .select_from(TaskDependency)
+            .join(task_map, task_map.c.old_id == TaskDependency.blocked_id)
+            .join(blocker_map, blocker_map.c.old_id == TaskDependency.blocker_id)
+            .where(TaskDependency.project_id == source.id)
+        )
+    )
+
+    await db.execute(
+        insert(task_labels).from_select(
+            ["task_id", "label_id"],
+            select(task_map.c.new_id, task_labels.c.label_id)
+            .select_from(task_labels)
+            .join(task_map, task_map.c.old_id == task_labels.c.task_id)
+        )
+    )
+    return new_project_id, list(member_ids)
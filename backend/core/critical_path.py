@@ -0,0 +1,140 @@
+"""
+Critical path scheduling over a project's task dependency graph.
+
+The graph is loaded with one query (each task with its blockers) and
+scheduled with Kahn's topological sort: a forward pass for earliest
+start/finish, a backward pass for latest start/finish, both O(tasks +
+dependencies). Offsets are whole days from the project start.
+"""
+import zlib
+from collections import deque
+from dataclasses import dataclass, field
+from sqlalchemy import select, func, literal_column
+from sqlalchemy.ext.asyncio import AsyncSession
+from models.task import Task
+from models.task_dependency import TaskDependency
+
+# Duration used for tasks without an estimate
+DEFAULT_ESTIMATE_DAYS = 1
+
+
+class DependencyCycleError(Exception):
+    """The dependency graph is not acyclic."""
+
+
+@dataclass
+class ScheduleNode:
+    task_id: int
+    title: str
+    duration: int
+    blockers: list[int]
+    successors: list[int] = field(default_factory=list)
+    earliest_start: int = 0
+    earliest_finish: int = 0
+    latest_start: int = 0
+    latest_finish: int = 0
+
+    @property
+    def slack(self) -> int:
+        return self.latest_start - self.earliest_start
+
+
+async def load_dependency_graph(db: AsyncSession, project_id: int) -> dict[int, ScheduleNode]:
+    """Every task of the project with the IDs of the tasks blocking it."""
+    blockers = func.coalesce(
+        func.array_agg(TaskDependency.blocker_id).filter(TaskDependency.blocker_id.isnot(None)),
+        literal_column("'{}'::integer[]"),
+    )
+    result = await db.execute(
+        select(Task.id, Task.title, Task.estimate_days, blockers)
+        .outerjoin(TaskDependency, TaskDependency.blocked_id == Task.id)
+        .where(Task.project_id == project_id)
+        .group_by(Task.id)
+    )
+    return {
+        task_id: ScheduleNode(
+            task_id, title, estimate if estimate is not None else DEFAULT_ESTIMATE_DAYS, list(task_blockers)
+        )
+        for task_id, title, estimate, task_blockers in result.all()
+    }
+
+
+def _topological_order(nodes: dict[int, ScheduleNode]) -> list[int]:
+    in_degree = {}
+    for node in nodes.values():
+        in_degree[node.task_id] = len(node.blockers)
+        for blocker_id in node.blockers:
+            nodes[blocker_id].successors.append(node.task_id)
+    ready = deque(sorted(task_id for task_id, degree in in_degree.items() if degree == 0))
+    order = []
+    while ready:
+        task_id = ready.popleft()
+        order.append(task_id)
+        for successor_id in nodes[task_id].successors:
+            in_degree[successor_id] -= 1
+            if in_degree[successor_id] == 0:
+                ready.append(successor_id)
+    if len(order) != len(nodes):
+        raise DependencyCycleError("Task dependencies contain a cycle")
+    return order
+
+
+def schedule(nodes: dict[int, ScheduleNode]) -> tuple[list[int], int]:
+    """
+    Fill in earliest/latest times on `nodes`. Returns the topological order
+    and the project duration in days.
+    """
+    order = _topological_order(nodes)
+    for task_id in order:
+        node = nodes[task_id]
+        node.earliest_start = max((nodes[b].earliest_finish for b in node.blockers), default=0)
+        node.earliest_finish = node.earliest_start + node.duration
+    duration = max((node.earliest_finish for node in nodes.values()), default=0)
+    for task_id in reversed(order):
+        node = nodes[task_id]
+        node.latest_finish = min((nodes[s].latest_start for s in node.successors), default=duration)
+        node.latest_start = node.latest_finish - node.duration
+    return order, duration
+
+
+def critical_chain(nodes: dict[int, ScheduleNode], order: list[int]) -> list[int]:
+    """One start-to-finish chain of zero-slack tasks, each directly blocking the next."""
+    current = next((task_id for task_id in order if nodes[task_id].slack == 0 and not nodes[task_id].blockers), None)
+    chain = []
+    while current is not None:
+        chain.append(current)
+        node = nodes[current]
+        current = next(
+            (s for s in node.successors
+             if nodes[s].slack == 0 and nodes[s].earliest_start == node.earliest_finish),
+            None,
+        )
+    return chain
+
+
+async def lock_project_dependencies(db: AsyncSession, project_id: int) -> None:
+    """Serialize dependency inserts within a project until the transaction ends."""
+    key = zlib.crc32(f"task_dependencies:{project_id}".encode())
+    await db.execute(select(func.pg_advisory_xact_lock(key)))
+
+
+async def creates_cycle(db: AsyncSession, blocker_id: int, blocked_id: int) -> bool:
+    """Whether blocker -> blocked would close a cycle, i.e. blocked already (transitively) blocks blocker."""
+    reachable = (
+        select(TaskDependency.blocked_id.label("task_id"))
+        .where(TaskDependency.blocker_id == blocked_id)
+        .cte("reachable", recursive=True)
+    )
+    reachable = reachable.union(
+        select(TaskDependency.blocked_id)
+        .join(reachable, TaskDependency.blocker_id == reachable.c.task_id)
+    )
+    result = await db.execute(select(reachable.c.task_id).where(reachable.c.task_id == blocker_id).limit(1))
+    return blocker_id == blocked_id or result.first() is not None
+
+
+async def project_schedule(db: AsyncSession, project_id: int) -> tuple[list[ScheduleNode], int, list[int]]:
+    """Scheduled tasks in topological order, the project duration in days and the critical chain."""
+    nodes = await load_dependency_graph(db, project_id)
+    order, duration = schedule(nodes)
+    return [nodes[task_id] for task_id in order], duration, critical_chain(nodes, order)
@@ -0,0 +1,183 @@
+import hashlib
+import logging
+import os
+import re
+import zipfile
+from xml.etree import ElementTree
+from sqlalchemy import select, update
+from sqlalchemy.dialects.postgresql import insert
+from starlette.concurrency import run_in_threadpool
+from database import AsyncSessionLocal
+from models.document import DocumentText
+from models.project import Project
+from core.uploads import UPLOAD_DIR
+from core.workers import run_in_process
+
+try:
+    from pypdf import PdfReader
+except ImportError:  # Optional: PDFs are left unindexed without it (see index_unlinked_documents)
+    PdfReader = None
+
+logger = logging.getLogger(__name__)
+
+# Extracted text is cached on disk by content hash so re-uploads of the same
+# document (or re-linking it to another project) never re-parse it.
+TEXT_CACHE_DIR = os.path.join(UPLOAD_DIR, ".text")
+os.makedirs(TEXT_CACHE_DIR, exist_ok=True)
+
+# Postgres tsvector values are limited to 1MB; index only the leading text
+MAX_INDEXED_CHARS = 500_000
+
+PLAIN_TEXT_EXTENSIONS = {".txt", ".md", ".csv", ".log", ".json", ".xml", ".html", ".htm"}
+INDEXED_EXTENSIONS = PLAIN_TEXT_EXTENSIONS | {".pdf", ".docx"}
+WORD_NAMESPACE = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+
+
+class DocumentNotReadable(Exception):
+    """The document's format can't be read here (e.g. a PDF without pypdf installed)."""
+
+
+def file_sha256(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as fh:
+        for block in iter(lambda: fh.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _extract_pdf(path: str) -> str:
+    if PdfReader is None:
+        raise DocumentNotReadable("pypdf is not installed")
+    reader = PdfReader(path)
+    return "\n".join(page.extract_text() or "" for page in reader.pages)
+
+
+def _extract_docx(path: str) -> str:
+    # A .docx is a zip; paragraph text lives in <w:t> runs of word/document.xml
+    with zipfile.ZipFile(path) as archive:
+        root = ElementTree.fromstring(archive.read("word/document.xml"))
+    paragraphs = []
+    for paragraph in root.iter(f"{WORD_NAMESPACE}p"):
+        runs = [node.text or "" for node in paragraph.iter(f"{WORD_NAMESPACE}t")]
+        if runs:
+            paragraphs.append("".join(runs))
+    return "\n".join(paragraphs)
+
+
+def extract_text(path: str) -> str:
+    """
+    Extract plain text from a PDF, DOCX or text document.
+    Runs in the process pool; must stay a top-level, picklable function.
+    Raises DocumentNotReadable if the format's parser isn't available.
+    """
+    extension = os.path.splitext(path)[1].lower()
+    if extension == ".pdf":
+        text = _extract_pdf(path)
+    elif extension == ".docx":
+        text = _extract_docx(path)
+    elif extension in PLAIN_TEXT_EXTENSIONS:
+        with open(path, "r", encoding="utf-8", errors="replace") as fh:
+            text = fh.read(MAX_INDEXED_CHARS * 2)
+    else:  # Not in INDEXED_EXTENSIONS
+        return ""
+    # Collapse whitespace and strip NULs (not allowed in Postgres text)
+    text = re.sub(r"\s+", " ", text.replace("\x00", " ")).strip()
+    return text[:MAX_INDEXED_CHARS]
+
+
+def _cache_path(sha256: str) -> str:
+    return os.path.join(TEXT_CACHE_DIR, f"{sha256}.txt")
+
+
+def _read_cached_text(sha256: str) -> str | None:
+    try:
+        with open(_cache_path(sha256), "r", encoding="utf-8") as fh:
+            return fh.read()
+    except FileNotFoundError:
+        return None
+
+
+def _write_cached_text(sha256: str, text: str) -> None:
+    path = _cache_path(sha256)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as fh:
+        fh.write(text)
+    os.replace(tmp_path, path)
+
+
+def resolve_upload_path(document_url: str | None) -> str | None:
+    """Map a /static/<name> URL to its file in the upload directory."""
+    if not document_url or not document_url.startswith("/static/"):
+        return None
+    filename = document_url[len("/static/"):]
+    if os.path.basename(filename) != filename or filename.startswith("."):
+        return None
+    path = os.path.join(UPLOAD_DIR, filename)
+    return path if os.path.isfile(path) else None
+
+
+async def index_project_document(project_id: int, document_url: str | None) -> None:
+    """
+    Background task: extract the project's document text and link it for search.
+    Runs after the response is sent, with its own database session.
+    """
+    path = resolve_upload_path(document_url)
+    sha256 = text = None
+    try:
+        if path:
+            sha256 = await run_in_threadpool(file_sha256, path)
+            text = await run_in_threadpool(_read_cached_text, sha256)
+            if not text:
+                try:
+                    text = await run_in_process(extract_text, path)
+                except DocumentNotReadable as exc:
+                    logger.warning("Document for project %s not indexed: %s", project_id, exc)
+                if text:
+                    await run_in_threadpool(_write_cached_text, sha256, text)
+        if not text:
+            # Nothing searchable is stored, so a later backfill can retry
+            sha256 = None
+
+        async with AsyncSessionLocal() as db:
+            if sha256:
+                # Rows left empty by earlier versions are filled in
+                statement = insert(DocumentText).values(sha256=sha256, text=text)
+                await db.execute(
+                    statement.on_conflict_do_update(
+                        index_elements=[DocumentText.sha256],
+                        set_={"text": statement.excluded.text},
+                        where=DocumentText.text == "",
+                    )
+                )
+            # Only link if the project still points at the same document
+            await db.execute(
+                update(Project)
+                .where(Project.id == project_id, Project.document_url.is_not_distinct_from(document_url))
+                .values(document_sha256=sha256)
+            )
+            await db.commit()
+    except Exception:
+        logger.exception("Failed to index document for project %s", project_id)
+
+
+async def index_unlinked_documents() -> int:
+    """
+    Index every project document that has no searchable text yet: ones
+    uploaded before indexing existed, or skipped because their format
+    couldn't be read at the time. Returns the number of projects tried.
+    """
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(
+            select(Project.id, Project.document_url)
+            .where(Project.document_url.isnot(None), Project.document_sha256.is_(None))
+            .order_by(Project.id)
+        )
+        projects = result.all()
+
+    tried = 0
+    for project_id, document_url in projects:
+        path = resolve_upload_path(document_url)
+        if path and os.path.splitext(path)[1].lower() in INDEXED_EXTENSIONS:
+            await index_project_document(project_id, document_url)
+            tried += 1
+    return tried
@@ -0,0 +1,211 @@
+import asyncio
+import json
+import logging
+import asyncpg
+from fastapi.encoders import jsonable_encoder
+from database import engine
+from core.cache import invalidate_local, clear_all_local
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = "workprofit_events"
+
+# Messages published within this window are sent as one NOTIFY
+COALESCE_WINDOW_SECONDS = 0.05
+# Postgres rejects NOTIFY payloads of 8000 bytes or more
+MAX_PAYLOAD_BYTES = 7900
+
+RECONNECT_INITIAL_DELAY = 0.5
+RECONNECT_MAX_DELAY = 30.0
+
+
+class EventBus:
+    """
+    Cross-worker message bus over Postgres LISTEN/NOTIFY.
+
+    Every worker listens on one channel. publish() buffers messages briefly,
+    coalesces duplicate cache invalidations and sends them as JSON arrays, so
+    a burst of writes costs one NOTIFY. Each worker (including the sender)
+    applies messages when they arrive back from Postgres. While disconnected,
+    messages are applied locally only and the bus keeps reconnecting with
+    backoff; after a reconnect every worker resyncs.
+    """
+
+    def __init__(self, dsn: str, channel: str = CHANNEL):
+        self.dsn = dsn
+        self.channel = channel
+        self._handlers: dict[str, list] = {}
+        self._connection: asyncpg.Connection | None = None
+        self._outbox: list[dict] = []
+        self._flush_task: asyncio.Task | None = None
+        self._run_task: asyncio.Task | None = None
+        self._connection_lost: asyncio.Event | None = None
+
+    @property
+    def connected(self) -> bool:
+        return self._connection is not None and not self._connection.is_closed()
+
+    def on(self, kind: str, handler) -> None:
+        """Register handler(data: dict) for a message kind."""
+        self._handlers.setdefault(kind, []).append(handler)
+
+    def publish(self, kind: str, **data) -> None:
+        """Queue a message for every worker. Safe to call from request handlers."""
+        message = {"kind": kind, **jsonable_encoder(data)}
+        if not self.connected:
+            self._dispatch(message)
+            return
+        self._outbox.append(message)
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.get_running_loop().create_task(self._flush_later())
+
+    async def start(self) -> None:
+        if self._run_task is None:
+            self._run_task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._run_task is not None:
+            self._run_task.cancel()
+            try:
+                await self._run_task
+            except asyncio.CancelledError:
+                pass
+            self._run_task = None
+        await self._close()
+
+    # --- Sending ---
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(COALESCE_WINDOW_SECONDS)
+        # Messages queued while a NOTIFY is in flight go out in the next round
+        while self._outbox:
+            messages, self._outbox = _coalesce(self._outbox), []
+            for payload in _pack(messages):
+                try:
+                    if not self.connected:
+                        raise ConnectionError("Event bus is disconnected")
+                    await self._connection.execute("SELECT pg_notify($1, $2)", self.channel, payload)
+                except Exception:
+                    # Other workers miss these, but they still take effect here
+                    logger.warning("Event bus NOTIFY failed; applying messages locally")
+                    for message in json.loads(payload):
+                        self._dispatch(message)
+
+    # --- Receiving ---
+
+    def _on_notification(self, connection, pid, channel, payload) -> None:
+        try:
+            messages = json.loads(payload)
+        except json.JSONDecodeError:
+            logger.warning("Ignoring malformed event bus payload")
+            return
+        for message in messages:
+            self._dispatch(message)
+
+    def _dispatch(self, message: dict) -> None:
+        for handler in self._handlers.get(message.get("kind"), []):
+            try:
+                handler(message)
+            except Exception:
+                logger.exception("Event bus handler failed for %s", message.get("kind"))
+
+    # --- Connection management ---
+
+    async def _run(self) -> None:
+        delay = RECONNECT_INITIAL_DELAY
+        first_connect = True
+        while True:
+            try:
+                self._connection_lost = asyncio.Event()
+                connection = await asyncpg.connect(self.dsn)
+                connection.add_termination_listener(lambda _: self._connection_lost.set())
+                await connection.add_listener(self.channel, self._on_notification)
+                self._connection = connection
+                logger.info("Event bus listening on %s", self.channel)
+                if not first_connect:
+                    # Messages may have been missed while disconnected
+                    self._dispatch({"kind": "bus.reconnected"})
+                first_connect = False
+                delay = RECONNECT_INITIAL_DELAY
+                await self._connection_lost.wait()
+                logger.warning("Event bus connection lost; reconnecting")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("Event bus connection failed (%s); retrying in %.1fs", e, delay)
+            await self._close()
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, RECONNECT_MAX_DELAY)
+
+    async def _close(self) -> None:
+        connection, self._connection = self._connection, None
+        if connection is not None and not connection.is_closed():
+            try:
+                await connection.close(timeout=5)
+            except Exception:
+                connection.terminate()
+
+
+def _coalesce(messages: list[dict]) -> list[dict]:
+    """Drop duplicate cache invalidations within a burst, keeping order otherwise."""
+    seen = set()
+    result = []
+    for message in messages:
+        if message["kind"] == "cache.invalidate":
+            key = (message["cache"], json.dumps(message.get("key"), sort_keys=True))
+            if key in seen:
+                continue
+            seen.add(key)
+        result.append(message)
+    return result
+
+
+def _pack(messages: list[dict]) -> list[str]:
+    """Group messages into JSON-array payloads under the NOTIFY size limit."""
+    payloads, batch, size = [], [], 2
+    for message in messages:
+        encoded = json.dumps(message, separators=(",", ":"))
+        if len(encoded.encode()) + 2 > MAX_PAYLOAD_BYTES:
+            fallback = _oversized_fallback(message)
+            if fallback is None:
+                logger.error("Dropping event bus message '%s': exceeds the NOTIFY payload limit", message["kind"])
+                continue
+            encoded = json.dumps(fallback, separators=(",", ":"))
+        if batch and size + len(encoded.encode()) + 1 > MAX_PAYLOAD_BYTES:
+            payloads.append("[" + ",".join(batch) + "]")
+            batch, size = [], 2
+        batch.append(encoded)
+        size += len(encoded.encode()) + 1
+    if batch:
+        payloads.append("[" + ",".join(batch) + "]")
+    return payloads
+
+
+def _oversized_fallback(message: dict) -> dict | None:
+    # A push event too large for NOTIFY (e.g. a huge task description) becomes
+    # a resync for that project's subscribers
+    if message["kind"] == "push":
+        return {"kind": "push", "project_id": message["project_id"], "event": {"type": "resync"}}
+    return None
+
+
+event_bus = EventBus(engine.url.set(drivername="postgresql").render_as_string(hide_password=False))
+
+
+def invalidate_cache(name: str, key=None) -> None:
+    """
+    Invalidate a registered cache entry (or the whole cache) in every worker.
+    This worker is invalidated immediately, not after the NOTIFY round trip,
+    so a request's own follow-up reads never see the old value.
+    """
+    invalidate_local(name, key)
+    event_bus.publish("cache.invalidate", cache=name, key=key)
+
+
+def _apply_invalidation(message: dict) -> None:
+    key = message.get("key")
+    invalidate_local(message["cache"], tuple(key) if isinstance(key, list) else key)
+
+
+event_bus.on("cache.invalidate", _apply_invalidation)
+event_bus.on("bus.reconnected", lambda message: clear_all_local())
@@ -0,0 +1,113 @@
+import asyncio
+import json
+from core.event_bus import event_bus
+
+# Per-subscriber buffer; a subscriber that falls this far behind is told to resync
+SUBSCRIBER_QUEUE_SIZE = 256
+
+RESYNC_MESSAGE = json.dumps({"type": "resync"})
+# Sent when the subscriber's account is deactivated; the stream closes after it
+CLOSE_MESSAGE = json.dumps({"type": "closed"})
+
+
+class Subscription:
+    """A single push connection and the projects it may see."""
+
+    def __init__(self, user_id: int, project_ids: set[int] | None, pinned_project_id: int | None = None,
+                 queue_size: int = SUBSCRIBER_QUEUE_SIZE):
+        self.user_id = user_id
+        # None means every project (admins and project managers)
+        self.project_ids = project_ids
+        # Set when the client follows a single board
+        self.pinned_project_id = pinned_project_id
+        self.queue: asyncio.Queue[str] = asyncio.Queue(maxsize=queue_size)
+        self.closed = False
+
+    def wants(self, project_id: int) -> bool:
+        return self.project_ids is None or project_id in self.project_ids
+
+    def deliver(self, message: str) -> None:
+        try:
+            self.queue.put_nowait(message)
+        except asyncio.QueueFull:
+            # Drop the backlog; the client reloads once instead of replaying stale diffs
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait(RESYNC_MESSAGE)
+
+    def close(self) -> None:
+        self.closed = True
+        while not self.queue.empty():
+            self.queue.get_nowait()
+        self.queue.put_nowait(CLOSE_MESSAGE)
+
+
+class EventBroker:
+    """In-process fan-out of project-scoped events to push subscribers."""
+
+    def __init__(self):
+        self._subscriptions: set[Subscription] = set()
+
+    def subscribe(self, user_id: int, project_ids: set[int] | None, pinned_project_id: int | None = None) -> Subscription:
+        subscription = Subscription(user_id, project_ids, pinned_project_id)
+        self._subscriptions.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        self._subscriptions.discard(subscription)
+
+    def dispatch(self, project_id: int, message: str) -> None:
+        """Deliver an already-encoded message to every interested subscriber."""
+        for subscription in list(self._subscriptions):
+            if subscription.wants(project_id):
+                subscription.deliver(message)
+
+    def broadcast(self, message: str) -> None:
+        for subscription in list(self._subscriptions):
+            subscription.deliver(message)
+
+    def update_access(self, project_id: int, granted: list[int], revoked: list[int]) -> None:
+        """Apply a project membership change to open subscriptions."""
+        for subscription in list(self._subscriptions):
+            if subscription.project_ids is None:
+                continue
+            if subscription.pinned_project_id not in (None, project_id):
+                continue
+            if subscription.user_id in granted:
+                subscription.project_ids.add(project_id)
+            elif subscription.user_id in revoked:
+                subscription.project_ids.discard(project_id)
+
+    def close_user(self, user_id: int) -> None:
+        for subscription in list(self._subscriptions):
+            if subscription.user_id == user_id:
+                subscription.close()
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscriptions)
+
+
+broker = EventBroker()
+
+
+def publish_event(event_type: str, project_id: int, **payload) -> None:
+    """Publish a project-scoped event (e.g. task.created) to push subscribers in every worker."""
+    event_bus.publish("push", project_id=project_id, event={"type": event_type, "project_id": project_id, **payload})
+
+
+def publish_access_change(project_id: int, granted: set[int], revoked: set[int]) -> None:
+    """Tell every worker that users gained or lost access to a project."""
+    if granted or revoked:
+        event_bus.publish("access.changed", project_id=project_id, granted=sorted(granted), revoked=sorted(revoked))
+
+
+def publish_user_deactivated(user_id: int) -> None:
+    event_bus.publish("user.deactivated", user_id=user_id)
+
+
+# Encoded once per worker, not once per subscriber
+event_bus.on("push", lambda m: broker.dispatch(m["project_id"], json.dumps(m["event"])))
+event_bus.on("access.changed", lambda m: broker.update_access(m["project_id"], m["granted"], m["revoked"]))
+event_bus.on("user.deactivated", lambda m: broker.close_user(m["user_id"]))
+event_bus.on("bus.reconnected", lambda m: broker.broadcast(RESYNC_MESSAGE))
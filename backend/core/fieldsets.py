@@ -0,0 +1,28 @@
+"""
+Sparse fieldsets for list endpoints, e.g. GET /tasks?fields=title,status.
+
+The requested names narrow both the SELECT list and the serialized rows.
+`id` is always included so clients can key what they get back.
+"""
+from typing import Iterable
+from fastapi import HTTPException
+
+
+def parse_fields(fields: str | None, allowed: Iterable[str]) -> set[str] | None:
+    """Field names from a comma-separated `fields` parameter; None means all fields."""
+    if fields is None:
+        return None
+    allowed = list(allowed)
+    requested = {name.strip() for name in fields.split(",") if name.strip()}
+    unknown = requested.difference(allowed)
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown field(s): {', '.join(sorted(unknown))}. Use any of: {', '.join(allowed)}"
+        )
+    return requested | {"id"}
+
+
+def select_columns(columns: Iterable, fields: set[str] | None) -> list:
+    """The columns whose key is in `fields` (all of them when `fields` is None)."""
+    return [column for column in columns if fields is None or column.key in fields]
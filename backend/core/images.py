@@ -0,0 +1,76 @@
+import os
+from core.static import hidden_tmp_path
+
+try:
+    from PIL import Image, ImageOps
+except ImportError:  # Optional: without Pillow, avatars are served at original size
+    Image = None
+    ImageOps = None
+
+# Fixed square sizes (px) for avatar renditions, addressed by name
+RENDITION_SIZES = {"xs": 32, "sm": 64, "md": 128, "lg": 256}
+DEFAULT_RENDITION_SIZE = "sm"
+
+# format name -> (Pillow format, file extension, save options)
+RENDITION_FORMATS = {
+    "webp": ("WEBP", ".webp", {"quality": 80, "method": 4}),
+    "jpeg": ("JPEG", ".jpg", {"quality": 82, "optimize": True, "progressive": True}),
+}
+DEFAULT_RENDITION_FORMAT = "webp"
+
+IMAGE_EXTENSIONS = {".jpg", ".jpeg", ".png", ".webp", ".gif", ".bmp"}
+
+
+def is_image(filename: str) -> bool:
+    return os.path.splitext(filename)[1].lower() in IMAGE_EXTENSIONS
+
+
+def rendition_filename(stored_filename: str, size: str, fmt: str) -> str:
+    """Renditions live next to the original: <uuid>.<size><ext>."""
+    stem = os.path.splitext(stored_filename)[0]
+    return f"{stem}.{size}{RENDITION_FORMATS[fmt][1]}"
+
+
+def avatar_rendition_url(avatar_url: str | None, size: str = DEFAULT_RENDITION_SIZE) -> str | None:
+    """URL of a sized avatar; generated lazily on first request."""
+    if not avatar_url or not avatar_url.startswith("/static/"):
+        return avatar_url
+    filename = avatar_url[len("/static/"):]
+    if not is_image(filename):
+        return avatar_url
+    return f"/api/v1/files/avatars/{filename}?size={size}"
+
+
+def generate_rendition(source_path: str, size: str, fmt: str) -> str:
+    """
+    Write one square rendition next to the source image and return its path.
+    Runs in the process pool; must stay a top-level, picklable function.
+    """
+    pil_format, _, save_options = RENDITION_FORMATS[fmt]
+    pixels = RENDITION_SIZES[size]
+    directory, stored_filename = os.path.split(source_path)
+    target_path = os.path.join(directory, rendition_filename(stored_filename, size, fmt))
+
+    with Image.open(source_path) as image:
+        # Cheap JPEG pre-scaling; only works before the first load, which exif_transpose does
+        image.draft("RGB", (pixels * 2, pixels * 2))
+        image = ImageOps.exif_transpose(image)
+        if image.mode not in ("RGB", "RGBA") or fmt == "jpeg":
+            image = image.convert("RGB")
+        thumbnail = ImageOps.fit(image, (pixels, pixels), method=Image.Resampling.LANCZOS)
+        # Write-then-rename so concurrent lazy requests never see a partial file
+        tmp_path = hidden_tmp_path(target_path)
+        thumbnail.save(tmp_path, format=pil_format, **save_options)
+    os.replace(tmp_path, target_path)
+    return target_path
+
+
+def generate_renditions(source_path: str) -> list[str]:
+    """Generate every size/format rendition for an uploaded image."""
+    if Image is None:
+        return []
+    return [
+        generate_rendition(source_path, size, fmt)
+        for size in RENDITION_SIZES
+        for fmt in RENDITION_FORMATS
+    ]
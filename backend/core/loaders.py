@@ -0,0 +1,74 @@
+"""
+Request-scoped batching of user-by-id lookups (DataLoader style).
+
+Handlers prime every user ID they will need, then load them one by one as
+their validation runs; all pending IDs are fetched together with a single
+IN query and memoized for the rest of the request. Users already in the
+session's identity map (e.g. the current user or eagerly loaded project
+members) are reused without a query. Concurrent load() calls issued in the
+same tick, e.g. via asyncio.gather, also share one query.
+"""
+import asyncio
+from typing import Iterable
+from fastapi import Depends
+from sqlalchemy import inspect, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import identity_key
+from database import get_db
+from models.user import User
+
+
+class UserLoader:
+    def __init__(self, db: AsyncSession):
+        self._db = db
+        self._users: dict[int, User | None] = {}
+        self._queued: set[int] = set()
+        self._batch: asyncio.Task | None = None
+
+    def prime(self, *user_ids: int | None) -> None:
+        """Queue IDs for the next batch without waiting for them."""
+        self._queued.update(i for i in user_ids if i is not None and i not in self._users)
+
+    async def load(self, user_id: int) -> User | None:
+        self.prime(user_id)
+        while user_id not in self._users:
+            await self._dispatch()
+        return self._users[user_id]
+
+    async def load_many(self, user_ids: Iterable[int]) -> list[User | None]:
+        """Users in the order of `user_ids` (None where missing)."""
+        user_ids = list(user_ids)
+        self.prime(*user_ids)
+        while any(i not in self._users for i in user_ids):
+            await self._dispatch()
+        return [self._users[i] for i in user_ids]
+
+    async def _dispatch(self) -> None:
+        if self._batch is None:
+            self._batch = asyncio.ensure_future(self._fetch())
+        await self._batch
+
+    async def _fetch(self) -> None:
+        try:
+            # Let other load() calls scheduled in this tick join the batch
+            await asyncio.sleep(0)
+            user_ids, self._queued = self._queued, set()
+            missing = []
+            for user_id in user_ids:
+                user = self._db.identity_map.get(identity_key(User, user_id))
+                if user is not None and not inspect(user).expired_attributes:
+                    self._users[user_id] = user
+                else:
+                    missing.append(user_id)
+            if missing:
+                result = await self._db.execute(select(User).where(User.id.in_(missing)))
+                found = {user.id: user for user in result.scalars().all()}
+                for user_id in missing:
+                    self._users[user_id] = found.get(user_id)
+        finally:
+            self._batch = None
+
+
+async def get_user_loader(db: AsyncSession = Depends(get_db)) -> UserLoader:
+    """One loader per request, sharing the request's session."""
+    return UserLoader(db)
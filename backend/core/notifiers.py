@@ -0,0 +1,99 @@
+import logging
+import os
+import smtplib
+from email.message import EmailMessage
+from starlette.concurrency import run_in_threadpool
+
+logger = logging.getLogger(__name__)
+
+# Which notifier delivers reminder digests: log, file or smtp
+NOTIFIER_BACKEND = os.getenv("NOTIFIER_BACKEND", "log")
+NOTIFY_FROM = os.getenv("NOTIFY_FROM", "WorkProfit <noreply@workprofit.local>")
+OUTBOX_PATH = os.getenv("NOTIFY_OUTBOX_PATH", "outbox.mbox")
+SMTP_HOST = os.getenv("SMTP_HOST", "localhost")
+SMTP_PORT = int(os.getenv("SMTP_PORT", "25"))
+SMTP_USER = os.getenv("SMTP_USER")
+SMTP_PASSWORD = os.getenv("SMTP_PASSWORD")
+SMTP_STARTTLS = os.getenv("SMTP_STARTTLS", "false").lower() == "true"
+
+
+def build_message(to: str, subject: str, body: str) -> EmailMessage:
+    message = EmailMessage()
+    message["From"] = NOTIFY_FROM
+    message["To"] = to
+    message["Subject"] = subject
+    message.set_content(body)
+    return message
+
+
+class Notifier:
+    """Delivers a batch of messages. Subclasses implement deliver()."""
+
+    async def deliver(self, messages: list[EmailMessage]) -> int:
+        raise NotImplementedError
+
+
+class LogNotifier(Notifier):
+    """Writes a line per message to the application log (development default)."""
+
+    async def deliver(self, messages: list[EmailMessage]) -> int:
+        for message in messages:
+            logger.info("Notification to %s: %s", message["To"], message["Subject"])
+        return len(messages)
+
+
+class FileNotifier(Notifier):
+    """Appends messages to an mbox-style outbox file."""
+
+    def __init__(self, path: str = OUTBOX_PATH):
+        self.path = path
+
+    def _append(self, messages: list[EmailMessage]) -> None:
+        with open(self.path, "a", encoding="utf-8") as fh:
+            for message in messages:
+                fh.write(f"From {NOTIFY_FROM}\n{message.as_string()}\n")
+
+    async def deliver(self, messages: list[EmailMessage]) -> int:
+        await run_in_threadpool(self._append, messages)
+        return len(messages)
+
+
+class SmtpNotifier(Notifier):
+    """Sends messages over one SMTP connection per batch."""
+
+    def __init__(self, host: str = SMTP_HOST, port: int = SMTP_PORT,
+                 user: str | None = SMTP_USER, password: str | None = SMTP_PASSWORD,
+                 starttls: bool = SMTP_STARTTLS):
+        self.host = host
+        self.port = port
+        self.user = user
+        self.password = password
+        self.starttls = starttls
+
+    def _send(self, messages: list[EmailMessage]) -> int:
+        sent = 0
+        with smtplib.SMTP(self.host, self.port, timeout=30) as smtp:
+            if self.starttls:
+                smtp.starttls()
+            if self.user:
+                smtp.login(self.user, self.password or "")
+            for message in messages:
+                try:
+                    smtp.send_message(message)
+                    sent += 1
+                except smtplib.SMTPRecipientsRefused:
+                    logger.warning("SMTP server refused recipient %s", message["To"])
+        return sent
+
+    async def deliver(self, messages: list[EmailMessage]) -> int:
+        return await run_in_threadpool(self._send, messages)
+
+
+NOTIFIERS = {"log": LogNotifier, "file": FileNotifier, "smtp": SmtpNotifier}
+
+
+def get_notifier() -> Notifier:
+    try:
+        return NOTIFIERS[NOTIFIER_BACKEND]()
+    except KeyError:
+        raise ValueError(f"Unknown NOTIFIER_BACKEND '{NOTIFIER_BACKEND}'. Use one of: {', '.join(NOTIFIERS)}")
@@ -0,0 +1,78 @@
+"""
+Fractional ranks for ordering cards within a board column.
+
+Ranks are strings over DIGITS compared byte-wise (the column uses the "C"
+collation). A rank can always be generated between any two others, so
+moving a card rewrites only that card's row. Ranks never end in the lowest
+digit, which keeps room before every rank.
+"""
+
+DIGITS = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"
+BASE = len(DIGITS)
+
+# Ranks longer than this trigger a background rebalance of their column
+MAX_RANK_LENGTH = 24
+
+
+def _midpoint(a: str, b: str | None) -> str:
+    """A key strictly between a and b (b=None means no upper bound)."""
+    if b is not None:
+        # Keep the shared prefix; a is treated as padded with the lowest digit
+        n = 0
+        while n < len(b) and (a[n] if n < len(a) else DIGITS[0]) == b[n]:
+            n += 1
+        if n > 0:
+            return b[:n] + _midpoint(a[n:], b[n:])
+    digit_a = DIGITS.index(a[0]) if a else 0
+    digit_b = DIGITS.index(b[0]) if b is not None else BASE
+    if digit_b - digit_a > 1:
+        return DIGITS[(digit_a + digit_b + 1) // 2]
+    # Adjacent first digits
+    if b is not None and len(b) > 1:
+        return b[:1]
+    return DIGITS[digit_a] + _midpoint(a[1:], None)
+
+
+def _increment(rank: str) -> str:
+    # Bump the first digit that has room; appending to a column stays short
+    for i, ch in enumerate(rank):
+        if ch != DIGITS[-1]:
+            return rank[:i] + DIGITS[DIGITS.index(ch) + 1]
+    return rank + DIGITS[BASE // 2]
+
+
+def _decrement(rank: str) -> str:
+    for i, ch in enumerate(rank):
+        if DIGITS.index(ch) > 1:
+            return rank[:i] + DIGITS[DIGITS.index(ch) - 1]
+    return _midpoint("", rank)
+
+
+def rank_between(before: str | None, after: str | None) -> str:
+    """A rank that sorts after `before` and before `after` (either may be None)."""
+    if before is not None and after is not None:
+        if before >= after:
+            raise ValueError(f"Rank {before!r} must sort before {after!r}")
+        return _midpoint(before, after)
+    if before is not None:
+        return _increment(before)
+    if after is not None:
+        return _decrement(after)
+    return DIGITS[BASE // 2]
+
+
+def evenly_spaced_ranks(count: int) -> list[str]:
+    """`count` short, increasing ranks spread over the key space (for rebalancing)."""
+    width = 1
+    while BASE ** width < 4 * (count + 1):
+        width += 1
+    ranks = []
+    for i in range(1, count + 1):
+        value = i * BASE ** width // (count + 1)
+        digits = []
+        for _ in range(width):
+            value, remainder = divmod(value, BASE)
+            digits.append(DIGITS[remainder])
+        # Trailing mid digit so no rank ends in the lowest digit
+        ranks.append("".join(reversed(digits)) + DIGITS[BASE // 2])
+    return ranks
@@ -0,0 +1,119 @@
+import logging
+import os
+from datetime import date, timedelta
+from sqlalchemy import select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from database import AsyncSessionLocal
+from models.project import Project, TEMPLATE_PROJECT_IDS
+from models.task import Task, OPEN_DUE_TASKS
+from models.user import User
+from core.notifiers import Notifier, build_message, get_notifier
+
+logger = logging.getLogger(__name__)
+
+# Tasks due within this many days (and not yet overdue) are included as "due soon"
+DUE_SOON_DAYS = int(os.getenv("REMINDER_DUE_SOON_DAYS", "2"))
+SCAN_BATCH_SIZE = 1000
+# Tasks listed per digest; the rest are summarised as a count
+MAX_TASKS_PER_DIGEST = 50
+DELIVERY_BATCH_SIZE = 100
+
+
+async def scan_due_tasks(db: AsyncSession, until: date, batch_size: int = SCAN_BATCH_SIZE):
+    """
+    Yield open, assigned tasks due on or before `until` in (due_date, id)
+    keyset batches. Each batch is one range scan of ix_tasks_open_due.
+    """
+    last_key = None
+    while True:
+        query = (
+            select(Task.id, Task.title, Task.due_date, Task.project_id, Task.assignee_id)
+            .where(
+                OPEN_DUE_TASKS,
+                Task.due_date <= until,
+                Task.assignee_id.isnot(None),
+                Task.project_id.notin_(TEMPLATE_PROJECT_IDS),
+            )
+        )
+        if last_key is not None:
+            query = query.where(tuple_(Task.due_date, Task.id) > last_key)
+        rows = (await db.execute(query.order_by(Task.due_date, Task.id).limit(batch_size))).all()
+        if not rows:
+            return
+        yield rows
+        if len(rows) < batch_size:
+            return
+        last_key = (rows[-1].due_date, rows[-1].id)
+
+
+def digest_body(name: str, overdue: list, due_soon: list, more: int, project_names: dict[int, str], today: date) -> str:
+    lines = [f"Hi {name},", ""]
+    if overdue:
+        lines.append("Overdue:")
+        for task in overdue:
+            days = (today - task.due_date).days
+            lines.append(f"  - {task.title} ({project_names.get(task.project_id, 'Unknown project')}), "
+                         f"due {task.due_date.isoformat()}, {days} day{'s' if days != 1 else ''} late")
+        lines.append("")
+    if due_soon:
+        lines.append("Due soon:")
+        for task in due_soon:
+            lines.append(f"  - {task.title} ({project_names.get(task.project_id, 'Unknown project')}), "
+                         f"due {task.due_date.isoformat()}")
+        lines.append("")
+    if more:
+        lines.append(f"...and {more} more.")
+        lines.append("")
+    return "\n".join(lines)
+
+
+async def send_due_reminders(db: AsyncSession, notifier: Notifier, today: date | None = None) -> int:
+    """
+    Send one digest per assignee listing their overdue and soon-due tasks.
+    Returns the number of digests delivered.
+    """
+    today = today or date.today()
+    until = today + timedelta(days=DUE_SOON_DAYS)
+
+    # assignee_id -> [overdue, due_soon, overdue_count, due_soon_count]; only the
+    # first MAX_TASKS_PER_DIGEST tasks per user are kept, so memory stays bounded
+    digests: dict[int, list] = {}
+    async for batch in scan_due_tasks(db, until):
+        for task in batch:
+            digest = digests.setdefault(task.assignee_id, [[], [], 0, 0])
+            bucket = 0 if task.due_date < today else 1
+            digest[bucket + 2] += 1
+            if len(digest[0]) + len(digest[1]) < MAX_TASKS_PER_DIGEST:
+                digest[bucket].append(task)
+    if not digests:
+        return 0
+
+    users = (await db.execute(
+        select(User.id, User.email, User.first_name)
+        .where(User.id.in_(list(digests)), User.is_active.is_(True))
+    )).all()
+    project_ids = {task.project_id for digest in digests.values() for task in digest[0] + digest[1]}
+    project_names = dict((await db.execute(
+        select(Project.id, Project.name).where(Project.id.in_(project_ids))
+    )).all())
+
+    messages = []
+    for user in users:
+        overdue, due_soon, overdue_count, due_soon_count = digests[user.id]
+        more = overdue_count + due_soon_count - len(overdue) - len(due_soon)
+        subject = f"Task reminder: {overdue_count} overdue, {due_soon_count} due soon"
+        messages.append(build_message(
+            user.email, subject, digest_body(user.first_name, overdue, due_soon, more, project_names, today)
+        ))
+
+    delivered = 0
+    for start in range(0, len(messages), DELIVERY_BATCH_SIZE):
+        delivered += await notifier.deliver(messages[start:start + DELIVERY_BATCH_SIZE])
+    return delivered
+
+
+async def due_reminders_job() -> None:
+    """Scheduled daily."""
+    async with AsyncSessionLocal() as db:
+        delivered = await send_due_reminders(db, get_notifier())
+    logger.info("Delivered %d reminder digests", delivered)
@@ -0,0 +1,111 @@
+import asyncio
+import logging
+import zlib
+from contextlib import asynccontextmanager
+from datetime import date, datetime, time, timedelta
+from typing import Awaitable, Callable
+from sqlalchemy import select, func
+from sqlalchemy.dialects.postgresql import insert
+from database import engine
+from models.job_run import JobRun
+
+logger = logging.getLogger(__name__)
+
+Job = Callable[[], Awaitable[None]]
+
+
+def seconds_until(at: time, now: datetime | None = None) -> float:
+    """Seconds from now until the next local wall-clock time `at`."""
+    now = now or datetime.now()
+    target = datetime.combine(now.date(), at)
+    if target <= now:
+        target += timedelta(days=1)
+    return (target - now).total_seconds()
+
+
+def current_slot(at: time, now: datetime | None = None) -> date:
+    """The day whose `at` run is the most recent one due."""
+    now = now or datetime.now()
+    return now.date() if now.time() >= at else now.date() - timedelta(days=1)
+
+
+@asynccontextmanager
+async def job_lock(name: str):
+    """
+    Session-level advisory lock keyed by the job name, so a job scheduled in
+    every worker only runs in one of them at a time. Yields the connection
+    holding the lock, or None if another worker has it.
+    """
+    key = zlib.crc32(f"job:{name}".encode())
+    async with engine.connect() as conn:
+        acquired = (await conn.execute(select(func.pg_try_advisory_lock(key)))).scalar()
+        try:
+            yield conn if acquired else None
+        finally:
+            if acquired:
+                await conn.execute(select(func.pg_advisory_unlock(key)))
+
+
+class Scheduler:
+    """
+    Minimal in-process scheduler for periodic maintenance jobs.
+    Interval jobs run at startup and then every N seconds, so they must be
+    idempotent. Daily jobs run once per day across all workers: the handled
+    day is recorded in job_runs, and a day missed while the app was down is
+    caught up at startup.
+    """
+
+    def __init__(self):
+        self._jobs: list[tuple[str, Callable[[], float], Job, bool, time | None]] = []
+        self._tasks: list[asyncio.Task] = []
+
+    def every(self, name: str, seconds: float, job: Job, exclusive: bool = True) -> None:
+        self._jobs.append((name, lambda: seconds, job, exclusive, None))
+
+    def daily(self, name: str, at: time, job: Job) -> None:
+        self._jobs.append((name, lambda: seconds_until(at), job, True, at))
+
+    async def start(self) -> None:
+        if not self._tasks:
+            self._tasks = [asyncio.create_task(self._loop(*job)) for job in self._jobs]
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def _loop(self, name: str, next_delay: Callable[[], float], job: Job,
+                    exclusive: bool, at: time | None) -> None:
+        while True:
+            await self.run_job(name, job, exclusive, current_slot(at) if at else None)
+            await asyncio.sleep(next_delay())
+
+    async def run_job(self, name: str, job: Job, exclusive: bool = True, slot: date | None = None) -> None:
+        try:
+            if not exclusive:
+                await job()
+                return
+            async with job_lock(name) as conn:
+                if conn is None:
+                    logger.debug("Job %s is running in another worker; skipping", name)
+                    return
+                if slot is not None:
+                    last_run_on = (await conn.execute(
+                        select(JobRun.last_run_on).where(JobRun.name == name)
+                    )).scalar()
+                    if last_run_on is not None and last_run_on >= slot:
+                        return
+                await job()
+                if slot is not None:
+                    statement = insert(JobRun).values(name=name, last_run_on=slot)
+                    await conn.execute(statement.on_conflict_do_update(
+                        index_elements=[JobRun.name],
+                        set_={"last_run_on": statement.excluded.last_run_on, "finished_at": func.now()},
+                    ))
+                    await conn.commit()
+        except Exception:
+            logger.exception("Scheduled job %s failed", name)
+
+
+scheduler = Scheduler()
@@ -0,0 +1,46 @@
+"""
+JSON responses for hot read endpoints.
+
+List endpoints on the fast path select plain rows with Core and hand dicts
+straight to FastJSONResponse, skipping ORM objects, Pydantic validation and
+FastAPI's jsonable_encoder. orjson encodes dates, datetimes and enums
+natively; without it the stdlib encoder is used. Decimals (e.g. from SQL
+arithmetic) are sent as numbers, as Pydantic's float fields would.
+"""
+import json
+from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum
+from fastapi.responses import Response
+
+try:
+    import orjson
+except ImportError:  # Optional: falls back to the (slower) stdlib encoder
+    orjson = None
+
+
+def _default(value):
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, Decimal):
+        return float(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps(content) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(content, default=_default)
+    return json.dumps(content, default=_default, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+class FastJSONResponse(Response):
+    """
+    JSON response for content that is already JSON-ready (dicts, lists,
+    scalars, dates, enums). Nothing is validated against a response_model.
+    """
+    media_type = "application/json"
+
+    def render(self, content) -> bytes:
+        return dumps(content)
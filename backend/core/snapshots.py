@@ -0,0 +1,65 @@
+import logging
+from datetime import date
+from sqlalchemy import select, func, literal, Date
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from database import AsyncSessionLocal
+from models.project import Project, ProjectStatus
+from models.snapshot import ProjectSnapshot
+from models.task import Task, TaskStatus
+
+logger = logging.getLogger(__name__)
+
+# Projects in these states no longer get daily snapshots
+CLOSED_PROJECT_STATUSES = [ProjectStatus.COMPLETED, ProjectStatus.CANCELLED]
+
+
+async def take_project_snapshots(db: AsyncSession, snapshot_date: date | None = None) -> int:
+    """
+    Write (or refresh) one snapshot per active project for snapshot_date in a
+    single INSERT ... SELECT. Returns the number of rows written.
+    """
+    snapshot_date = snapshot_date or date.today()
+
+    def status_count(status: TaskStatus):
+        return func.count(Task.id).filter(Task.status == status)
+
+    source = (
+        select(
+            Project.id,
+            literal(snapshot_date, Date),
+            status_count(TaskStatus.TODO),
+            status_count(TaskStatus.IN_PROGRESS),
+            status_count(TaskStatus.REVIEW),
+            status_count(TaskStatus.DONE),
+            Project.progress_on(literal(snapshot_date, Date)),
+        )
+        .outerjoin(Task, Task.project_id == Project.id)
+        .where(Project.status.notin_(CLOSED_PROJECT_STATUSES), Project.is_template.is_(False))
+        .group_by(Project.id)
+    )
+    statement = insert(ProjectSnapshot).from_select(
+        [
+            "project_id", "snapshot_date", "todo_tasks", "in_progress_tasks",
+            "review_tasks", "done_tasks", "timeline_percentage",
+        ],
+        source,
+    )
+    # Re-running on the same day overwrites that day's row
+    statement = statement.on_conflict_do_update(
+        index_elements=["project_id", "snapshot_date"],
+        set_={
+            column: statement.excluded[column]
+            for column in ["todo_tasks", "in_progress_tasks", "review_tasks", "done_tasks", "timeline_percentage"]
+        },
+    )
+    result = await db.execute(statement)
+    await db.commit()
+    return result.rowcount
+
+
+async def snapshot_projects_job() -> None:
+    """Scheduled daily."""
+    async with AsyncSessionLocal() as db:
+        written = await take_project_snapshots(db)
+    logger.info("Wrote %d project snapshots", written)
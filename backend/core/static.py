@@ -0,0 +1,181 @@
+import mimetypes
+import os
+from fastapi.staticfiles import StaticFiles
+from starlette.datastructures import Headers
+from starlette.exceptions import HTTPException
+from starlette.responses import FileResponse, Response, StreamingResponse
+
+# Uploaded files are stored under unique UUID names and never rewritten,
+# so clients may cache them forever.
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+# Pre-compressed siblings written at upload time, in order of preference
+ENCODING_SUFFIXES = [("br", ".br"), ("gzip", ".gz")]
+
+READ_CHUNK_SIZE = 64 * 1024
+
+
+def hidden_tmp_path(path: str) -> str:
+    """
+    Temporary name for writing `path` in place: a hidden sibling, which
+    UploadStaticFiles never serves, on the same filesystem so the finished
+    file can be moved into place with os.replace.
+    """
+    directory, name = os.path.split(path)
+    return os.path.join(directory, f".{name}.{os.getpid()}.tmp")
+
+
+def accepted_encodings(accept_encoding: str) -> dict[str, float]:
+    """Content codings from an Accept-Encoding header, mapped to their q-values."""
+    accepted = {}
+    for item in accept_encoding.split(","):
+        coding, *params = [part.strip() for part in item.split(";")]
+        if not coding:
+            continue
+        q = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        accepted[coding.lower()] = q
+    return accepted
+
+
+def preferred_encodings(accept_encoding: str) -> list[str]:
+    """
+    Our pre-compressed encodings the client accepts, best first: by q-value,
+    then in ENCODING_SUFFIXES order. q=0 (explicitly or via `*;q=0`) rules
+    an encoding out.
+    """
+    accepted = accepted_encodings(accept_encoding)
+    ranked = []
+    for preference, (encoding, _) in enumerate(ENCODING_SUFFIXES):
+        q = accepted.get(encoding, accepted.get("*", 0.0))
+        if q > 0:
+            ranked.append((-q, preference, encoding))
+    return [encoding for _, _, encoding in sorted(ranked)]
+
+
+def strong_etag(path: str, stat_result: os.stat_result, encoding: str | None = None) -> str:
+    """
+    Strong ETag for an uploaded file.
+    The stored name is unique per upload and the content is immutable, so the
+    name plus size identifies the bytes exactly; no hashing is required.
+    """
+    name = os.path.basename(path)
+    tag = f"{name}-{stat_result.st_size:x}"
+    if encoding:
+        tag = f"{tag}-{encoding}"
+    return f'"{tag}"'
+
+
+def parse_range(range_header: str, file_size: int) -> tuple[int, int] | None:
+    """
+    Parse a single-range `bytes=` header into an inclusive (start, end) pair.
+    Returns None for syntax we don't serve (multiple ranges, other units),
+    in which case the full file is sent. Raises ValueError if unsatisfiable.
+    """
+    unit, _, spec = range_header.partition("=")
+    if unit.strip().lower() != "bytes" or "," in spec:
+        return None
+    start_str, sep, end_str = spec.strip().partition("-")
+    if not sep or not (start_str + end_str).isdigit():
+        return None
+    if start_str == "":
+        # Suffix range: last N bytes
+        length = int(end_str)
+        if length == 0:
+            raise ValueError("Unsatisfiable range")
+        return max(file_size - length, 0), file_size - 1
+    start = int(start_str)
+    end = int(end_str) if end_str else file_size - 1
+    if start >= file_size or start > end:
+        raise ValueError("Unsatisfiable range")
+    return start, min(end, file_size - 1)
+
+
+def iter_file_range(path: str, start: int, end: int):
+    with open(path, "rb") as fh:
+        fh.seek(start)
+        remaining = end - start + 1
+        while remaining > 0:
+            data = fh.read(min(READ_CHUNK_SIZE, remaining))
+            if not data:
+                break
+            remaining -= len(data)
+            yield data
+
+
+class UploadStaticFiles(StaticFiles):
+    """
+    StaticFiles for the uploads directory.
+    Adds immutable caching, strong ETags with If-None-Match handling,
+    single-range requests and pre-compressed (br/gzip) siblings.
+    """
+
+    async def get_response(self, path: str, scope) -> Response:
+        # Hidden entries (sidecar metadata, caches) are never served
+        if any(part.startswith(".") for part in path.replace("\\", "/").split("/") if part):
+            raise HTTPException(status_code=404)
+        return await super().get_response(path, scope)
+
+    def file_response(self, full_path, stat_result: os.stat_result, scope, status_code: int = 200) -> Response:
+        full_path = str(full_path)
+        request_headers = Headers(scope=scope)
+        media_type = mimetypes.guess_type(full_path)[0] or "application/octet-stream"
+        range_header = request_headers.get("range")
+
+        # Serve a pre-compressed sibling when the client accepts it. Range requests
+        # always get the identity encoding so byte offsets refer to the real file.
+        encoding = None
+        serve_path, serve_stat = full_path, stat_result
+        if not range_header:
+            suffixes = dict(ENCODING_SUFFIXES)
+            for candidate in preferred_encodings(request_headers.get("accept-encoding", "")):
+                try:
+                    serve_stat = os.stat(full_path + suffixes[candidate])
+                except FileNotFoundError:
+                    continue
+                encoding, serve_path = candidate, full_path + suffixes[candidate]
+                break
+
+        etag = strong_etag(full_path, stat_result, encoding)
+        headers = {
+            "Cache-Control": IMMUTABLE_CACHE_CONTROL,
+            "ETag": etag,
+            "Accept-Ranges": "bytes",
+        }
+        if any(os.path.exists(full_path + suffix) for _, suffix in ENCODING_SUFFIXES):
+            headers["Vary"] = "Accept-Encoding"
+
+        if_none_match = request_headers.get("if-none-match")
+        if if_none_match and (if_none_match.strip() == "*" or etag in [t.strip() for t in if_none_match.split(",")]):
+            return Response(status_code=304, headers=headers)
+
+        if encoding:
+            headers["Content-Encoding"] = encoding
+            return FileResponse(serve_path, status_code=status_code, headers=headers,
+                                media_type=media_type, stat_result=serve_stat)
+
+        file_size = stat_result.st_size
+        if_range = request_headers.get("if-range")
+        if range_header and (not if_range or if_range.strip() == etag):
+            try:
+                byte_range = parse_range(range_header, file_size)
+            except ValueError:
+                return Response(status_code=416, headers={**headers, "Content-Range": f"bytes */{file_size}"})
+            if byte_range is not None:
+                start, end = byte_range
+                headers["Content-Range"] = f"bytes {start}-{end}/{file_size}"
+                headers["Content-Length"] = str(end - start + 1)
+                if scope["method"] == "HEAD":
+                    # FileResponse skips the body for HEAD itself; StreamingResponse doesn't
+                    return Response(status_code=206, headers=headers, media_type=media_type)
+                return StreamingResponse(iter_file_range(full_path, start, end), status_code=206,
+                                         headers=headers, media_type=media_type)
+
+        return FileResponse(full_path, status_code=status_code, headers=headers,
+                            media_type=media_type, stat_result=stat_result)
@@ -0,0 +1,95 @@
+"""
+Task hierarchy stored as a materialized path.
+
+Each task's `path` holds its ancestors' IDs followed by its own, e.g.
+"12/45/97/" for task 97 under 45 under 12. The column uses the "C"
+collation, so a whole subtree is one range scan of ix_tasks_path and a
+reparent is one UPDATE over the moved subtree. Paths of new tasks are set
+by the tasks_set_path trigger.
+"""
+import zlib
+from sqlalchemy import select, update, func, literal, and_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.attributes import set_committed_value
+from models.task import Task
+
+PATH_SEPARATOR = "/"
+# Deepest nesting allowed (1 = top-level task); also bounds path length
+MAX_TASK_DEPTH = 6
+
+
+class TaskTreeError(Exception):
+    """Invalid change to the task hierarchy."""
+
+
+def path_depth(path: str) -> int:
+    return path.count(PATH_SEPARATOR)
+
+
+def _subtree_end(path: str) -> str:
+    # Smallest string above every path starting with `path` ("/" sorts just before "0")
+    return path[:-1] + chr(ord(PATH_SEPARATOR) + 1)
+
+
+def in_subtree(path: str):
+    """Filter for the task with `path` and all of its descendants."""
+    return and_(Task.path >= path, Task.path < _subtree_end(path))
+
+
+def descendants_of(path: str):
+    """Filter for the descendants of the task with `path`, excluding the task itself."""
+    return and_(Task.path > path, Task.path < _subtree_end(path))
+
+
+async def subtree_status_counts(db: AsyncSession, path: str) -> dict:
+    """Number of descendants per status, from one indexed range scan."""
+    result = await db.execute(
+        select(Task.status, func.count())
+        .where(descendants_of(path))
+        .group_by(Task.status)
+    )
+    return dict(result.all())
+
+
+async def lock_project_tree(db: AsyncSession, project_id: int) -> None:
+    """Serialize hierarchy changes within a project until the transaction ends."""
+    key = zlib.crc32(f"task_tree:{project_id}".encode())
+    await db.execute(select(func.pg_advisory_xact_lock(key)))
+
+
+async def move_subtree(db: AsyncSession, task: Task, parent_id: int | None) -> None:
+    """
+    Rewrite the paths of `task` and its descendants for a move under
+    `parent_id` (None = top level). Writes only the moved subtree's rows;
+    the caller sets task.parent_id and commits.
+    """
+    await lock_project_tree(db, task.project_id)
+    # Re-read under the lock; an earlier move may have changed either path
+    old_path = (await db.execute(select(Task.path).where(Task.id == task.id))).scalar_one()
+    new_path = f"{task.id}{PATH_SEPARATOR}"
+    if parent_id is not None:
+        parent = (await db.execute(
+            select(Task.path, Task.project_id).where(Task.id == parent_id)
+        )).one_or_none()
+        if parent is None or parent.project_id != task.project_id:
+            raise TaskTreeError("Parent task must be in the same project")
+        if parent.path.startswith(old_path):
+            raise TaskTreeError("A task cannot be moved under itself or one of its subtasks")
+        new_path = parent.path + new_path
+
+    deepest = (await db.execute(
+        select(func.max(func.length(Task.path) - func.length(func.replace(Task.path, PATH_SEPARATOR, ""))))
+        .where(in_subtree(old_path))
+    )).scalar()
+    if deepest - path_depth(old_path) + path_depth(new_path) > MAX_TASK_DEPTH:
+        raise TaskTreeError(f"Subtasks can be nested at most {MAX_TASK_DEPTH} levels deep")
+
+    if new_path != old_path:
+        await db.execute(
+            update(Task)
+            .where(in_subtree(old_path))
+            .values(path=literal(new_path) + func.substr(Task.path, len(old_path) + 1))
+            .execution_options(synchronize_session=False)
+        )
+        # Keep the loaded task in step without re-reading it
+        set_committed_value(task, "path", new_path)
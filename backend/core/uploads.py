@@ -0,0 +1,265 @@
+import fcntl
+import gzip
+import json
+import logging
+import os
+import shutil
+import time
+import uuid
+
+from core.images import is_image, generate_renditions
+from core.static import hidden_tmp_path
+from core.workers import get_process_pool
+
+try:
+    import brotli
+except ImportError:  # Optional: only gzip siblings are written without it
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+# Root directory for uploaded files (served under /static)
+UPLOAD_DIR = "uploads"
+
+# Resumable upload sessions keep their state here, outside the served tree.
+# Must be on the same filesystem as UPLOAD_DIR so finalizing is a rename.
+PARTIAL_DIR = os.getenv("UPLOAD_PARTIAL_DIR", "uploads_partial")
+
+# Limits for resumable uploads (overridable via env)
+MAX_UPLOAD_SIZE = int(os.getenv("MAX_UPLOAD_SIZE", str(1024 * 1024 * 1024)))  # 1 GiB
+MAX_CHUNK_SIZE = int(os.getenv("MAX_UPLOAD_CHUNK_SIZE", str(8 * 1024 * 1024)))  # 8 MiB
+SESSION_TTL_SECONDS = int(os.getenv("UPLOAD_SESSION_TTL_SECONDS", str(24 * 60 * 60)))
+
+# Text-like documents get pre-compressed siblings (<name>.gz / <name>.br)
+COMPRESSIBLE_EXTENSIONS = {
+    ".txt", ".csv", ".json", ".xml", ".html", ".htm", ".md", ".svg", ".css", ".js", ".rtf", ".log",
+}
+# Only keep a compressed sibling if it saves at least this fraction of the size
+MIN_COMPRESSION_SAVING = 0.1
+
+os.makedirs(UPLOAD_DIR, exist_ok=True)
+os.makedirs(PARTIAL_DIR, exist_ok=True)
+
+
+class UploadSessionError(Exception):
+    """Raised when an upload session is missing or used inconsistently."""
+
+
+def new_stored_filename(original_filename: str | None) -> str:
+    """Generate a unique filename that keeps the original extension."""
+    file_extension = os.path.splitext(original_filename or "")[1]
+    return f"{uuid.uuid4()}{file_extension}"
+
+
+def _state_path(upload_id: str) -> str:
+    return os.path.join(PARTIAL_DIR, f"{upload_id}.json")
+
+
+def _data_path(upload_id: str) -> str:
+    return os.path.join(PARTIAL_DIR, f"{upload_id}.part")
+
+
+def _validate_upload_id(upload_id: str) -> None:
+    # Upload ids are UUID4 hex strings; reject anything else before touching the filesystem
+    try:
+        uuid.UUID(hex=upload_id)
+    except ValueError:
+        raise UploadSessionError("Upload session not found")
+
+
+def create_session(filename: str, total_size: int, owner_id: int, content_type: str | None = None) -> dict:
+    """
+    Create a resumable upload session.
+    The data file is created empty; chunks are written into it at their offsets.
+    """
+    upload_id = uuid.uuid4().hex
+    state = {
+        "upload_id": upload_id,
+        "filename": filename,
+        "content_type": content_type,
+        "total_size": total_size,
+        "owner_id": owner_id,
+        "created_at": time.time(),
+    }
+    with open(_data_path(upload_id), "wb"):
+        pass
+    _write_state(state)
+    return state
+
+
+def _write_state(state: dict) -> None:
+    # Write-then-rename so a crash never leaves a truncated state file behind
+    path = _state_path(state["upload_id"])
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w") as fh:
+        json.dump(state, fh)
+    os.replace(tmp_path, path)
+
+
+def load_session(upload_id: str) -> dict:
+    """Load session state from disk, including the current committed offset."""
+    _validate_upload_id(upload_id)
+    try:
+        with open(_state_path(upload_id)) as fh:
+            state = json.load(fh)
+        # The data file size is the source of truth for how much has been received
+        state["offset"] = os.path.getsize(_data_path(upload_id))
+    except (FileNotFoundError, json.JSONDecodeError):
+        raise UploadSessionError("Upload session not found")
+    return state
+
+
+class OffsetMismatchError(UploadSessionError):
+    """Raised when a chunk does not start at the session's current offset."""
+
+    def __init__(self, expected: int):
+        super().__init__(f"Chunk must start at offset {expected}")
+        self.expected = expected
+
+
+def write_chunk(upload_id: str, offset: int, data: bytes, total_size: int) -> int:
+    """
+    Write a chunk at the given offset and return the new offset.
+    The file lock makes the offset check safe across workers.
+    """
+    try:
+        fd = os.open(_data_path(upload_id), os.O_WRONLY)
+    except FileNotFoundError:
+        raise UploadSessionError("Upload session not found")
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        current = os.fstat(fd).st_size
+        if offset != current:
+            raise OffsetMismatchError(current)
+        if offset + len(data) > total_size:
+            raise UploadSessionError("Chunk exceeds the declared upload size")
+        view = memoryview(data)
+        written = 0
+        while written < len(view):
+            written += os.pwrite(fd, view[written:], offset + written)
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+    return offset + len(data)
+
+
+def finalize_session(upload_id: str) -> str:
+    """
+    Move the completed data file into the upload directory.
+    The parts were written in place, so this is a rename rather than a copy.
+    Returns the stored filename. The data file's lock is held until the
+    session is gone, so a concurrent complete finds no session instead of
+    renaming a file that has already moved.
+    """
+    _validate_upload_id(upload_id)
+    try:
+        fd = os.open(_data_path(upload_id), os.O_RDONLY)
+    except FileNotFoundError:
+        raise UploadSessionError("Upload session not found")
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        state = load_session(upload_id)
+        if state["offset"] != state["total_size"]:
+            raise UploadSessionError(
+                f"Upload incomplete: received {state['offset']} of {state['total_size']} bytes"
+            )
+        stored_filename = new_stored_filename(state["filename"])
+        try:
+            os.replace(_data_path(upload_id), os.path.join(UPLOAD_DIR, stored_filename))
+        except FileNotFoundError:
+            raise UploadSessionError("Upload session not found")  # Aborted while we waited
+        os.remove(_state_path(upload_id))
+    finally:
+        os.close(fd)
+    return stored_filename
+
+
+def abort_session(upload_id: str) -> None:
+    """Discard a session and its partial data."""
+    _validate_upload_id(upload_id)
+    for path in (_data_path(upload_id), _state_path(upload_id)):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+
+def purge_expired_sessions(now: float | None = None) -> int:
+    """
+    Remove sessions older than SESSION_TTL_SECONDS. Returns the number removed.
+    One bad entry never stops the sweep: files that aren't session state are
+    skipped, and sessions that can't be removed are retried on the next run.
+    """
+    now = now or time.time()
+    removed = 0
+    for entry in os.listdir(PARTIAL_DIR):
+        if not entry.endswith(".json"):
+            continue
+        upload_id = entry[: -len(".json")]
+        try:
+            _validate_upload_id(upload_id)
+        except UploadSessionError:
+            logger.warning("Skipping stray file %s in %s", entry, PARTIAL_DIR)
+            continue
+        try:
+            with open(_state_path(upload_id)) as fh:
+                created_at = float(json.load(fh).get("created_at", 0))
+        except (OSError, ValueError, TypeError, AttributeError):
+            created_at = 0  # Unreadable or malformed state counts as expired
+        if now - created_at > SESSION_TTL_SECONDS:
+            try:
+                abort_session(upload_id)
+            except (UploadSessionError, OSError):
+                logger.exception("Failed to remove expired upload session %s", upload_id)
+                continue
+            removed += 1
+    return removed
+
+
+def precompress(file_path: str) -> list[str]:
+    """
+    Write gzip (and brotli, if installed) siblings for text-like files so the
+    static handler can serve them without compressing per request.
+    Returns the paths written.
+    """
+    if os.path.splitext(file_path)[1].lower() not in COMPRESSIBLE_EXTENSIONS:
+        return []
+    original_size = os.path.getsize(file_path)
+    if original_size == 0:
+        return []
+
+    written = []
+    gz_path = f"{file_path}.gz"
+    gz_tmp_path = hidden_tmp_path(gz_path)
+    with open(file_path, "rb") as src, gzip.open(gz_tmp_path, "wb", compresslevel=9) as dst:
+        shutil.copyfileobj(src, dst)
+    written.append(_keep_if_smaller(gz_tmp_path, gz_path, original_size))
+
+    if brotli is not None:
+        br_path = f"{file_path}.br"
+        br_tmp_path = hidden_tmp_path(br_path)
+        compressor = brotli.Compressor(quality=11)
+        with open(file_path, "rb") as src, open(br_tmp_path, "wb") as dst:
+            for block in iter(lambda: src.read(1024 * 1024), b""):
+                dst.write(compressor.process(block))
+            dst.write(compressor.finish())
+        written.append(_keep_if_smaller(br_tmp_path, br_path, original_size))
+
+    return [path for path in written if path]
+
+
+def _keep_if_smaller(tmp_path: str, final_path: str, original_size: int) -> str | None:
+    if os.path.getsize(tmp_path) <= original_size * (1 - MIN_COMPRESSION_SAVING):
+        os.replace(tmp_path, final_path)
+        return final_path
+    os.remove(tmp_path)
+    return None
+
+
+def post_process_upload(stored_filename: str) -> None:
+    """Derived artifacts generated once per upload, after the response is sent."""
+    file_path = os.path.join(UPLOAD_DIR, stored_filename)
+    precompress(file_path)
+    if is_image(stored_filename):
+        # Resizing is CPU-bound; hand it to the process pool and wait from this worker thread
+        get_process_pool().submit(generate_renditions, file_path).result()
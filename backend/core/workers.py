@@ -0,0 +1,30 @@
+import asyncio
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+# CPU-heavy work (image resizing, document text extraction) runs in a process
+# pool so it never blocks the event loop or competes with request handling for the GIL.
+PROCESS_POOL_WORKERS = int(os.getenv("PROCESS_POOL_WORKERS", str(max((os.cpu_count() or 2) // 2, 1))))
+
+_process_pool: ProcessPoolExecutor | None = None
+
+
+def get_process_pool() -> ProcessPoolExecutor:
+    """Return the shared process pool, creating it on first use."""
+    global _process_pool
+    if _process_pool is None:
+        _process_pool = ProcessPoolExecutor(max_workers=PROCESS_POOL_WORKERS)
+    return _process_pool
+
+
+async def run_in_process(func, *args):
+    """Run a picklable function in the process pool from async code."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_process_pool(), func, *args)
+
+
+def shutdown_process_pool() -> None:
+    global _process_pool
+    if _process_pool is not None:
+        _process_pool.shutdown(wait=False, cancel_futures=True)
+        _process_pool = None
@@ -0,0 +1,22 @@
+"""
+Single round-trip writes.
+
+Models mapped with `eager_defaults` (Task, Project, Label, User, TimeEntry,
+TaskComment) get their
+server-generated columns — IDs, created_at, onupdate timestamps and the
+trigger-maintained change_seq and task path — back from the flush's own
+INSERT/UPDATE ... RETURNING. With expire_on_commit=False nothing is
+expired afterwards, so write handlers can serialize the committed object
+without a refresh() SELECT.
+"""
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+async def save(db: AsyncSession, *instances) -> None:
+    """
+    Add `instances` and commit the request's single transaction. Everything
+    else pending in the session (member links, label links, ...) goes in the
+    same flush.
+    """
+    db.add_all(instances)
+    await db.commit()
@@ -0,0 +1,24 @@
+"""
+Index the text of project documents that aren't searchable yet: documents
+linked before search indexing existed, or skipped because their format
+couldn't be read at the time (e.g. PDFs before pypdf was installed).
+Safe to re-run; already indexed documents are left alone.
+
+Usage: python index_documents.py
+"""
+import asyncio
+from core.documents import index_unlinked_documents
+from core.workers import shutdown_process_pool
+from database import engine
+
+
+async def main():
+    try:
+        tried = await index_unlinked_documents()
+        print(f"✅ Indexed documents for up to {tried} project(s); failures are logged")
+    finally:
+        shutdown_process_pool()
+        await engine.dispose()
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,6 +1,5 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.staticfiles import StaticFiles
 import os
 
 from api.v1.auth import router as auth_router
@@ -11,6 +10,21 @@ from api.v1.labels import router as labels_router
 from api.v1.statuses import router as statuses_router
 from api.v1.priorities import router as priorities_router
 from api.v1.files import router as files_router
+from api.v1.events import router as events_router
+from api.v1.sync import router as sync_router
+from api.v1.reports import router as reports_router
+from api.v1.time_entries import router as time_entries_router
+from api.v1.comments import router as comments_router
+from core.uploads import UPLOAD_DIR, purge_expired_sessions
+from core.static import UploadStaticFiles
+from core.workers import shutdown_process_pool
+from core.event_bus import event_bus
+from core.activity import activity_writer, maintain_partitions_job
+from core.scheduler import scheduler
+from core.snapshots import snapshot_projects_job
+from core.reminders import due_reminders_job
+from starlette.concurrency import run_in_threadpool
+from datetime import time
 
 
 app = FastAPI(title="WorkProfit API", version="1.0.0")
@@ -42,10 +56,10 @@ app.add_middleware(
 )
 
 # Create uploads directory if not exists
-os.makedirs("uploads", exist_ok=True)
+os.makedirs(UPLOAD_DIR, exist_ok=True)
 
-# Mount static files
-app.mount("/static", StaticFiles(directory="uploads"), name="static")
+# Mount static files (immutable caching, ETags, Range, pre-compressed siblings)
+app.mount("/static", UploadStaticFiles(directory=UPLOAD_DIR), name="static")
 
 # Include routers
 app.include_router(auth_router, prefix="/api/v1")
@@ -56,8 +70,45 @@ app.include_router(labels_router, prefix="/api/v1")
 app.include_router(statuses_router, prefix="/api/v1")
 app.include_router(priorities_router, prefix="/api/v1")
 app.include_router(files_router, prefix="/api/v1")
+app.include_router(events_router, prefix="/api/v1")
+app.include_router(sync_router, prefix="/api/v1")
+app.include_router(reports_router, prefix="/api/v1")
+app.include_router(time_entries_router, prefix="/api/v1")
+app.include_router(comments_router, prefix="/api/v1")
+
+
+@app.on_event("startup")
+async def startup():
+    # Cross-worker events and cache invalidation over Postgres LISTEN/NOTIFY
+    await event_bus.start()
+    # Task activity is queued by handlers and bulk-inserted in the background
+    await activity_writer.start()
+    # Maintenance jobs; daily ones run once per day across all workers
+    scheduler.daily("project_snapshots", time(0, 5), snapshot_projects_job)
+    scheduler.daily("activity_partitions", time(0, 15), maintain_partitions_job)
+    scheduler.daily("due_reminders", time(8, 0), due_reminders_job)
+    # Upload sessions live on local disk, so every worker/host purges its own
+    scheduler.every(
+        "purge_upload_sessions", 60 * 60,
+        lambda: run_in_threadpool(purge_expired_sessions), exclusive=False
+    )
+    await scheduler.start()
+
+
+@app.on_event("shutdown")
+async def shutdown():
+    await scheduler.stop()
+    await activity_writer.stop()
+    await event_bus.stop()
+    shutdown_process_pool()
 
 
 @app.get("/")
 def read_root():
     return {"message": "Hello from WorkProfit Backend!", "status": "running"}
+
+
+@app.get("/health")
+def health():
+    """Liveness plus counters worth alerting on (e.g. dropped activity entries)."""
+    return {"status": "ok", "activity_log": activity_writer.stats()}
@@ -0,0 +1,29 @@
+from sqlalchemy import Column, BigInteger, Integer, String, Text, DateTime, Identity, Index, PrimaryKeyConstraint, text
+from sqlalchemy.sql import func
+from database import Base
+
+class TaskActivity(Base):
+    """
+    Append-only, field-level history of task changes.
+    Range-partitioned by month on created_at so old history is dropped by
+    detaching a partition instead of deleting rows.
+    """
+    __tablename__ = "task_activity"
+
+    id = Column(BigInteger, Identity(), nullable=False)
+    task_id = Column(Integer, nullable=False)  # No FK: history outlives deleted tasks
+    project_id = Column(Integer, nullable=False)
+    user_id = Column(Integer, nullable=True)
+    action = Column(String, nullable=False)  # created, updated, deleted
+    field = Column(String, nullable=True)
+    old_value = Column(Text, nullable=True)
+    new_value = Column(Text, nullable=True)
+    created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+
+    __table_args__ = (
+        # The partition key must be part of the primary key
+        PrimaryKeyConstraint("id", "created_at"),
+        Index("ix_task_activity_task_feed", "task_id", text("created_at DESC"), text("id DESC")),
+        Index("ix_task_activity_project_feed", "project_id", text("created_at DESC"), text("id DESC")),
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
@@ -0,0 +1,36 @@
+from sqlalchemy import Column, Integer, Text, DateTime, ForeignKey, PrimaryKeyConstraint, Index, text
+from sqlalchemy.sql import func
+from database import Base
+
+class TaskComment(Base):
+    __tablename__ = "task_comments"
+    # Server-generated columns come back from INSERT/UPDATE ... RETURNING, see core/writes.py
+    __mapper_args__ = {"eager_defaults": True}
+
+    id = Column(Integer, primary_key=True, index=True)
+    task_id = Column(Integer, ForeignKey("tasks.id", ondelete="CASCADE"), nullable=False)
+    project_id = Column(Integer, ForeignKey("projects.id", ondelete="CASCADE"), nullable=False)  # Copied from the task
+    author_id = Column(Integer, ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
+    body = Column(Text, nullable=False)
+    created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+
+    __table_args__ = (
+        # Thread pages, newest first
+        Index("ix_task_comments_thread", "task_id", text("created_at DESC"), text("id DESC")),
+        # Unread counts for a whole board
+        Index("ix_task_comments_project", "project_id", "task_id", "created_at"),
+    )
+
+
+class CommentRead(Base):
+    """When a user last read a task's comments; later comments are unread."""
+    __tablename__ = "comment_reads"
+
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    task_id = Column(Integer, ForeignKey("tasks.id", ondelete="CASCADE"), nullable=False)
+    last_read_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+
+    __table_args__ = (
+        PrimaryKeyConstraint("user_id", "task_id"),
+    )
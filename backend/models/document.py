@@ -0,0 +1,18 @@
+from sqlalchemy import Column, String, Text, DateTime, Index, Computed
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.sql import func
+from database import Base
+
+class DocumentText(Base):
+    """Text extracted from an uploaded document, keyed by content hash."""
+    __tablename__ = "document_texts"
+
+    sha256 = Column(String(64), primary_key=True)
+    text = Column(Text, nullable=False)
+    # Maintained by Postgres from `text`; queried with @@ plainto_tsquery
+    search_vector = Column(TSVECTOR, Computed("to_tsvector('english', text)", persisted=True))
+    extracted_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    __table_args__ = (
+        Index("ix_document_texts_search_vector", "search_vector", postgresql_using="gin"),
+    )
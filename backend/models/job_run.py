@@ -0,0 +1,11 @@
+from sqlalchemy import Column, String, Date, DateTime
+from sqlalchemy.sql import func
+from database import Base
+
+class JobRun(Base):
+    """Last completed run of each daily scheduled job, so it runs once per day across workers and restarts."""
+    __tablename__ = "job_runs"
+
+    name = Column(String, primary_key=True)
+    last_run_on = Column(Date, nullable=False)  # The scheduled day that was last handled
+    finished_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
@@ -1,6 +1,7 @@
 from sqlalchemy import Column, Integer, String, ForeignKey, Table
 from sqlalchemy.orm import relationship
 from database import Base
+from models.sync import change_seq_column, change_xid_column
 
 # Association table for Task-Label many-to-many relationship
 task_labels = Table(
@@ -12,10 +13,14 @@ task_labels = Table(
 
 class Label(Base):
     __tablename__ = "labels"
+    # Server-generated columns come back from INSERT/UPDATE ... RETURNING, see core/writes.py
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String, unique=True, index=True, nullable=False)
     color = Column(String, default="#3B82F6")  # Default blue
+    change_seq = change_seq_column()
+    change_xid = change_xid_column()
     
     # Relationship
     tasks = relationship("Task", secondary=task_labels, back_populates="labels")
@@ -1,9 +1,11 @@
-from sqlalchemy import Column, Integer, String, Text, ForeignKey, Date, DateTime, Enum, Table
+from sqlalchemy import Column, Integer, String, Text, Boolean, ForeignKey, Date, DateTime, Enum, Table, Float, case, cast, false, select
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from datetime import datetime, date
 import enum
 from database import Base
+from models.sync import change_seq_column, change_xid_column
 
 class ProjectStatus(str, enum.Enum):
     PLANNING = "PLANNING"
@@ -18,11 +20,15 @@ project_members = Table(
     Base.metadata,
     Column('project_id', Integer, ForeignKey('projects.id', ondelete="CASCADE"), primary_key=True),
     Column('user_id', Integer, ForeignKey('users.id', ondelete="CASCADE"), primary_key=True),
-    Column('joined_at', DateTime(timezone=True), server_default=func.now())
+    Column('joined_at', DateTime(timezone=True), server_default=func.now()),
+    change_seq_column(),
+    change_xid_column()
 )
 
 class Project(Base):
     __tablename__ = "projects"
+    # Server-generated columns come back from INSERT/UPDATE ... RETURNING, see core/writes.py
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String, nullable=False)
@@ -32,12 +38,16 @@ class Project(Base):
     client_id = Column(Integer, ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
     team_lead_id = Column(Integer, ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
     
-    start_date = Column(Date, nullable=False)
-    end_date = Column(Date, nullable=False)
-    status = Column(Enum(ProjectStatus), default=ProjectStatus.PLANNING)
+    start_date = Column(Date, nullable=False, index=True)
+    end_date = Column(Date, nullable=False, index=True)
+    status = Column(Enum(ProjectStatus), default=ProjectStatus.PLANNING, index=True)
     document_url = Column(String, nullable=True)  # Path to uploaded document
+    document_sha256 = Column(String(64), nullable=True, index=True)  # Set once the document text is indexed
+    is_template = Column(Boolean, nullable=False, default=False, server_default=false(), index=True)  # Blueprint for POST /projects/{id}/clone
     
     created_at = Column(DateTime(timezone=True), server_default=func.now())
+    change_seq = change_seq_column()
+    change_xid = change_xid_column()
     
     # Relationships
     client = relationship("User", foreign_keys=[client_id], backref="client_projects")
@@ -53,7 +63,7 @@ class Project(Base):
     # One-to-many relationship with Tasks
     tasks = relationship("Task", back_populates="project", cascade="all, delete-orphan")
     
-    @property
+    @hybrid_property
     def progress_percentage(self) -> float:
         """
         Calculate project progress based on time elapsed.
@@ -80,13 +90,33 @@ class Project(Base):
         # Calculate percentage (capped at 100)
         progress = (elapsed_days / total_days) * 100
         return min(progress, 100.0)
+
+    @progress_percentage.expression
+    def progress_percentage(cls):
+        return cls.progress_on(func.current_date())
+
+    @classmethod
+    def progress_on(cls, day):
+        """SQL version of progress_percentage as of `day` (a SQL date expression)."""
+        total_days = cls.end_date - cls.start_date
+        return case(
+            (day < cls.start_date, 0.0),
+            (day > cls.end_date, 100.0),
+            (total_days == 0, 0.0),
+            else_=func.least(cast(day - cls.start_date, Float) * 100 / total_days, 100.0),
+        )
     
-    @property
+    @hybrid_property
     def duration_days(self) -> int:
         """Total duration of the project in days."""
         return (self.end_date - self.start_date).days
 
-    @property
+    @duration_days.expression
+    def duration_days(cls):
+        # date - date is an integer number of days in Postgres
+        return cls.end_date - cls.start_date
+
+    @hybrid_property
     def time_used(self) -> int:
         """
         Time used in days (Elapsed time).
@@ -98,3 +128,17 @@ class Project(Base):
         if today > self.end_date:
             return self.duration_days
         return (today - self.start_date).days
+
+    @time_used.expression
+    def time_used(cls):
+        today = func.current_date()
+        return case(
+            (today < cls.start_date, 0),
+            (today > cls.end_date, cls.end_date - cls.start_date),
+            else_=today - cls.start_date,
+        )
+
+
+# Blueprints only exist to be cloned; their tasks are left out of reminders,
+# reports, snapshots and task lists that aren't scoped to one project
+TEMPLATE_PROJECT_IDS = select(Project.id).where(Project.is_template.is_(True))
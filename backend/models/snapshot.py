@@ -0,0 +1,27 @@
+from sqlalchemy import Column, Integer, Float, Date, ForeignKey, PrimaryKeyConstraint
+from database import Base
+
+class ProjectSnapshot(Base):
+    """
+    One row per project per day, written by the scheduler.
+    Burndown charts read a range of these instead of recomputing history.
+    """
+    __tablename__ = "project_snapshots"
+
+    project_id = Column(Integer, ForeignKey("projects.id", ondelete="CASCADE"), nullable=False)
+    snapshot_date = Column(Date, nullable=False)
+
+    todo_tasks = Column(Integer, nullable=False, default=0)
+    in_progress_tasks = Column(Integer, nullable=False, default=0)
+    review_tasks = Column(Integer, nullable=False, default=0)
+    done_tasks = Column(Integer, nullable=False, default=0)
+    timeline_percentage = Column(Float, nullable=False, default=0.0)  # Same rule as Project.progress_percentage
+
+    __table_args__ = (
+        # (project_id, snapshot_date) also serves the burndown range scan
+        PrimaryKeyConstraint("project_id", "snapshot_date"),
+    )
+
+    @property
+    def open_tasks(self) -> int:
+        return self.todo_tasks + self.in_progress_tasks + self.review_tasks
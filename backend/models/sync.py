@@ -0,0 +1,48 @@
+from sqlalchemy import Column, BigInteger, Integer, String, DateTime, Identity, FetchedValue, text
+from sqlalchemy.sql import func
+from database import Base
+
+# Every insert/update of a synced row (projects, tasks, labels, project_members)
+# and every delete draws a number from this sequence via database triggers.
+SYNC_CHANGE_SEQUENCE = "sync_change_seq"
+
+# The same triggers stamp the writing transaction's ID (change_xid), which
+# GET /sync uses to tell settled changes from ones that may still be in flight.
+
+
+def change_seq_column() -> Column:
+    """Column holding the row's last change number (maintained by triggers)."""
+    return Column(
+        "change_seq",
+        BigInteger,
+        server_default=text(f"nextval('{SYNC_CHANGE_SEQUENCE}')"),
+        server_onupdate=FetchedValue(),
+        nullable=False,
+        index=True,
+    )
+
+
+def change_xid_column() -> Column:
+    """Column holding the ID of the transaction that last changed the row (maintained by triggers)."""
+    return Column(
+        "change_xid",
+        BigInteger,
+        server_default=text("0"),
+        server_onupdate=FetchedValue(),
+        nullable=False,
+        index=True,
+    )
+
+
+class SyncTombstone(Base):
+    """Record of a deleted synced row, so clients can drop it from their local copy."""
+    __tablename__ = "sync_tombstones"
+
+    id = Column(BigInteger, Identity(), primary_key=True)
+    entity_type = Column(String, nullable=False)  # task, project, label, membership, lead
+    entity_id = Column(Integer, nullable=False)
+    project_id = Column(Integer, nullable=True)
+    user_id = Column(Integer, nullable=True)  # Only for memberships and former team leads
+    change_seq = Column(BigInteger, server_default=text(f"nextval('{SYNC_CHANGE_SEQUENCE}')"), nullable=False, index=True)
+    change_xid = Column(BigInteger, server_default=text("0"), nullable=False, index=True)
+    deleted_at = Column(DateTime(timezone=True), server_default=func.now())
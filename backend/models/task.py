@@ -1,8 +1,9 @@
-from sqlalchemy import Column, Integer, String, Text, ForeignKey, Date, DateTime, Enum
+from sqlalchemy import Column, Integer, String, Text, ForeignKey, Date, DateTime, Enum, Index, FetchedValue, text
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 import enum
 from database import Base
+from models.sync import change_seq_column, change_xid_column
 
 class TaskStatus(str, enum.Enum):
     TODO = "TODO"
@@ -15,8 +16,21 @@ class TaskPriority(str, enum.Enum):
     MEDIUM = "MEDIUM"
     HIGH = "HIGH"
 
+# Open tasks with a due date. Used verbatim by both the partial index and the
+# reminder scan so the planner can match the query to the index.
+OPEN_DUE_TASKS = text("status <> 'DONE' AND due_date IS NOT NULL")
+
 class Task(Base):
     __tablename__ = "tasks"
+    # Server-generated columns come back from INSERT/UPDATE ... RETURNING, see core/writes.py
+    __mapper_args__ = {"eager_defaults": True}
+    __table_args__ = (
+        Index("ix_tasks_open_due", "due_date", "id", postgresql_where=OPEN_DUE_TASKS),
+        # A board column loads in order straight from this index
+        Index("ix_tasks_board_order", "project_id", "status", "rank"),
+        # Subtree lookups are range scans on the path, see core/task_tree.py
+        Index("ix_tasks_path", "path"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String, nullable=False)
@@ -24,14 +38,22 @@ class Task(Base):
     status = Column(Enum(TaskStatus), default=TaskStatus.TODO)
     priority = Column(Enum(TaskPriority), default=TaskPriority.MEDIUM)
     due_date = Column(Date, nullable=True)
+    estimate_days = Column(Integer, nullable=True)  # Planned duration, used for the critical path
+    rank = Column(String(collation="C"), nullable=False)  # Position within its board column, see core/ranking.py
     
     project_id = Column(Integer, ForeignKey("projects.id", ondelete="CASCADE"), nullable=False)
     assignee_id = Column(Integer, ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
+    parent_id = Column(Integer, ForeignKey("tasks.id", ondelete="CASCADE"), nullable=True, index=True)
+    comment_count = Column(Integer, nullable=False, default=0, server_default="0")  # Kept in step by api/v1/comments.py
+    path = Column(String(collation="C"), nullable=False, server_default=FetchedValue())  # Ancestor IDs + own ID, set by the tasks_set_path trigger
     
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    change_seq = change_seq_column()
+    change_xid = change_xid_column()
     
     # Relationships
     project = relationship("Project", back_populates="tasks")
     assignee = relationship("User", backref="assigned_tasks")
-    labels = relationship("Label", secondary="task_labels", back_populates="tasks")
+    # Loaded with one batched query per task query, so TaskResponse always has them
+    labels = relationship("Label", secondary="task_labels", back_populates="tasks", lazy="selectin")
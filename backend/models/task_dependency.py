@@ -0,0 +1,18 @@
+from sqlalchemy import Column, Integer, DateTime, ForeignKey, CheckConstraint, PrimaryKeyConstraint, Index
+from sqlalchemy.sql import func
+from database import Base
+
+class TaskDependency(Base):
+    """blocker_id must be finished before blocked_id can start."""
+    __tablename__ = "task_dependencies"
+
+    blocker_id = Column(Integer, ForeignKey("tasks.id", ondelete="CASCADE"), nullable=False)
+    blocked_id = Column(Integer, ForeignKey("tasks.id", ondelete="CASCADE"), nullable=False)
+    project_id = Column(Integer, ForeignKey("projects.id", ondelete="CASCADE"), nullable=False, index=True)  # Copied from the tasks
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    __table_args__ = (
+        PrimaryKeyConstraint("blocker_id", "blocked_id"),
+        CheckConstraint("blocker_id <> blocked_id", name="ck_task_dependencies_not_self"),
+        Index("ix_task_dependencies_blocked", "blocked_id", "blocker_id"),
+    )
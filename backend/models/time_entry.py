@@ -0,0 +1,45 @@
+from sqlalchemy import Column, BigInteger, Integer, String, Boolean, Date, DateTime, Numeric, ForeignKey, CheckConstraint, PrimaryKeyConstraint, Index
+from sqlalchemy.sql import func
+from database import Base
+
+class TimeEntry(Base):
+    __tablename__ = "time_entries"
+    # Server-generated columns come back from INSERT/UPDATE ... RETURNING, see core/writes.py
+    __mapper_args__ = {"eager_defaults": True}
+
+    id = Column(Integer, primary_key=True, index=True)
+    task_id = Column(Integer, ForeignKey("tasks.id", ondelete="CASCADE"), nullable=False, index=True)
+    project_id = Column(Integer, ForeignKey("projects.id", ondelete="CASCADE"), nullable=False)  # Copied from the task
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
+    entry_date = Column(Date, nullable=False)
+    minutes = Column(Integer, nullable=False)
+    billable = Column(Boolean, nullable=False, default=True)
+    hourly_rate = Column(Numeric(10, 2), nullable=True)  # Billable rate for this entry
+    note = Column(String, nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    __table_args__ = (
+        CheckConstraint("minutes > 0", name="ck_time_entries_minutes_positive"),
+        Index("ix_time_entries_user_date", "user_id", "entry_date"),
+    )
+
+
+class TimeRollup(Base):
+    """
+    Monthly totals of time entries per task, project and user.
+    Maintained by a trigger on time_entries (see migration), so reports
+    never sum raw entries.
+    """
+    __tablename__ = "time_rollups"
+
+    scope = Column(String, nullable=False)  # task, project, user
+    scope_id = Column(Integer, nullable=False)
+    month = Column(Date, nullable=False)  # First day of the month
+    entry_count = Column(Integer, nullable=False, default=0)
+    total_minutes = Column(BigInteger, nullable=False, default=0)
+    billable_minutes = Column(BigInteger, nullable=False, default=0)
+    billable_amount = Column(Numeric(14, 2), nullable=False, default=0)
+
+    __table_args__ = (
+        PrimaryKeyConstraint("scope", "scope_id", "month"),
+    )
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, Enum
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, Enum, Index, literal_column, text
 from sqlalchemy.sql import func
 from database import Base
 import enum
@@ -19,8 +19,20 @@ class Department(str, enum.Enum):
     SUPPORT = "SUPPORT"
     HR = "HR"
 
+# Text searched by /users/lookup. The trigram index is built on this exact
+# expression so the planner can match lookups to it.
+USER_SEARCH_TEXT = literal_column("lower(first_name || ' ' || last_name || ' ' || email)", String)
+
 class User(Base):
     __tablename__ = "users"
+    # Server-generated columns come back from INSERT/UPDATE ... RETURNING, see core/writes.py
+    __mapper_args__ = {"eager_defaults": True}
+    __table_args__ = (
+        Index(
+            "ix_users_search_trgm", text("lower(first_name || ' ' || last_name || ' ' || email) gin_trgm_ops"),
+            postgresql_using="gin", postgresql_where=text("is_active"),
+        ),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     email = Column(String, unique=True, index=True, nullable=False)
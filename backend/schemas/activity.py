@@ -0,0 +1,23 @@
+from pydantic import BaseModel
+from typing import List
+from datetime import datetime
+
+
+class ActivityResponse(BaseModel):
+    id: int
+    task_id: int
+    project_id: int
+    user_id: int | None
+    action: str
+    field: str | None
+    old_value: str | None
+    new_value: str | None
+    created_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
+class ActivityPage(BaseModel):
+    items: List[ActivityResponse]
+    next_cursor: str | None = None  # Pass as `cursor` to fetch older entries
@@ -0,0 +1,34 @@
+from pydantic import BaseModel, Field
+from typing import Dict, List
+from datetime import datetime
+
+
+class CommentCreate(BaseModel):
+    body: str = Field(min_length=1, max_length=10000)
+
+
+class CommentUpdate(BaseModel):
+    body: str = Field(min_length=1, max_length=10000)
+
+
+class CommentResponse(BaseModel):
+    id: int
+    task_id: int
+    project_id: int
+    author_id: int | None
+    body: str
+    created_at: datetime
+    updated_at: datetime | None = None
+
+    class Config:
+        from_attributes = True
+
+
+class CommentPage(BaseModel):
+    items: List[CommentResponse]
+    next_cursor: str | None = None  # Pass as `cursor` to fetch older comments
+
+
+class UnreadComments(BaseModel):
+    project_id: int
+    counts: Dict[int, int]  # task_id -> unread comments; tasks with none are omitted
@@ -0,0 +1,34 @@
+from pydantic import BaseModel
+from typing import List
+from datetime import date
+
+
+class TaskDependencyCreate(BaseModel):
+    blocker_id: int  # Task that must finish first
+
+
+class TaskDependencies(BaseModel):
+    task_id: int
+    blocked_by: List[int]
+    blocks: List[int]
+
+
+class ScheduledTask(BaseModel):
+    task_id: int
+    title: str
+    duration_days: int
+    earliest_start: date
+    earliest_finish: date
+    latest_start: date
+    latest_finish: date
+    slack_days: int
+    critical: bool
+
+
+class CriticalPathReport(BaseModel):
+    project_id: int
+    start_date: date
+    finish_date: date  # Earliest possible finish given estimates and dependencies
+    duration_days: int
+    critical_path: List[int]  # Task IDs in order, each blocking the next
+    tasks: List[ScheduledTask]  # In topological order
@@ -0,0 +1,21 @@
+from pydantic import BaseModel, Field
+
+
+class FileUploadResponse(BaseModel):
+    url: str
+    filename: str
+
+
+class UploadSessionCreate(BaseModel):
+    """Start a resumable upload for a file of known size."""
+    filename: str
+    total_size: int = Field(gt=0)
+    content_type: str | None = None
+
+
+class UploadSessionResponse(BaseModel):
+    upload_id: str
+    filename: str
+    total_size: int
+    offset: int  # Number of bytes received so far; the next chunk must start here
+    max_chunk_size: int
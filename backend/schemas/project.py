@@ -1,6 +1,7 @@
-from pydantic import BaseModel, model_validator, field_validator
-from typing import Literal, List, Optional
+from pydantic import BaseModel, computed_field, model_validator, field_validator
+from typing import Dict, Literal, List, Optional
 from datetime import date, datetime
+from core.images import avatar_rendition_url
 
 ProjectStatusType = Literal["PLANNING", "IN_PROGRESS", "ON_HOLD", "COMPLETED", "CANCELLED"]
 
@@ -12,6 +13,13 @@ class UserBrief(BaseModel):
     last_name: str
     email: str
     role: str
+    avatar_url: str | None = None
+
+    @computed_field
+    @property
+    def avatar_thumbnail_url(self) -> str | None:
+        """Small avatar rendition for member chips."""
+        return avatar_rendition_url(self.avatar_url)
     
     class Config:
         from_attributes = True
@@ -26,6 +34,7 @@ class ProjectCreate(BaseModel):
     end_date: date
     status: ProjectStatusType = "PLANNING"
     document_url: str | None = None
+    is_template: bool = False
     member_ids: List[int] = []  # List of user IDs to add as members
     
     @model_validator(mode='after')
@@ -51,6 +60,7 @@ class ProjectUpdate(BaseModel):
     end_date: date | None = None
     status: ProjectStatusType | None = None
     document_url: str | None = None
+    is_template: bool | None = None
     member_ids: List[int] | None = None  # Update member list
     
     @model_validator(mode='after')
@@ -77,6 +87,7 @@ class ProjectResponse(BaseModel):
     end_date: date
     status: str
     document_url: str | None
+    is_template: bool = False
     created_at: datetime
     progress_percentage: float | None = None  # Computed property
     duration_days: int | None = None  # Computed property
@@ -92,6 +103,33 @@ class ProjectResponse(BaseModel):
         from_attributes = True
 
 
+class ProjectCompact(ProjectResponse):
+    """Project list entry with its users given as IDs."""
+    team_lead: int | None = None
+    client: int | None = None
+    members: List[int] = []
+
+
+class ProjectListCompact(BaseModel):
+    """GET /projects?compact=true: every referenced user appears once in `users`, keyed by ID."""
+    items: List[ProjectCompact]
+    users: Dict[str, UserBrief] = {}
+
+
+class ProjectClone(BaseModel):
+    """Copy a project (typically a template) with its members, tasks and labels."""
+    name: str
+    start_date: date  # Task due dates shift by the same number of days
+    end_date: date | None = None  # Defaults to the source's duration from start_date
+    is_template: bool = False
+
+    @model_validator(mode='after')
+    def validate_timeline(self):
+        if self.end_date and self.end_date <= self.start_date:
+            raise ValueError(f"End date ({self.end_date}) must be after start date ({self.start_date}).")
+        return self
+
+
 class ProjectMemberAdd(BaseModel):
     """Schema for adding members to a project."""
     user_ids: List[int]
@@ -0,0 +1,78 @@
+from pydantic import BaseModel
+from typing import Dict, List
+from datetime import date
+
+
+class DurationStats(BaseModel):
+    """Durations in hours."""
+    p50: float | None = None
+    p85: float | None = None
+    p95: float | None = None
+    avg: float | None = None
+
+
+class FlowMetrics(BaseModel):
+    group_id: int | None  # Project or assignee ID, depending on group_by; None = unassigned
+    completed: int
+    lead_time: DurationStats  # Created -> done
+    cycle_time: DurationStats  # First IN_PROGRESS -> done
+    time_in_status: Dict[str, DurationStats]
+
+
+class FlowReport(BaseModel):
+    start: date
+    end: date
+    group_by: str
+    groups: List[FlowMetrics]
+
+
+class BurndownPoint(BaseModel):
+    snapshot_date: date
+    todo_tasks: int
+    in_progress_tasks: int
+    review_tasks: int
+    done_tasks: int
+    open_tasks: int
+    timeline_percentage: float
+
+    class Config:
+        from_attributes = True
+
+
+class BurndownReport(BaseModel):
+    project_id: int
+    points: List[BurndownPoint]
+
+
+class WorkloadGroup(BaseModel):
+    key: int | str | None  # User ID, department or role depending on group_by; None = unassigned
+    label: str
+    open_tasks: int
+    in_progress_tasks: int
+    overdue_tasks: int
+    due_this_week_tasks: int
+
+
+class WorkloadReport(BaseModel):
+    group_by: str
+    as_of: date
+    groups: List[WorkloadGroup]
+
+
+class ProfitabilityRow(BaseModel):
+    key: int  # Project, task or user ID depending on group_by
+    label: str
+    entry_count: int
+    hours: float
+    billable_hours: float
+    billable_amount: float
+    billable_ratio: float | None = None  # Billable share of logged hours
+
+
+class ProfitabilityReport(BaseModel):
+    start: date  # Rollups are monthly: first day of the first month
+    end: date  # Last day of the last month
+    group_by: str
+    rows: List[ProfitabilityRow]
+    total_hours: float
+    total_billable_amount: float
@@ -0,0 +1,38 @@
+from pydantic import BaseModel
+from typing import List
+from datetime import datetime
+from schemas.task import TaskResponse
+from schemas.project import ProjectResponse
+from schemas.label import LabelResponse
+
+
+class SyncMembership(BaseModel):
+    project_id: int
+    user_id: int
+    joined_at: datetime | None = None
+
+    class Config:
+        from_attributes = True
+
+
+class SyncMembershipKey(BaseModel):
+    project_id: int
+    user_id: int
+
+
+class SyncDeleted(BaseModel):
+    """IDs removed since the cursor; clients drop them from their local copy."""
+    tasks: List[int] = []
+    projects: List[int] = []  # Also projects the user can no longer see, with their tasks
+    labels: List[int] = []
+    memberships: List[SyncMembershipKey] = []
+
+
+class SyncResponse(BaseModel):
+    cursor: str  # Opaque; pass back as `since` on the next call
+    has_more: bool  # True if the page was truncated; call again immediately
+    tasks: List[TaskResponse] = []
+    projects: List[ProjectResponse] = []
+    labels: List[LabelResponse] = []
+    memberships: List[SyncMembership] = []
+    deleted: SyncDeleted = SyncDeleted()
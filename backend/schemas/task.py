@@ -1,7 +1,8 @@
-from pydantic import BaseModel
-from typing import Optional
+from pydantic import BaseModel, Field
+from typing import List, Optional
 from datetime import date, datetime
 from models.task import TaskStatus, TaskPriority
+from schemas.label import LabelResponse
 
 class TaskBase(BaseModel):
     title: str
@@ -9,7 +10,9 @@ class TaskBase(BaseModel):
     status: TaskStatus = TaskStatus.TODO
     priority: TaskPriority = TaskPriority.MEDIUM
     due_date: Optional[date] = None
+    estimate_days: Optional[int] = Field(None, ge=0)
     assignee_id: Optional[int] = None
+    parent_id: Optional[int] = None
 
 class TaskCreate(TaskBase):
     project_id: int
@@ -20,13 +23,49 @@ class TaskUpdate(BaseModel):
     status: Optional[TaskStatus] = None
     priority: Optional[TaskPriority] = None
     due_date: Optional[date] = None
+    estimate_days: Optional[int] = Field(None, ge=0)
     assignee_id: Optional[int] = None
+    parent_id: Optional[int] = None  # null moves the task (and its subtasks) to the top level
 
 class TaskResponse(TaskBase):
     id: int
     project_id: int
+    rank: str
+    comment_count: int = 0
+    labels: List[LabelResponse] = []
     created_at: datetime
     updated_at: Optional[datetime] = None
 
     class Config:
         from_attributes = True
+
+class TaskMove(BaseModel):
+    """Move a card on the board: optionally to another status, between two neighbours."""
+    status: Optional[TaskStatus] = None  # Target column; defaults to the task's current status
+    before_id: Optional[int] = None  # Card that should end up directly above
+    after_id: Optional[int] = None  # Card that should end up directly below
+
+class TaskRollup(BaseModel):
+    """Status counts over all of a task's descendants."""
+    task_id: int
+    total: int
+    todo: int
+    in_progress: int
+    review: int
+    done: int
+    progress_percentage: Optional[float] = None  # Share of descendants that are done; None without subtasks
+
+class TaskLabelsChange(BaseModel):
+    """Bulk label change: every label is added to (or removed from) every task."""
+    task_ids: List[int] = Field(min_length=1, max_length=500)
+    label_ids: List[int] = Field(min_length=1, max_length=50)
+
+class FacetCount(BaseModel):
+    value: int | str | None  # Label ID (None = unlabelled), status or priority
+    count: int
+
+class TaskFacets(BaseModel):
+    total: int
+    labels: List[FacetCount] = []
+    status: List[FacetCount] = []
+    priority: List[FacetCount] = []
@@ -0,0 +1,34 @@
+from pydantic import BaseModel, Field
+from typing import Optional
+from datetime import date, datetime
+from decimal import Decimal
+
+class TimeEntryCreate(BaseModel):
+    task_id: int
+    entry_date: date = Field(default_factory=date.today)
+    minutes: int = Field(gt=0, le=24 * 60)
+    billable: bool = True
+    hourly_rate: Optional[Decimal] = Field(default=None, ge=0, max_digits=10, decimal_places=2)
+    note: Optional[str] = None
+
+class TimeEntryUpdate(BaseModel):
+    entry_date: Optional[date] = None
+    minutes: Optional[int] = Field(default=None, gt=0, le=24 * 60)
+    billable: Optional[bool] = None
+    hourly_rate: Optional[Decimal] = Field(default=None, ge=0, max_digits=10, decimal_places=2)
+    note: Optional[str] = None
+
+class TimeEntryResponse(BaseModel):
+    id: int
+    task_id: int
+    project_id: int
+    user_id: Optional[int] = None
+    entry_date: date
+    minutes: int
+    billable: bool
+    hourly_rate: Optional[Decimal] = None
+    note: Optional[str] = None
+    created_at: datetime
+
+    class Config:
+        from_attributes = True
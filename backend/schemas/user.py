@@ -1,6 +1,7 @@
-from pydantic import BaseModel, EmailStr, model_validator
+from pydantic import BaseModel, EmailStr, computed_field, model_validator
 from typing import Literal
 from datetime import datetime
+from core.images import avatar_rendition_url
 
 # Define allowed roles as Literal type for strict validation
 UserRoleType = Literal["ADMIN", "PROJECT_MANAGER", "TEAM_LEAD", "STAFF", "CLIENT"]
@@ -60,6 +61,7 @@ class UserUpdate(BaseModel):
     role: UserRoleType | None = None
     department: DepartmentType | None = None
     is_active: bool | None = None
+    avatar_url: str | None = None
     
     @model_validator(mode='after')
     def validate_department_for_staff_update(self):
@@ -92,6 +94,19 @@ class UserResponse(BaseModel):
     department: str | None
     is_active: bool
     last_login: datetime | None = None
+    avatar_url: str | None = None
+
+    @computed_field
+    @property
+    def avatar_thumbnail_url(self) -> str | None:
+        """Small avatar rendition for lists and pickers."""
+        return avatar_rendition_url(self.avatar_url)
     
     class Config:
         from_attributes = True
+
+class UserLookup(BaseModel):
+    """Minimal user entry for typeahead pickers."""
+    id: int
+    name: str
+    avatar_url: str | None = None  # Small rendition, ready to display
@@ -0,0 +1,48 @@
+import asyncio
+from datetime import date, datetime, timezone
+from sqlalchemy import insert, select, text
+from database import AsyncSessionLocal
+from models.activity import TaskActivity
+from core.activity import ensure_partitions
+
+# Far enough ahead that no partition exists for it yet
+MONTH = date(2099, 1, 1)
+PARTITION = "task_activity_y2099m01"
+
+
+async def test_partition_adopts_default_rows():
+    """Creating a month whose rows already landed in DEFAULT moves them instead of failing."""
+    async with AsyncSessionLocal() as session:
+        await session.execute(insert(TaskActivity), [{
+            "task_id": 0, "project_id": 0, "user_id": None, "action": "updated", "field": "status",
+            "old_value": "todo", "new_value": "done",
+            "created_at": datetime(2099, 1, 15, 12, tzinfo=timezone.utc),
+        }])
+        await session.commit()
+        stranded = (await session.execute(text("SELECT count(*) FROM task_activity_default"))).scalar()
+        assert stranded >= 1, stranded
+        print("✓ Entry without a partition landed in task_activity_default")
+
+        try:
+            await ensure_partitions(session, extra_months={MONTH})
+            in_month = (await session.execute(text(f"SELECT count(*) FROM {PARTITION}"))).scalar()
+            assert in_month == 1, in_month
+            left = (await session.execute(text(
+                "SELECT count(*) FROM task_activity_default WHERE created_at >= '2099-01-01' AND created_at < '2099-02-01'"
+            ))).scalar()
+            assert left == 0, left
+            total = (await session.execute(select(TaskActivity.id).where(TaskActivity.task_id == 0))).all()
+            assert len(total) == 1, total
+            print(f"✓ {PARTITION} created and the entry moved out of the default partition")
+
+            await ensure_partitions(session, extra_months={MONTH})
+            print("✓ Running again is a no-op")
+        finally:
+            await session.rollback()
+            await session.execute(text(f"DROP TABLE IF EXISTS {PARTITION}"))
+            await session.execute(text("DELETE FROM task_activity WHERE task_id = 0"))
+            await session.commit()
+
+
+if __name__ == "__main__":
+    asyncio.run(test_partition_adopts_default_rows())
@@ -0,0 +1,51 @@
+import asyncio
+import struct
+import zlib
+import httpx
+
+BASE_URL = "http://localhost:8000/api/v1"
+ROOT_URL = "http://localhost:8000"
+
+def make_png(width: int, height: int) -> bytes:
+    """Build a solid-colour RGB PNG without any imaging library."""
+    def chunk(kind: bytes, data: bytes) -> bytes:
+        return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data))
+    raw = b"".join(b"\x00" + b"\x3b\x82\xf6" * width for _ in range(height))
+    header = struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)
+    return b"\x89PNG\r\n\x1a\n" + chunk(b"IHDR", header) + chunk(b"IDAT", zlib.compress(raw)) + chunk(b"IEND", b"")
+
+async def test_avatar_renditions():
+    async with httpx.AsyncClient() as client:
+        # 1. Upload a large avatar
+        original = make_png(1024, 1024)
+        upload_res = await client.post(f"{BASE_URL}/files/upload", files={"file": ("avatar.png", original, "image/png")})
+        assert upload_res.status_code == 200, f"Upload failed: {upload_res.text}"
+        filename = upload_res.json()["url"].rsplit("/", 1)[1]
+        print(f"✅ Avatar uploaded ({filename})")
+
+        # 2. Each size resolves to a small immutable rendition
+        for size in ["xs", "sm", "md", "lg"]:
+            res = await client.get(f"{BASE_URL}/files/avatars/{filename}?size={size}")
+            assert res.status_code == 301, f"Rendition {size} failed: {res.text}"
+            assert "immutable" in res.headers["Cache-Control"]
+            image_res = await client.get(f"{ROOT_URL}{res.headers['Location']}")
+            assert image_res.status_code == 200
+            assert image_res.headers["content-type"] == "image/webp"
+            assert len(image_res.content) < len(original)
+        print("✅ All renditions served")
+
+        # 3. JPEG fallback
+        res = await client.get(f"{BASE_URL}/files/avatars/{filename}?size=sm&format=jpeg")
+        assert res.status_code == 301
+        assert res.headers["Location"].endswith(".sm.jpg")
+        print("✅ JPEG rendition served")
+
+        # 4. Invalid requests
+        res = await client.get(f"{BASE_URL}/files/avatars/{filename}?size=huge")
+        assert res.status_code == 400
+        res = await client.get(f"{BASE_URL}/files/avatars/does-not-exist.png")
+        assert res.status_code == 404
+        print("✅ Invalid size and missing image rejected")
+
+if __name__ == "__main__":
+    asyncio.run(test_avatar_renditions())
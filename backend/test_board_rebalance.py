@@ -0,0 +1,62 @@
+import asyncio
+import uuid
+from datetime import date, timedelta
+from fastapi import BackgroundTasks, HTTPException
+from sqlalchemy import select
+from database import AsyncSessionLocal
+from models.project import Project
+from models.task import Task, TaskStatus
+from models.user import User, UserRole
+from schemas.task import TaskMove
+from api.v1.tasks import move_task
+from core.writes import save
+
+
+async def test_move_after_tied_ranks():
+    """A move between tied cards is refused once, respaces the column, and then succeeds."""
+    async with AsyncSessionLocal() as session:
+        admin = (await session.execute(select(User).where(User.role == UserRole.ADMIN).limit(1))).scalar_one()
+        project = Project(
+            name=f"Rebalance {uuid.uuid4().hex[:6]}",
+            start_date=date.today(),
+            end_date=date.today() + timedelta(days=10),
+        )
+        await save(session, project)
+        tasks = [
+            Task(title=f"Card {i}", project_id=project.id, status=TaskStatus.TODO, rank=rank)
+            for i, rank in enumerate(["V", "V", "X"])  # The first two share a rank
+        ]
+        await save(session, *tasks)
+        first, second, moving = [task.id for task in tasks]
+        project_id = project.id
+
+    async with AsyncSessionLocal() as session:
+        try:
+            await move_task(moving, TaskMove(before_id=first, after_id=second), BackgroundTasks(),
+                            current_user=admin, db=session)
+            raise AssertionError("Move between tied ranks should be refused")
+        except HTTPException as e:
+            assert e.status_code == 409, e.detail
+        print("✓ Move between tied ranks answered 409")
+
+    async with AsyncSessionLocal() as session:
+        ranks = (await session.execute(
+            select(Task.id, Task.rank).where(Task.project_id == project_id).order_by(Task.rank, Task.id)
+        )).all()
+        assert len({rank for _, rank in ranks}) == 3, ranks
+        print("✓ Column respaced before the 409 was returned")
+
+        moved = await move_task(moving, TaskMove(before_id=first, after_id=second), BackgroundTasks(),
+                                current_user=admin, db=session)
+        order = (await session.execute(
+            select(Task.id).where(Task.project_id == project_id).order_by(Task.rank, Task.id)
+        )).scalars().all()
+        assert order == [first, moving, second], order
+        print(f"✓ Retry placed card {moved.id} between its neighbours")
+
+        await session.delete(await session.get(Project, project_id))
+        await session.commit()
+
+
+if __name__ == "__main__":
+    asyncio.run(test_move_after_tied_ranks())
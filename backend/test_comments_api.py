@@ -0,0 +1,96 @@
+import asyncio
+import uuid
+import httpx
+from datetime import date, timedelta
+
+BASE_URL = "http://localhost:8000/api/v1"
+ADMIN_EMAIL = "admin@workprofit.com"
+ADMIN_PASSWORD = "admin123"
+
+async def login(client, email, password):
+    res = await client.post(f"{BASE_URL}/auth/login", json={"email": email, "password": password})
+    assert res.status_code == 200, f"Login failed: {res.text}"
+    return {"Authorization": f"Bearer {res.json()['access_token']}"}
+
+async def test_comments_api():
+    async with httpx.AsyncClient() as client:
+        # 1. Login as admin and create a second user to comment
+        headers = await login(client, ADMIN_EMAIL, ADMIN_PASSWORD)
+        other_email = f"commenter-{uuid.uuid4().hex[:8]}@workprofit.com"
+        user_res = await client.post(f"{BASE_URL}/users/", json={
+            "email": other_email,
+            "password": "commenter123",
+            "first_name": "Comment",
+            "last_name": "Writer",
+            "role": "PROJECT_MANAGER",
+            "department": "ACCOUNT"
+        }, headers=headers)
+        assert user_res.status_code == 201, f"User creation failed: {user_res.text}"
+        other_headers = await login(client, other_email, "commenter123")
+        print("✅ Users ready")
+
+        project_res = await client.post(f"{BASE_URL}/projects/", json={
+            "name": "Comments Project",
+            "start_date": str(date.today()),
+            "end_date": str(date.today() + timedelta(days=30))
+        }, headers=headers)
+        project_id = project_res.json()["id"]
+        task_ids = []
+        for title in ("Discussed", "Quiet"):
+            task_res = await client.post(f"{BASE_URL}/tasks/", json={"title": title, "project_id": project_id}, headers=headers)
+            task_ids.append(task_res.json()["id"])
+        task_id = task_ids[0]
+
+        # 2. Post comments from both users
+        for i in range(3):
+            res = await client.post(f"{BASE_URL}/tasks/{task_id}/comments", json={"body": f"Comment {i}"}, headers=other_headers)
+            assert res.status_code == 201, f"Comment failed: {res.text}"
+        own = await client.post(f"{BASE_URL}/tasks/{task_id}/comments", json={"body": "My reply"}, headers=headers)
+        own_id = own.json()["id"]
+        print("✅ Comments posted")
+
+        # 3. Board listing carries the denormalized count
+        tasks = (await client.get(f"{BASE_URL}/tasks/", params={"project_id": project_id}, headers=headers)).json()
+        counts = {t["id"]: t["comment_count"] for t in tasks}
+        assert counts == {task_ids[0]: 4, task_ids[1]: 0}, counts
+        print("✅ Comment counts on task list")
+
+        # 4. Newest first, walked with a cursor
+        seen, cursor = [], None
+        while True:
+            params = {"limit": 3}
+            if cursor:
+                params["cursor"] = cursor
+            page = (await client.get(f"{BASE_URL}/tasks/{task_id}/comments", params=params, headers=headers)).json()
+            seen.extend(c["body"] for c in page["items"])
+            cursor = page["next_cursor"]
+            if not cursor:
+                break
+        assert seen == ["My reply", "Comment 2", "Comment 1", "Comment 0"], seen
+        print("✅ Thread paginated newest first")
+
+        # 5. Unread counts for the board: the admin's own comment doesn't count
+        unread = (await client.get(f"{BASE_URL}/comments/unread", params={"project_id": project_id}, headers=headers)).json()
+        assert unread["counts"] == {str(task_id): 3}, unread
+        res = await client.post(f"{BASE_URL}/tasks/{task_id}/comments/read", headers=headers)
+        assert res.status_code == 204
+        unread = (await client.get(f"{BASE_URL}/comments/unread", params={"project_id": project_id}, headers=headers)).json()
+        assert unread["counts"] == {}
+        print("✅ Unread counts and read marker")
+
+        # 6. Only the author edits; deleting updates the count
+        res = await client.patch(f"{BASE_URL}/comments/{own_id}", json={"body": "Edited"}, headers=other_headers)
+        assert res.status_code == 403
+        res = await client.patch(f"{BASE_URL}/comments/{own_id}", json={"body": "Edited"}, headers=headers)
+        assert res.status_code == 200 and res.json()["body"] == "Edited"
+        assert (await client.delete(f"{BASE_URL}/comments/{own_id}", headers=headers)).status_code == 204
+        task = (await client.get(f"{BASE_URL}/tasks/{task_id}", headers=headers)).json()
+        assert task["comment_count"] == 3
+        print("✅ Edit and delete")
+
+        # Cleanup
+        await client.delete(f"{BASE_URL}/projects/{project_id}", headers=headers)
+        await client.delete(f"{BASE_URL}/users/{user_res.json()['id']}", headers=headers)
+
+if __name__ == "__main__":
+    asyncio.run(test_comments_api())
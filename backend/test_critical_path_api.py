@@ -0,0 +1,87 @@
+import asyncio
+import httpx
+from datetime import date, timedelta
+
+BASE_URL = "http://localhost:8000/api/v1"
+ADMIN_EMAIL = "admin@workprofit.com"
+ADMIN_PASSWORD = "admin123"
+
+async def test_critical_path_api():
+    async with httpx.AsyncClient() as client:
+        # 1. Login
+        login_res = await client.post(f"{BASE_URL}/auth/login", json={
+            "email": ADMIN_EMAIL,
+            "password": ADMIN_PASSWORD
+        })
+        assert login_res.status_code == 200, f"Login failed: {login_res.text}"
+        headers = {"Authorization": f"Bearer {login_res.json()['access_token']}"}
+        print("✅ Login successful")
+
+        start = date.today()
+        project_res = await client.post(f"{BASE_URL}/projects/", json={
+            "name": "Critical Path Project",
+            "start_date": str(start),
+            "end_date": str(start + timedelta(days=60))
+        }, headers=headers)
+        project_id = project_res.json()["id"]
+
+        async def create(title, estimate):
+            res = await client.post(f"{BASE_URL}/tasks/", json={
+                "title": title,
+                "project_id": project_id,
+                "estimate_days": estimate
+            }, headers=headers)
+            assert res.status_code == 201, f"Create failed: {res.text}"
+            return res.json()["id"]
+
+        async def block(task_id, blocker_id):
+            return await client.post(f"{BASE_URL}/tasks/{task_id}/dependencies", json={"blocker_id": blocker_id}, headers=headers)
+
+        # 2. design(3) -> backend(5) -> release(1), design -> docs(2) -> release
+        design = await create("Design", 3)
+        backend = await create("Backend", 5)
+        docs = await create("Docs", 2)
+        release = await create("Release", 1)
+        for task_id, blocker_id in [(backend, design), (docs, design), (release, backend), (release, docs)]:
+            res = await block(task_id, blocker_id)
+            assert res.status_code == 201, f"Dependency failed: {res.text}"
+        deps = (await client.get(f"{BASE_URL}/tasks/{release}/dependencies", headers=headers)).json()
+        assert set(deps["blocked_by"]) == {backend, docs}
+        print("✅ Dependencies added")
+
+        # 3. Cycles are rejected
+        assert (await block(design, release)).status_code == 409
+        assert (await block(design, design)).status_code == 409
+        print("✅ Cycle rejected")
+
+        # 4. Critical path
+        res = await client.get(f"{BASE_URL}/projects/{project_id}/critical-path", headers=headers)
+        assert res.status_code == 200, f"Critical path failed: {res.text}"
+        report = res.json()
+        assert report["duration_days"] == 9
+        assert report["finish_date"] == str(start + timedelta(days=9))
+        assert report["critical_path"] == [design, backend, release]
+        by_id = {t["task_id"]: t for t in report["tasks"]}
+        assert by_id[docs]["slack_days"] == 3 and not by_id[docs]["critical"]
+        assert by_id[backend]["earliest_start"] == str(start + timedelta(days=3))
+        print("✅ Critical path computed")
+
+        # 5. Changing an estimate invalidates the cached result
+        await client.patch(f"{BASE_URL}/tasks/{docs}", json={"estimate_days": 10}, headers=headers)
+        report = (await client.get(f"{BASE_URL}/projects/{project_id}/critical-path", headers=headers)).json()
+        assert report["critical_path"] == [design, docs, release]
+        assert report["duration_days"] == 14
+        print("✅ Cache invalidated on estimate change")
+
+        # 6. Removing a dependency
+        res = await client.delete(f"{BASE_URL}/tasks/{release}/dependencies/{docs}", headers=headers)
+        assert res.status_code == 204
+        report = (await client.get(f"{BASE_URL}/projects/{project_id}/critical-path", headers=headers)).json()
+        assert report["duration_days"] == 13
+        print("✅ Cache invalidated on dependency removal")
+
+        # Cleanup
+        await client.delete(f"{BASE_URL}/projects/{project_id}", headers=headers)
+
+if __name__ == "__main__":
+    asyncio.run(test_critical_path_api())
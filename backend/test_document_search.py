@@ -0,0 +1,69 @@
+import asyncio
+import uuid
+import httpx
+from datetime import date, timedelta
+
+BASE_URL = "http://localhost:8000/api/v1"
+ADMIN_EMAIL = "admin@workprofit.com"
+ADMIN_PASSWORD = "admin123"
+
+async def test_document_search():
+    async with httpx.AsyncClient() as client:
+        # 1. Login
+        login_res = await client.post(f"{BASE_URL}/auth/login", json={
+            "email": ADMIN_EMAIL,
+            "password": ADMIN_PASSWORD
+        })
+        assert login_res.status_code == 200, f"Login failed: {login_res.text}"
+        headers = {"Authorization": f"Bearer {login_res.json()['access_token']}"}
+        print("✅ Login successful")
+
+        # 2. Upload a document containing a unique keyword
+        keyword = f"zephyr{uuid.uuid4().hex[:8]}"
+        body = f"Requirements for the {keyword} integration.\nPhase one covers onboarding.".encode()
+        upload_res = await client.post(f"{BASE_URL}/files/upload", files={"file": ("brief.txt", body, "text/plain")})
+        assert upload_res.status_code == 200
+        document_url = upload_res.json()["url"]
+        print("✅ Document uploaded")
+
+        # 3. Create a project pointing at the document
+        project_res = await client.post(f"{BASE_URL}/projects/", json={
+            "name": "Document Search Project",
+            "start_date": str(date.today()),
+            "end_date": str(date.today() + timedelta(days=30)),
+            "document_url": document_url
+        }, headers=headers)
+        assert project_res.status_code == 201, f"Create project failed: {project_res.text}"
+        project_id = project_res.json()["id"]
+        assert project_res.json()["document_url"] == document_url
+        print(f"✅ Project created (ID: {project_id})")
+
+        # 4. Indexing runs in the background; poll the search
+        found = False
+        for _ in range(20):
+            search_res = await client.get(f"{BASE_URL}/projects/", params={"q": keyword}, headers=headers)
+            assert search_res.status_code == 200
+            if any(p["id"] == project_id for p in search_res.json()):
+                found = True
+                break
+            await asyncio.sleep(0.25)
+        assert found, "Project was not found by its document text"
+        print("✅ Project found by document text")
+
+        # 5. Unrelated query does not match
+        search_res = await client.get(f"{BASE_URL}/projects/", params={"q": f"nomatch{uuid.uuid4().hex}"}, headers=headers)
+        assert all(p["id"] != project_id for p in search_res.json())
+        print("✅ Unrelated search excludes the project")
+
+        # 6. LIKE wildcards in the query match literally
+        for wildcard in ("%", "_"):
+            search_res = await client.get(f"{BASE_URL}/projects/", params={"q": wildcard}, headers=headers)
+            assert all(p["id"] != project_id for p in search_res.json())
+        print("✅ Wildcards in the query are not treated as patterns")
+
+        # 7. Cleanup
+        await client.delete(f"{BASE_URL}/projects/{project_id}", headers=headers)
+        print("✅ Project cleaned up")
+
+if __name__ == "__main__":
+    asyncio.run(test_document_search())
@@ -0,0 +1,116 @@
+import asyncio
+import email
+import httpx
+from datetime import date, timedelta
+from database import AsyncSessionLocal
+from core.notifiers import SmtpNotifier
+from core.reminders import send_due_reminders
+
+BASE_URL = "http://localhost:8000/api/v1"
+ADMIN_EMAIL = "admin@workprofit.com"
+ADMIN_PASSWORD = "admin123"
+
+
+class LocalSmtpServer:
+    """Just enough SMTP to accept messages in-process, standing in for a real mail server."""
+
+    def __init__(self):
+        self.messages: list[email.message.Message] = []
+        self.server = None
+
+    async def start(self) -> int:
+        self.server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        return self.server.sockets[0].getsockname()[1]
+
+    async def stop(self):
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def _handle(self, reader, writer):
+        def reply(line):
+            writer.write(f"{line}\r\n".encode())
+
+        reply("220 localhost stand-in")
+        while True:
+            line = (await reader.readline()).decode().strip()
+            command = line.split(" ", 1)[0].upper()
+            if command in ("EHLO", "HELO"):
+                reply("250 localhost")
+            elif command in ("MAIL", "RCPT", "RSET", "NOOP"):
+                reply("250 OK")
+            elif command == "DATA":
+                reply("354 End data with <CR><LF>.<CR><LF>")
+                await writer.drain()
+                data = []
+                while (chunk := await reader.readline()) != b".\r\n":
+                    data.append(chunk[1:] if chunk.startswith(b"..") else chunk)
+                self.messages.append(email.message_from_bytes(b"".join(data)))
+                reply("250 Queued")
+            elif command == "QUIT" or not line:
+                reply("221 Bye")
+                await writer.drain()
+                writer.close()
+                return
+            else:
+                reply("502 Not implemented")
+            await writer.drain()
+
+
+async def test_due_reminders():
+    async with httpx.AsyncClient() as client:
+        # 1. Login
+        login_res = await client.post(f"{BASE_URL}/auth/login", json={
+            "email": ADMIN_EMAIL,
+            "password": ADMIN_PASSWORD
+        })
+        assert login_res.status_code == 200, f"Login failed: {login_res.text}"
+        headers = {"Authorization": f"Bearer {login_res.json()['access_token']}"}
+        admin_id = (await client.get(f"{BASE_URL}/auth/me", headers=headers)).json()["id"]
+        print("✅ Login successful")
+
+        # 2. Tasks assigned to the admin: overdue, due tomorrow, far out and done
+        today = date.today()
+        project_res = await client.post(f"{BASE_URL}/projects/", json={
+            "name": "Reminder Project",
+            "start_date": str(today - timedelta(days=30)),
+            "end_date": str(today + timedelta(days=30))
+        }, headers=headers)
+        project_id = project_res.json()["id"]
+        for title, due, status in [
+            ("Reminder overdue", today - timedelta(days=3), "TODO"),
+            ("Reminder tomorrow", today + timedelta(days=1), "IN_PROGRESS"),
+            ("Reminder next month", today + timedelta(days=30), "TODO"),
+            ("Reminder finished", today - timedelta(days=5), "DONE"),
+        ]:
+            await client.post(f"{BASE_URL}/tasks/", json={
+                "title": title, "project_id": project_id, "assignee_id": admin_id,
+                "due_date": str(due), "status": status
+            }, headers=headers)
+
+    # 3. Run the scan against the local SMTP stand-in
+    smtp = LocalSmtpServer()
+    port = await smtp.start()
+    try:
+        async with AsyncSessionLocal() as db:
+            delivered = await send_due_reminders(db, SmtpNotifier(host="127.0.0.1", port=port, user=None))
+    finally:
+        await smtp.stop()
+    assert delivered == len(smtp.messages) >= 1
+    print(f"✅ {delivered} digest(s) delivered over SMTP")
+
+    # 4. The admin gets exactly one digest covering both relevant tasks
+    [digest] = [m for m in smtp.messages if m["To"] == ADMIN_EMAIL]
+    body = digest.get_payload(decode=True).decode()
+    assert "Reminder overdue" in body and "3 days late" in body
+    assert "Reminder tomorrow" in body
+    assert "Reminder next month" not in body and "Reminder finished" not in body
+    print(f"✅ Digest: {digest['Subject']}")
+
+    # Cleanup
+    async with httpx.AsyncClient() as client:
+        login_res = await client.post(f"{BASE_URL}/auth/login", json={"email": ADMIN_EMAIL, "password": ADMIN_PASSWORD})
+        headers = {"Authorization": f"Bearer {login_res.json()['access_token']}"}
+        await client.delete(f"{BASE_URL}/projects/{project_id}", headers=headers)
+
+if __name__ == "__main__":
+    asyncio.run(test_due_reminders())
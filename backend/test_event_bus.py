@@ -0,0 +1,127 @@
+import asyncio
+import json
+import asyncpg
+from core.cache import TTLCache, register_cache
+from core.event_bus import event_bus, _coalesce, _pack, _oversized_fallback, MAX_PAYLOAD_BYTES
+
+# Postgres rejects NOTIFY payloads of this many bytes or more
+NOTIFY_LIMIT_BYTES = 8000
+
+
+def invalidation(cache, key=None):
+    return {"kind": "cache.invalidate", "cache": cache, "key": key}
+
+
+def test_coalesce():
+    messages = [
+        invalidation("projects", 1),
+        {"kind": "push", "project_id": 1, "event": {"type": "task.updated"}},
+        invalidation("projects", 1),
+        invalidation("projects", 2),
+        invalidation("reports", {"a": 1, "b": 2}),
+        invalidation("reports", {"b": 2, "a": 1}),  # Same key, different order
+        {"kind": "push", "project_id": 1, "event": {"type": "task.updated"}},
+    ]
+    assert _coalesce(messages) == [
+        invalidation("projects", 1),
+        {"kind": "push", "project_id": 1, "event": {"type": "task.updated"}},
+        invalidation("projects", 2),
+        invalidation("reports", {"a": 1, "b": 2}),
+        {"kind": "push", "project_id": 1, "event": {"type": "task.updated"}},
+    ]
+    print("✓ Duplicate invalidations coalesced, other messages kept in order")
+
+
+def test_pack_small_burst():
+    messages = [invalidation("projects", i) for i in range(10)]
+    payloads = _pack(messages)
+    assert len(payloads) == 1
+    assert json.loads(payloads[0]) == messages
+    print("✓ A small burst is sent as one payload")
+
+
+def test_pack_splits_under_limit():
+    # Non-ASCII text is escaped in the JSON payload, so it costs more than a byte per character
+    messages = [
+        {"kind": "push", "project_id": i, "event": {"type": "task.updated", "title": "é" * 300}}
+        for i in range(40)
+    ]
+    payloads = _pack(messages)
+    assert len(payloads) > 1
+    for payload in payloads:
+        assert len(payload.encode()) <= MAX_PAYLOAD_BYTES < NOTIFY_LIMIT_BYTES, len(payload.encode())
+    assert [m for payload in payloads for m in json.loads(payload)] == messages
+    print(f"✓ {len(messages)} messages split into {len(payloads)} payloads under {MAX_PAYLOAD_BYTES} bytes")
+
+
+def test_pack_oversized_messages():
+    huge = "x" * NOTIFY_LIMIT_BYTES
+    messages = [
+        invalidation("projects", 1),
+        {"kind": "push", "project_id": 7, "event": {"type": "task.updated", "description": huge}},
+        {"kind": "cache.invalidate", "cache": "projects", "key": huge},
+        invalidation("projects", 2),
+    ]
+    payloads = _pack(messages)
+    assert [m for payload in payloads for m in json.loads(payload)] == [
+        invalidation("projects", 1),
+        {"kind": "push", "project_id": 7, "event": {"type": "resync"}},
+        invalidation("projects", 2),
+    ]
+    assert all(len(payload.encode()) <= MAX_PAYLOAD_BYTES for payload in payloads)
+    print("✓ Oversized push becomes a resync; other oversized messages are dropped")
+
+
+def test_oversized_fallback():
+    push = {"kind": "push", "project_id": 3, "event": {"type": "task.created", "task": {"id": 1}}}
+    assert _oversized_fallback(push) == {"kind": "push", "project_id": 3, "event": {"type": "resync"}}
+    assert _oversized_fallback(invalidation("projects", 1)) is None
+    print("✓ Only push messages have an oversized fallback")
+
+
+def test_reconnected_clears_caches():
+    cache = register_cache("test_event_bus", TTLCache())
+    cache.set("key", "value")
+    event_bus._dispatch({"kind": "bus.reconnected"})
+    assert cache.get("key") is None
+    print("✓ bus.reconnected clears registered caches")
+
+
+async def test_reconnect_clears_caches():
+    """Killing the listener connection makes the bus reconnect and resync its caches."""
+    cache = register_cache("test_event_bus_reconnect", TTLCache())
+    await event_bus.start()
+    try:
+        for _ in range(50):
+            if event_bus.connected:
+                break
+            await asyncio.sleep(0.1)
+        assert event_bus.connected, "Event bus did not connect"
+        cache.set("key", "value")
+
+        pid = event_bus._connection.get_server_pid()
+        admin = await asyncpg.connect(event_bus.dsn)
+        try:
+            await admin.execute("SELECT pg_terminate_backend($1)", pid)
+        finally:
+            await admin.close()
+
+        for _ in range(50):
+            if event_bus.connected and event_bus._connection.get_server_pid() != pid:
+                break
+            await asyncio.sleep(0.1)
+        assert event_bus.connected and event_bus._connection.get_server_pid() != pid, "Event bus did not reconnect"
+        assert cache.get("key") is None
+        print("✓ Reconnecting after a lost connection clears registered caches")
+    finally:
+        await event_bus.stop()
+
+
+if __name__ == "__main__":
+    test_coalesce()
+    test_pack_small_burst()
+    test_pack_splits_under_limit()
+    test_pack_oversized_messages()
+    test_oversized_fallback()
+    test_reconnected_clears_caches()
+    asyncio.run(test_reconnect_clears_caches())
@@ -0,0 +1,91 @@
+import asyncio
+import time
+import uuid
+import httpx
+from datetime import date, timedelta
+
+BASE_URL = "http://localhost:8000/api/v1"
+ADMIN_EMAIL = "admin@workprofit.com"
+ADMIN_PASSWORD = "admin123"
+
+TEMPLATE_TASKS = 200
+
+async def test_project_clone_api():
+    async with httpx.AsyncClient(timeout=60) as client:
+        # 1. Login
+        login_res = await client.post(f"{BASE_URL}/auth/login", json={
+            "email": ADMIN_EMAIL,
+            "password": ADMIN_PASSWORD
+        })
+        assert login_res.status_code == 200, f"Login failed: {login_res.text}"
+        headers = {"Authorization": f"Bearer {login_res.json()['access_token']}"}
+        print("✅ Login successful")
+
+        # 2. A template with an epic, subtasks, a dependency and a label
+        template_start = date(2026, 1, 1)
+        template_res = await client.post(f"{BASE_URL}/projects/", json={
+            "name": "Launch Template",
+            "start_date": str(template_start),
+            "end_date": str(template_start + timedelta(days=30)),
+            "is_template": True
+        }, headers=headers)
+        assert template_res.status_code == 201, f"Template failed: {template_res.text}"
+        template_id = template_res.json()["id"]
+
+        async def create(title, **fields):
+            res = await client.post(f"{BASE_URL}/tasks/", json={"title": title, "project_id": template_id, **fields}, headers=headers)
+            assert res.status_code == 201, f"Create failed: {res.text}"
+            return res.json()["id"]
+        epic = await create("Epic", due_date=str(template_start + timedelta(days=20)))
+        child = await create("Child", parent_id=epic, due_date=str(template_start + timedelta(days=10)))
+        await client.post(f"{BASE_URL}/tasks/{epic}/dependencies", json={"blocker_id": child}, headers=headers)
+        label_id = (await client.post(f"{BASE_URL}/labels/", json={"name": f"launch-{uuid.uuid4().hex[:6]}"}, headers=headers)).json()["id"]
+        await client.post(f"{BASE_URL}/tasks/labels/attach", json={"task_ids": [child], "label_ids": [label_id]}, headers=headers)
+        for i in range(TEMPLATE_TASKS):
+            await create(f"Step {i}")
+
+        listed = (await client.get(f"{BASE_URL}/projects/", params={"templates": True}, headers=headers)).json()
+        assert template_id in {p["id"] for p in listed}
+        listed = (await client.get(f"{BASE_URL}/projects/", headers=headers)).json()
+        assert template_id not in {p["id"] for p in listed}
+        all_tasks = (await client.get(f"{BASE_URL}/tasks/", params={"fields": "project_id"}, headers=headers)).json()
+        assert template_id not in {t["project_id"] for t in all_tasks}
+        board = (await client.get(f"{BASE_URL}/tasks/", params={"project_id": template_id}, headers=headers)).json()
+        assert len(board) == TEMPLATE_TASKS + 2
+        print("✅ Template created and listed separately")
+
+        # 3. Clone it with a new start date
+        new_start = date(2026, 3, 1)
+        started = time.perf_counter()
+        clone_res = await client.post(f"{BASE_URL}/projects/{template_id}/clone", json={
+            "name": "Launch Q1",
+            "start_date": str(new_start)
+        }, headers=headers)
+        elapsed = time.perf_counter() - started
+        assert clone_res.status_code == 201, f"Clone failed: {clone_res.text}"
+        clone = clone_res.json()
+        assert clone["end_date"] == str(new_start + timedelta(days=30))
+        assert clone["is_template"] is False
+        print(f"✅ Project cloned in {elapsed * 1000:.0f} ms")
+
+        # 4. Tasks, hierarchy, due dates, dependencies and labels came along
+        tasks = (await client.get(f"{BASE_URL}/tasks/", params={"project_id": clone["id"]}, headers=headers)).json()
+        assert len(tasks) == TEMPLATE_TASKS + 2
+        by_title = {t["title"]: t for t in tasks}
+        new_epic, new_child = by_title["Epic"], by_title["Child"]
+        assert new_epic["id"] != epic and new_child["parent_id"] == new_epic["id"]
+        assert new_child["due_date"] == str(new_start + timedelta(days=10))
+        assert [l["id"] for l in new_child["labels"]] == [label_id]
+        deps = (await client.get(f"{BASE_URL}/tasks/{new_epic['id']}/dependencies", headers=headers)).json()
+        assert deps["blocked_by"] == [new_child["id"]]
+        subtasks = (await client.get(f"{BASE_URL}/tasks/{new_epic['id']}/subtasks", headers=headers)).json()
+        assert [t["id"] for t in subtasks] == [new_child["id"]]
+        print("✅ Tasks, subtasks, dependencies and labels copied")
+
+        # Cleanup
+        await client.delete(f"{BASE_URL}/projects/{clone['id']}", headers=headers)
+        await client.delete(f"{BASE_URL}/projects/{template_id}", headers=headers)
+        await client.delete(f"{BASE_URL}/labels/{label_id}", headers=headers)
+
+if __name__ == "__main__":
+    asyncio.run(test_project_clone_api())
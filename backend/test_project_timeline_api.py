@@ -0,0 +1,69 @@
+import asyncio
+import httpx
+from datetime import date, timedelta
+
+BASE_URL = "http://localhost:8000/api/v1"
+ADMIN_EMAIL = "admin@workprofit.com"
+ADMIN_PASSWORD = "admin123"
+
+async def test_project_timeline_filters():
+    async with httpx.AsyncClient() as client:
+        # 1. Login
+        login_res = await client.post(f"{BASE_URL}/auth/login", json={
+            "email": ADMIN_EMAIL,
+            "password": ADMIN_PASSWORD
+        })
+        assert login_res.status_code == 200, f"Login failed: {login_res.text}"
+        headers = {"Authorization": f"Bearer {login_res.json()['access_token']}"}
+        print("✅ Login successful")
+
+        # 2. Three projects: ending in 3 days, overdue, and far out
+        today = date.today()
+        specs = {
+            "Timeline Ending Soon": (today - timedelta(days=27), today + timedelta(days=3)),
+            "Timeline Overdue": (today - timedelta(days=20), today - timedelta(days=2)),
+            "Timeline Far Out": (today - timedelta(days=1), today + timedelta(days=99)),
+        }
+        ids = {}
+        for name, (start, end) in specs.items():
+            res = await client.post(f"{BASE_URL}/projects/", json={
+                "name": name,
+                "start_date": str(start),
+                "end_date": str(end)
+            }, headers=headers)
+            ids[name] = res.json()["id"]
+        print("✅ Projects created")
+
+        async def list_ids(**params):
+            res = await client.get(f"{BASE_URL}/projects/", params={"q": "Timeline", "limit": 1000, **params}, headers=headers)
+            assert res.status_code == 200, res.text
+            return [p["id"] for p in res.json() if p["id"] in ids.values()]
+
+        # 3. Filters
+        assert await list_ids(ending_within_days=7) == [ids["Timeline Ending Soon"]]
+        assert await list_ids(overdue="true") == [ids["Timeline Overdue"]]
+        assert await list_ids(max_progress=5) == [ids["Timeline Far Out"]]
+        print("✅ Timeline filters evaluated server-side")
+
+        # 4. Sorting by computed fields
+        assert await list_ids(sort="-progress") == [
+            ids["Timeline Overdue"], ids["Timeline Ending Soon"], ids["Timeline Far Out"]
+        ]
+        assert await list_ids(sort="duration") == [
+            ids["Timeline Overdue"], ids["Timeline Ending Soon"], ids["Timeline Far Out"]
+        ]
+        bad_res = await client.get(f"{BASE_URL}/projects/", params={"sort": "budget"}, headers=headers)
+        assert bad_res.status_code == 400
+        print("✅ Sorting by computed fields")
+
+        # 5. Computed values still match the response fields
+        res = await client.get(f"{BASE_URL}/projects/{ids['Timeline Ending Soon']}", headers=headers)
+        assert res.json()["progress_percentage"] == 90.0
+        assert res.json()["duration_days"] == 30
+
+        # Cleanup
+        for project_id in ids.values():
+            await client.delete(f"{BASE_URL}/projects/{project_id}", headers=headers)
+
+if __name__ == "__main__":
+    asyncio.run(test_project_timeline_filters())
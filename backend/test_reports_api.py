@@ -0,0 +1,80 @@
+import asyncio
+import httpx
+from datetime import date, timedelta
+
+BASE_URL = "http://localhost:8000/api/v1"
+ADMIN_EMAIL = "admin@workprofit.com"
+ADMIN_PASSWORD = "admin123"
+
+# Activity is written in background batches, flushed at least once a second
+FLUSH_WAIT_SECONDS = 1.5
+
+async def test_flow_report():
+    async with httpx.AsyncClient() as client:
+        # 1. Login
+        login_res = await client.post(f"{BASE_URL}/auth/login", json={
+            "email": ADMIN_EMAIL,
+            "password": ADMIN_PASSWORD
+        })
+        assert login_res.status_code == 200, f"Login failed: {login_res.text}"
+        headers = {"Authorization": f"Bearer {login_res.json()['access_token']}"}
+        print("✅ Login successful")
+
+        # 2. Walk two tasks through the workflow
+        project_res = await client.post(f"{BASE_URL}/projects/", json={
+            "name": "Flow Report Project",
+            "start_date": str(date.today()),
+            "end_date": str(date.today() + timedelta(days=30))
+        }, headers=headers)
+        project_id = project_res.json()["id"]
+        for title in ["Flow Task A", "Flow Task B"]:
+            task_id = (await client.post(f"{BASE_URL}/tasks/", json={
+                "title": title,
+                "project_id": project_id
+            }, headers=headers)).json()["id"]
+            for status in ["IN_PROGRESS", "REVIEW", "DONE"]:
+                await client.patch(f"{BASE_URL}/tasks/{task_id}", json={"status": status}, headers=headers)
+        # A task that never finishes is not counted
+        await client.post(f"{BASE_URL}/tasks/", json={"title": "Open Task", "project_id": project_id}, headers=headers)
+        await asyncio.sleep(FLUSH_WAIT_SECONDS)
+
+        # 3. Per-project report
+        report_res = await client.get(f"{BASE_URL}/reports/flow", params={"project_id": project_id}, headers=headers)
+        assert report_res.status_code == 200, f"Report failed: {report_res.text}"
+        report = report_res.json()
+        assert report["group_by"] == "project"
+        [group] = report["groups"]
+        assert group["group_id"] == project_id
+        assert group["completed"] == 2
+        assert group["lead_time"]["p50"] is not None and group["lead_time"]["p50"] >= 0
+        assert group["cycle_time"]["p95"] >= group["cycle_time"]["p50"]
+        assert set(group["time_in_status"]) == {"TODO", "IN_PROGRESS", "REVIEW"}
+        print(f"✅ Flow report: {group['completed']} completed, lead p50 {group['lead_time']['p50']}h")
+
+        # 4. Per-assignee grouping and range validation
+        report_res = await client.get(f"{BASE_URL}/reports/flow", params={"group_by": "assignee"}, headers=headers)
+        assert report_res.status_code == 200
+        bad_res = await client.get(f"{BASE_URL}/reports/flow", params={
+            "start": str(date.today()),
+            "end": str(date.today() - timedelta(days=1))
+        }, headers=headers)
+        assert bad_res.status_code == 400
+        bad_res = await client.get(f"{BASE_URL}/reports/flow", params={"group_by": "label"}, headers=headers)
+        assert bad_res.status_code == 422
+        print("✅ Assignee grouping and validation")
+
+        # 5. A range before the work happened is empty
+        past = date.today() - timedelta(days=400)
+        report_res = await client.get(f"{BASE_URL}/reports/flow", params={
+            "project_id": project_id,
+            "start": str(past),
+            "end": str(past + timedelta(days=7))
+        }, headers=headers)
+        assert report_res.json()["groups"] == []
+        print("✅ Date range respected")
+
+        # Cleanup
+        await client.delete(f"{BASE_URL}/projects/{project_id}", headers=headers)
+
+if __name__ == "__main__":
+    asyncio.run(test_flow_report())
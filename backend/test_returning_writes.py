@@ -0,0 +1,84 @@
+import asyncio
+import uuid
+from datetime import date, timedelta
+from fastapi import BackgroundTasks
+from sqlalchemy import event, select
+from database import AsyncSessionLocal, engine
+from models.label import Label
+from models.project import Project
+from models.user import User, UserRole
+from schemas.project import ProjectCreate
+from api.v1.projects import create_project
+from core.loaders import UserLoader
+from core.writes import save
+
+statements = []
+
+
+def count_statement(conn, cursor, statement, parameters, context, executemany):
+    statements.append(statement)
+
+
+async def test_returning_writes():
+    """Creating and updating a row takes one statement each, with server values filled in."""
+    event.listen(engine.sync_engine, "before_cursor_execute", count_statement)
+    try:
+        async with AsyncSessionLocal() as session:
+            label = Label(name=f"returning-{uuid.uuid4().hex[:8]}", color="#10B981")
+            statements.clear()
+            await save(session, label)
+            assert len(statements) == 1 and statements[0].startswith("INSERT"), statements
+            assert "RETURNING" in statements[0], statements[0]
+            assert label.id is not None and label.change_seq is not None
+            print(f"✓ Label {label.id} inserted with change_seq {label.change_seq} in one statement")
+
+            created_seq = label.change_seq
+            statements.clear()
+            label.color = "#EF4444"
+            await save(session)
+            assert len(statements) == 1 and statements[0].startswith("UPDATE"), statements
+            assert label.change_seq > created_seq, (label.change_seq, created_seq)
+            print("✓ Update returned the trigger-maintained change_seq without a refresh")
+
+            await session.delete(label)
+            await session.commit()
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", count_statement)
+
+
+async def test_create_project_writes():
+    """create_project inserts the project and its members in one transaction and answers without re-reading them."""
+    event.listen(engine.sync_engine, "before_cursor_execute", count_statement)
+    try:
+        async with AsyncSessionLocal() as session:
+            admin = (await session.execute(select(User).where(User.role == UserRole.ADMIN).limit(1))).scalar_one()
+            project_data = ProjectCreate(
+                name=f"Returning {uuid.uuid4().hex[:6]}",
+                start_date=date.today(),
+                end_date=date.today() + timedelta(days=10),
+                status="IN_PROGRESS",
+                member_ids=[admin.id],
+            )
+            statements.clear()
+            response = await create_project(
+                project_data, BackgroundTasks(), current_user=admin, db=session, users=UserLoader(session)
+            )
+            assert response.status == "IN_PROGRESS" and response.created_at is not None, response
+            writes = [s for s in statements if not s.startswith("SELECT")]
+            assert [s.split()[0] for s in writes] == ["INSERT", "INSERT"], statements
+            assert not statements[-1].startswith("SELECT"), statements
+            print(f"✓ Project {response.id} created with its member in one transaction, no refresh")
+
+            await session.delete(await session.get(Project, response.id))
+            await session.commit()
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", count_statement)
+
+
+async def main():
+    await test_returning_writes()
+    await test_create_project_writes()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
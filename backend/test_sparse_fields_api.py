@@ -0,0 +1,76 @@
+import asyncio
+import uuid
+import httpx
+from datetime import date, timedelta
+
+BASE_URL = "http://localhost:8000/api/v1"
+ADMIN_EMAIL = "admin@workprofit.com"
+ADMIN_PASSWORD = "admin123"
+
+async def test_sparse_fields_api():
+    async with httpx.AsyncClient() as client:
+        # 1. Login
+        login_res = await client.post(f"{BASE_URL}/auth/login", json={
+            "email": ADMIN_EMAIL,
+            "password": ADMIN_PASSWORD
+        })
+        assert login_res.status_code == 200, f"Login failed: {login_res.text}"
+        headers = {"Authorization": f"Bearer {login_res.json()['access_token']}"}
+        admin_id = (await client.get(f"{BASE_URL}/auth/me", headers=headers)).json()["id"]
+        print("✅ Login successful")
+
+        # 2. A project with a member and a task
+        project_res = await client.post(f"{BASE_URL}/projects/", json={
+            "name": f"Sparse Fields {uuid.uuid4().hex[:6]}",
+            "description": "A long description the board does not need",
+            "start_date": str(date.today()),
+            "end_date": str(date.today() + timedelta(days=30)),
+            "member_ids": [admin_id]
+        }, headers=headers)
+        assert project_res.status_code == 201, f"Project creation failed: {project_res.text}"
+        project_id = project_res.json()["id"]
+        task_res = await client.post(f"{BASE_URL}/tasks/", json={
+            "title": "Board card",
+            "description": "Not shown on the board",
+            "project_id": project_id,
+            "assignee_id": admin_id
+        }, headers=headers)
+        assert task_res.status_code == 201, f"Task creation failed: {task_res.text}"
+
+        # 3. Task fields narrow the payload; id is always present
+        res = await client.get(f"{BASE_URL}/tasks/", params={
+            "project_id": project_id, "fields": "title,status,assignee_id"
+        }, headers=headers)
+        assert res.status_code == 200, res.text
+        assert res.json() == [{"id": task_res.json()["id"], "title": "Board card", "status": "TODO", "assignee_id": admin_id}]
+        full = (await client.get(f"{BASE_URL}/tasks/", params={"project_id": project_id}, headers=headers)).json()
+        assert "description" in full[0] and full[0]["labels"] == []
+        print("✅ Task fieldsets")
+
+        # 4. Unknown fields are rejected
+        res = await client.get(f"{BASE_URL}/tasks/", params={"fields": "title,secret"}, headers=headers)
+        assert res.status_code == 400 and "secret" in res.json()["detail"]
+        print("✅ Unknown fields rejected")
+
+        # 5. Project fields, including nested users resolved from unrequested ID columns
+        res = await client.get(f"{BASE_URL}/projects/", params={"fields": "name,members", "limit": 1000}, headers=headers)
+        assert res.status_code == 200, res.text
+        project = next(p for p in res.json() if p["id"] == project_id)
+        assert set(project) == {"id", "name", "members"}
+        assert [m["id"] for m in project["members"]] == [admin_id]
+        print("✅ Project fieldsets")
+
+        # 6. Compact mode: users as IDs plus one shared users map
+        res = await client.get(f"{BASE_URL}/projects/", params={"compact": "true", "limit": 1000}, headers=headers)
+        assert res.status_code == 200, res.text
+        body = res.json()
+        project = next(p for p in body["items"] if p["id"] == project_id)
+        assert project["members"] == [admin_id]
+        assert project["team_lead"] is None and project["client"] is None
+        assert body["users"][str(admin_id)]["id"] == admin_id
+        print("✅ Compact project list")
+
+        await client.delete(f"{BASE_URL}/projects/{project_id}", headers=headers)
+
+if __name__ == "__main__":
+    asyncio.run(test_sparse_fields_api())
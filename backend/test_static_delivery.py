@@ -0,0 +1,60 @@
+import asyncio
+import httpx
+
+BASE_URL = "http://localhost:8000/api/v1"
+ROOT_URL = "http://localhost:8000"
+
+async def test_static_delivery():
+    async with httpx.AsyncClient() as client:
+        # 1. Upload a text document
+        body = ("WorkProfit static delivery check\n" * 2000).encode()
+        upload_res = await client.post(f"{BASE_URL}/files/upload", files={"file": ("notes.txt", body, "text/plain")})
+        assert upload_res.status_code == 200, f"Upload failed: {upload_res.text}"
+        url = f"{ROOT_URL}{upload_res.json()['url']}"
+        print(f"✅ File uploaded ({url})")
+
+        # 2. Immutable caching and strong ETag
+        res = await client.get(url, headers={"Accept-Encoding": "identity"})
+        assert res.status_code == 200
+        assert "immutable" in res.headers["Cache-Control"]
+        etag = res.headers["ETag"]
+        assert not etag.startswith("W/")
+        assert res.content == body
+        print("✅ Cache-Control and strong ETag present")
+
+        # 3. Conditional request
+        res = await client.get(url, headers={"If-None-Match": etag, "Accept-Encoding": "identity"})
+        assert res.status_code == 304
+        print("✅ If-None-Match returns 304")
+
+        # 4. Range requests
+        res = await client.get(url, headers={"Range": "bytes=10-19"})
+        assert res.status_code == 206
+        assert res.content == body[10:20]
+        assert res.headers["Content-Range"] == f"bytes 10-19/{len(body)}"
+        res = await client.get(url, headers={"Range": "bytes=-5"})
+        assert res.status_code == 206 and res.content == body[-5:]
+        res = await client.get(url, headers={"Range": f"bytes={len(body)}-"})
+        assert res.status_code == 416
+        res = await client.head(url, headers={"Range": "bytes=10-19"})
+        assert res.status_code == 206 and res.content == b""
+        assert res.headers["Content-Length"] == "10"
+        print("✅ Range requests served (HEAD without a body)")
+
+        # 5. Pre-compressed sibling (written in the background after upload)
+        await asyncio.sleep(0.5)
+        res = await client.get(url, headers={"Accept-Encoding": "gzip"})
+        assert res.status_code == 200
+        assert res.headers.get("Content-Encoding") == "gzip"
+        assert res.content == body  # httpx decodes transparently
+        res = await client.get(url, headers={"Accept-Encoding": "gzip;q=0, br;q=0"})
+        assert "Content-Encoding" not in res.headers and res.content == body
+        print("✅ Pre-compressed gzip served, and withheld when q=0")
+
+        # 6. Hidden entries are not served
+        res = await client.get(f"{ROOT_URL}/static/.thumbs/missing.webp")
+        assert res.status_code == 404
+        print("✅ Hidden paths are not exposed")
+
+if __name__ == "__main__":
+    asyncio.run(test_static_delivery())
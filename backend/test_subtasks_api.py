@@ -0,0 +1,92 @@
+import asyncio
+import httpx
+from datetime import date, timedelta
+
+BASE_URL = "http://localhost:8000/api/v1"
+ADMIN_EMAIL = "admin@workprofit.com"
+ADMIN_PASSWORD = "admin123"
+
+async def test_subtasks_api():
+    async with httpx.AsyncClient() as client:
+        # 1. Login
+        login_res = await client.post(f"{BASE_URL}/auth/login", json={
+            "email": ADMIN_EMAIL,
+            "password": ADMIN_PASSWORD
+        })
+        assert login_res.status_code == 200, f"Login failed: {login_res.text}"
+        headers = {"Authorization": f"Bearer {login_res.json()['access_token']}"}
+        print("✅ Login successful")
+
+        project_res = await client.post(f"{BASE_URL}/projects/", json={
+            "name": "Subtask Project",
+            "start_date": str(date.today()),
+            "end_date": str(date.today() + timedelta(days=30))
+        }, headers=headers)
+        project_id = project_res.json()["id"]
+
+        async def create(title, parent_id=None, task_status="TODO"):
+            res = await client.post(f"{BASE_URL}/tasks/", json={
+                "title": title,
+                "project_id": project_id,
+                "parent_id": parent_id,
+                "status": task_status
+            }, headers=headers)
+            assert res.status_code == 201, f"Create failed: {res.text}"
+            return res.json()["id"]
+
+        # 2. Epic -> stories -> subtasks
+        epic = await create("Epic")
+        story_a = await create("Story A", epic)
+        story_b = await create("Story B", epic, "DONE")
+        sub_a1 = await create("Sub A1", story_a, "DONE")
+        sub_a2 = await create("Sub A2", story_a, "IN_PROGRESS")
+        other = await create("Other epic")
+        print("✅ Task tree created")
+
+        # 3. All descendants, parents first
+        res = await client.get(f"{BASE_URL}/tasks/{epic}/subtasks", headers=headers)
+        assert res.status_code == 200, f"Subtasks failed: {res.text}"
+        subtasks = res.json()
+        assert {t["id"] for t in subtasks} == {story_a, story_b, sub_a1, sub_a2}
+        order = [t["id"] for t in subtasks]
+        assert order.index(story_a) < order.index(sub_a1)
+        assert next(t for t in subtasks if t["id"] == sub_a1)["parent_id"] == story_a
+        print("✅ Descendants listed")
+
+        # 4. Rollup over the whole subtree
+        rollup = (await client.get(f"{BASE_URL}/tasks/{epic}/rollup", headers=headers)).json()
+        assert rollup["total"] == 4 and rollup["done"] == 2 and rollup["in_progress"] == 1
+        assert rollup["progress_percentage"] == 50.0
+        leaf = (await client.get(f"{BASE_URL}/tasks/{sub_a1}/rollup", headers=headers)).json()
+        assert leaf["total"] == 0 and leaf["progress_percentage"] is None
+        print("✅ Subtree progress rolled up")
+
+        # 5. Reparent a story with its subtasks to another epic
+        res = await client.patch(f"{BASE_URL}/tasks/{story_a}", json={"parent_id": other}, headers=headers)
+        assert res.status_code == 200, f"Reparent failed: {res.text}"
+        moved = {t["id"] for t in (await client.get(f"{BASE_URL}/tasks/{other}/subtasks", headers=headers)).json()}
+        assert moved == {story_a, sub_a1, sub_a2}
+        remaining = {t["id"] for t in (await client.get(f"{BASE_URL}/tasks/{epic}/subtasks", headers=headers)).json()}
+        assert remaining == {story_b}
+        print("✅ Subtree reparented")
+
+        # 6. Cycles and cross-project parents are rejected
+        res = await client.patch(f"{BASE_URL}/tasks/{other}", json={"parent_id": sub_a1}, headers=headers)
+        assert res.status_code == 400
+        res = await client.patch(f"{BASE_URL}/tasks/{story_a}", json={"parent_id": story_a}, headers=headers)
+        assert res.status_code == 400
+        print("✅ Cycles rejected")
+
+        # 7. Back to the top level, then deleting an epic removes its subtasks
+        res = await client.patch(f"{BASE_URL}/tasks/{story_a}", json={"parent_id": None}, headers=headers)
+        assert res.status_code == 200 and res.json()["parent_id"] is None
+        assert (await client.get(f"{BASE_URL}/tasks/{other}/subtasks", headers=headers)).json() == []
+        await client.delete(f"{BASE_URL}/tasks/{story_a}", headers=headers)
+        assert (await client.get(f"{BASE_URL}/tasks/{sub_a2}", headers=headers)).status_code == 404
+        print("✅ Subtasks deleted with their parent")
+
+        # Cleanup
+        await client.delete(f"{BASE_URL}/projects/{project_id}", headers=headers)
+
+if __name__ == "__main__":
+    asyncio.run(test_subtasks_api())
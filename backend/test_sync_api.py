@@ -0,0 +1,106 @@
+import asyncio
+import uuid
+import httpx
+from datetime import date, timedelta
+
+BASE_URL = "http://localhost:8000/api/v1"
+ADMIN_EMAIL = "admin@workprofit.com"
+ADMIN_PASSWORD = "admin123"
+
+async def test_sync_api():
+    async with httpx.AsyncClient() as client:
+        # 1. Login
+        login_res = await client.post(f"{BASE_URL}/auth/login", json={
+            "email": ADMIN_EMAIL,
+            "password": ADMIN_PASSWORD
+        })
+        assert login_res.status_code == 200, f"Login failed: {login_res.text}"
+        headers = {"Authorization": f"Bearer {login_res.json()['access_token']}"}
+        print("✅ Login successful")
+
+        # 2. Take an initial cursor (drain any backlog)
+        cursor = 0
+        while True:
+            sync_res = await client.get(f"{BASE_URL}/sync", params={"since": cursor, "limit": 5000}, headers=headers)
+            assert sync_res.status_code == 200, f"Sync failed: {sync_res.text}"
+            cursor = sync_res.json()["cursor"]
+            if not sync_res.json()["has_more"]:
+                break
+        print(f"✅ Initial sync complete (cursor: {cursor})")
+
+        # 3. Nothing changed -> empty delta
+        sync_res = await client.get(f"{BASE_URL}/sync", params={"since": cursor}, headers=headers)
+        body = sync_res.json()
+        assert body["tasks"] == [] and body["projects"] == [] and body["deleted"]["tasks"] == []
+        print("✅ Empty delta when nothing changed")
+
+        # 4. Create a project and a task
+        project_res = await client.post(f"{BASE_URL}/projects/", json={
+            "name": "Sync Project",
+            "start_date": str(date.today()),
+            "end_date": str(date.today() + timedelta(days=30))
+        }, headers=headers)
+        project_id = project_res.json()["id"]
+        task_res = await client.post(f"{BASE_URL}/tasks/", json={
+            "title": "Sync Task",
+            "project_id": project_id
+        }, headers=headers)
+        task_id = task_res.json()["id"]
+
+        sync_res = await client.get(f"{BASE_URL}/sync", params={"since": cursor}, headers=headers)
+        body = sync_res.json()
+        assert [t["id"] for t in body["tasks"]] == [task_id]
+        assert [p["id"] for p in body["projects"]] == [project_id]
+        cursor = body["cursor"]
+        print("✅ Created rows appear in the delta")
+
+        # 5. Update the task
+        await client.patch(f"{BASE_URL}/tasks/{task_id}", json={"status": "DONE"}, headers=headers)
+        body = (await client.get(f"{BASE_URL}/sync", params={"since": cursor}, headers=headers)).json()
+        assert [t["status"] for t in body["tasks"]] == ["DONE"]
+        assert body["projects"] == []
+        cursor = body["cursor"]
+        print("✅ Updated task appears alone in the delta")
+
+        # 6. Delete the project; task and project tombstones are reported
+        await client.delete(f"{BASE_URL}/projects/{project_id}", headers=headers)
+        body = (await client.get(f"{BASE_URL}/sync", params={"since": cursor}, headers=headers)).json()
+        assert task_id in body["deleted"]["tasks"]
+        assert project_id in body["deleted"]["projects"]
+        print("✅ Deletes reported as tombstones")
+
+        # 7. A replaced team lead is told to drop the project
+        lead_email = f"sync-lead-{uuid.uuid4().hex[:8]}@workprofit.com"
+        user_res = await client.post(f"{BASE_URL}/users/", json={
+            "email": lead_email,
+            "password": "synclead123",
+            "first_name": "Sync",
+            "last_name": "Lead",
+            "role": "TEAM_LEAD",
+            "department": "ACCOUNT"
+        }, headers=headers)
+        assert user_res.status_code == 201, f"User creation failed: {user_res.text}"
+        login_res = await client.post(f"{BASE_URL}/auth/login", json={"email": lead_email, "password": "synclead123"})
+        lead_headers = {"Authorization": f"Bearer {login_res.json()['access_token']}"}
+        project_res = await client.post(f"{BASE_URL}/projects/", json={
+            "name": "Sync Lead Project",
+            "start_date": str(date.today()),
+            "end_date": str(date.today() + timedelta(days=30)),
+            "team_lead_id": user_res.json()["id"]
+        }, headers=headers)
+        project_id = project_res.json()["id"]
+        body = (await client.get(f"{BASE_URL}/sync", headers=lead_headers)).json()
+        assert [p["id"] for p in body["projects"]] == [project_id]
+        lead_cursor = body["cursor"]
+
+        await client.patch(f"{BASE_URL}/projects/{project_id}", json={"team_lead_id": None}, headers=headers)
+        body = (await client.get(f"{BASE_URL}/sync", params={"since": lead_cursor}, headers=lead_headers)).json()
+        assert body["deleted"]["projects"] == [project_id], body
+        body = (await client.get(f"{BASE_URL}/sync", params={"since": cursor}, headers=headers)).json()
+        assert project_id not in body["deleted"]["projects"]
+        print("✅ Lost team lead access reported only to the former lead")
+
+        await client.delete(f"{BASE_URL}/projects/{project_id}", headers=headers)
+
+if __name__ == "__main__":
+    asyncio.run(test_sync_api())
@@ -0,0 +1,87 @@
+import asyncio
+import httpx
+from datetime import date, timedelta
+
+BASE_URL = "http://localhost:8000/api/v1"
+ADMIN_EMAIL = "admin@workprofit.com"
+ADMIN_PASSWORD = "admin123"
+
+# Activity is written in background batches, flushed at least once a second
+FLUSH_WAIT_SECONDS = 1.5
+
+async def test_task_activity_api():
+    async with httpx.AsyncClient() as client:
+        # 1. Login
+        login_res = await client.post(f"{BASE_URL}/auth/login", json={
+            "email": ADMIN_EMAIL,
+            "password": ADMIN_PASSWORD
+        })
+        assert login_res.status_code == 200, f"Login failed: {login_res.text}"
+        headers = {"Authorization": f"Bearer {login_res.json()['access_token']}"}
+        print("✅ Login successful")
+
+        # 2. Create a project and a task, then change it a few times
+        project_res = await client.post(f"{BASE_URL}/projects/", json={
+            "name": "Activity Project",
+            "start_date": str(date.today()),
+            "end_date": str(date.today() + timedelta(days=30))
+        }, headers=headers)
+        project_id = project_res.json()["id"]
+        task_res = await client.post(f"{BASE_URL}/tasks/", json={
+            "title": "Activity Task",
+            "project_id": project_id
+        }, headers=headers)
+        task_id = task_res.json()["id"]
+
+        await client.patch(f"{BASE_URL}/tasks/{task_id}", json={"status": "IN_PROGRESS"}, headers=headers)
+        await client.patch(f"{BASE_URL}/tasks/{task_id}", json={"status": "DONE", "title": "Activity Task (done)"}, headers=headers)
+        # No-op update: nothing should be logged
+        await client.patch(f"{BASE_URL}/tasks/{task_id}", json={"status": "DONE"}, headers=headers)
+        await asyncio.sleep(FLUSH_WAIT_SECONDS)
+
+        # 3. Task feed, newest first
+        feed_res = await client.get(f"{BASE_URL}/tasks/{task_id}/activity", headers=headers)
+        assert feed_res.status_code == 200, f"Activity failed: {feed_res.text}"
+        items = feed_res.json()["items"]
+        assert [i["action"] for i in items][-1] == "created"
+        status_changes = [(i["old_value"], i["new_value"]) for i in items if i["field"] == "status" and i["action"] == "updated"]
+        assert status_changes == [("IN_PROGRESS", "DONE"), ("TODO", "IN_PROGRESS")], status_changes
+        assert any(i["field"] == "title" for i in items)
+        print(f"✅ Task activity recorded ({len(items)} entries)")
+
+        # 4. Cursor pagination walks the same entries one at a time
+        seen, cursor = [], None
+        while True:
+            params = {"limit": 1}
+            if cursor:
+                params["cursor"] = cursor
+            page = (await client.get(f"{BASE_URL}/tasks/{task_id}/activity", params=params, headers=headers)).json()
+            seen.extend(i["id"] for i in page["items"])
+            cursor = page["next_cursor"]
+            if not cursor:
+                break
+        assert seen == [i["id"] for i in items]
+        print("✅ Cursor pagination is stable")
+
+        bad_res = await client.get(f"{BASE_URL}/tasks/{task_id}/activity", params={"cursor": "not-a-cursor"}, headers=headers)
+        assert bad_res.status_code == 400
+        print("✅ Invalid cursor rejected")
+
+        # 5. Deleting the task keeps its history in the project feed
+        await client.delete(f"{BASE_URL}/tasks/{task_id}", headers=headers)
+        await asyncio.sleep(FLUSH_WAIT_SECONDS)
+        project_feed = (await client.get(f"{BASE_URL}/projects/{project_id}/activity", headers=headers)).json()
+        assert project_feed["items"][0]["action"] == "deleted"
+        assert project_feed["items"][0]["task_id"] == task_id
+        print("✅ Project feed includes the deletion")
+
+        # 6. Nothing was dropped along the way
+        health = (await client.get(BASE_URL.rsplit("/api/", 1)[0] + "/health")).json()
+        assert health["activity_log"]["dropped"] == 0, health
+        print("✅ No activity entries dropped")
+
+        # Cleanup
+        await client.delete(f"{BASE_URL}/projects/{project_id}", headers=headers)
+
+if __name__ == "__main__":
+    asyncio.run(test_task_activity_api())
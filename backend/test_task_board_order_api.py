@@ -0,0 +1,91 @@
+import asyncio
+import httpx
+from datetime import date, timedelta
+
+BASE_URL = "http://localhost:8000/api/v1"
+ADMIN_EMAIL = "admin@workprofit.com"
+ADMIN_PASSWORD = "admin123"
+
+async def column(client, headers, project_id, task_status):
+    res = await client.get(f"{BASE_URL}/tasks/", params={"project_id": project_id}, headers=headers)
+    assert res.status_code == 200, f"List failed: {res.text}"
+    return [t["id"] for t in res.json() if t["status"] == task_status]
+
+async def test_task_board_order_api():
+    async with httpx.AsyncClient() as client:
+        # 1. Login
+        login_res = await client.post(f"{BASE_URL}/auth/login", json={
+            "email": ADMIN_EMAIL,
+            "password": ADMIN_PASSWORD
+        })
+        assert login_res.status_code == 200, f"Login failed: {login_res.text}"
+        headers = {"Authorization": f"Bearer {login_res.json()['access_token']}"}
+        print("✅ Login successful")
+
+        # 2. New cards are appended to the bottom of their column
+        project_res = await client.post(f"{BASE_URL}/projects/", json={
+            "name": "Board Order Project",
+            "start_date": str(date.today()),
+            "end_date": str(date.today() + timedelta(days=30))
+        }, headers=headers)
+        project_id = project_res.json()["id"]
+        ids = []
+        for i in range(4):
+            task_res = await client.post(f"{BASE_URL}/tasks/", json={
+                "title": f"Card {i}",
+                "project_id": project_id
+            }, headers=headers)
+            assert task_res.status_code == 201, f"Create failed: {task_res.text}"
+            ids.append(task_res.json()["id"])
+        assert await column(client, headers, project_id, "TODO") == ids
+        print("✅ Cards listed in creation order")
+
+        # 3. Move the last card between the first two
+        move_res = await client.post(f"{BASE_URL}/tasks/{ids[3]}/move", json={
+            "before_id": ids[0],
+            "after_id": ids[1]
+        }, headers=headers)
+        assert move_res.status_code == 200, f"Move failed: {move_res.text}"
+        assert await column(client, headers, project_id, "TODO") == [ids[0], ids[3], ids[1], ids[2]]
+        print("✅ Card moved between neighbours")
+
+        # 4. Only one neighbour given: the card goes directly above it
+        await client.post(f"{BASE_URL}/tasks/{ids[2]}/move", json={"after_id": ids[0]}, headers=headers)
+        assert await column(client, headers, project_id, "TODO") == [ids[2], ids[0], ids[3], ids[1]]
+        print("✅ Card moved to the top")
+
+        # 5. Move across columns
+        await client.post(f"{BASE_URL}/tasks/{ids[0]}/move", json={"status": "IN_PROGRESS"}, headers=headers)
+        await client.post(f"{BASE_URL}/tasks/{ids[1]}/move", json={"status": "IN_PROGRESS", "after_id": ids[0]}, headers=headers)
+        assert await column(client, headers, project_id, "IN_PROGRESS") == [ids[1], ids[0]]
+        assert await column(client, headers, project_id, "TODO") == [ids[2], ids[3]]
+        print("✅ Cards moved across columns")
+
+        # 6. A neighbour from another column is rejected
+        bad_res = await client.post(f"{BASE_URL}/tasks/{ids[2]}/move", json={"before_id": ids[0]}, headers=headers)
+        assert bad_res.status_code == 400
+        print("✅ Neighbour outside the target column rejected")
+
+        # 7. Many inserts at the same spot keep the order intact
+        for _ in range(30):
+            await client.post(f"{BASE_URL}/tasks/{ids[3]}/move", json={"after_id": ids[2]}, headers=headers)
+            await client.post(f"{BASE_URL}/tasks/{ids[2]}/move", json={"after_id": ids[3]}, headers=headers)
+        assert await column(client, headers, project_id, "TODO") == [ids[2], ids[3]]
+        print("✅ Repeated moves keep a consistent order")
+
+        # 8. Concurrent creates in one column get distinct ranks
+        responses = await asyncio.gather(*[
+            client.post(f"{BASE_URL}/tasks/", json={"title": f"Parallel {i}", "project_id": project_id, "status": "REVIEW"}, headers=headers)
+            for i in range(10)
+        ])
+        assert all(r.status_code == 201 for r in responses), [r.text for r in responses]
+        res = await client.get(f"{BASE_URL}/tasks/", params={"project_id": project_id, "fields": "status,rank"}, headers=headers)
+        ranks = [t["rank"] for t in res.json() if t["status"] == "REVIEW"]
+        assert len(ranks) == 10 and len(set(ranks)) == 10, ranks
+        print("✅ Concurrent creates get distinct ranks")
+
+        # Cleanup
+        await client.delete(f"{BASE_URL}/projects/{project_id}", headers=headers)
+
+if __name__ == "__main__":
+    asyncio.run(test_task_board_order_api())
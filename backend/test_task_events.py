@@ -0,0 +1,74 @@
+import asyncio
+import json
+import httpx
+from datetime import date, timedelta
+
+BASE_URL = "http://localhost:8000/api/v1"
+ADMIN_EMAIL = "admin@workprofit.com"
+ADMIN_PASSWORD = "admin123"
+
+async def read_events(client: httpx.AsyncClient, token: str, project_id: int, count: int, received: list):
+    """Collect `count` SSE data messages for a project."""
+    params = {"token": token, "project_id": project_id}
+    async with client.stream("GET", f"{BASE_URL}/events/stream", params=params, timeout=None) as resp:
+        assert resp.status_code == 200
+        async for line in resp.aiter_lines():
+            if line.startswith("data: "):
+                received.append(json.loads(line[len("data: "):]))
+                if len(received) == count:
+                    return
+
+async def test_task_events():
+    async with httpx.AsyncClient() as client:
+        # 1. Login
+        login_res = await client.post(f"{BASE_URL}/auth/login", json={
+            "email": ADMIN_EMAIL,
+            "password": ADMIN_PASSWORD
+        })
+        assert login_res.status_code == 200, f"Login failed: {login_res.text}"
+        token = login_res.json()["access_token"]
+        headers = {"Authorization": f"Bearer {token}"}
+        print("✅ Login successful")
+
+        # 2. Create Project
+        project_res = await client.post(f"{BASE_URL}/projects/", json={
+            "name": "Live Board Project",
+            "start_date": str(date.today()),
+            "end_date": str(date.today() + timedelta(days=30))
+        }, headers=headers)
+        assert project_res.status_code == 201
+        project_id = project_res.json()["id"]
+        print(f"✅ Project created (ID: {project_id})")
+
+        # 3. Subscribe, then create / update / delete a task
+        received = []
+        listener = asyncio.create_task(read_events(httpx.AsyncClient(), token, project_id, 3, received))
+        await asyncio.sleep(0.5)
+
+        task_res = await client.post(f"{BASE_URL}/tasks/", json={
+            "title": "Live Task",
+            "project_id": project_id
+        }, headers=headers)
+        task_id = task_res.json()["id"]
+        await client.patch(f"{BASE_URL}/tasks/{task_id}", json={"status": "IN_PROGRESS", "title": "Live Task"}, headers=headers)
+        await client.delete(f"{BASE_URL}/tasks/{task_id}", headers=headers)
+
+        await asyncio.wait_for(listener, timeout=10)
+        assert [e["type"] for e in received] == ["task.created", "task.updated", "task.deleted"]
+        assert received[0]["task"]["id"] == task_id
+        # Only the changed field is sent
+        assert received[1]["changes"] == {"status": "IN_PROGRESS"}
+        assert received[2]["task_id"] == task_id
+        print("✅ Create/update/delete events received with compact diffs")
+
+        # 4. Invalid token is rejected
+        bad_res = await client.get(f"{BASE_URL}/events/stream", params={"token": "invalid"})
+        assert bad_res.status_code == 401
+        print("✅ Unauthenticated subscription rejected")
+
+        # 5. Cleanup
+        await client.delete(f"{BASE_URL}/projects/{project_id}", headers=headers)
+        print("✅ Project cleaned up")
+
+if __name__ == "__main__":
+    asyncio.run(test_task_events())
@@ -0,0 +1,82 @@
+import asyncio
+import uuid
+import httpx
+from datetime import date, timedelta
+
+BASE_URL = "http://localhost:8000/api/v1"
+ADMIN_EMAIL = "admin@workprofit.com"
+ADMIN_PASSWORD = "admin123"
+
+async def test_task_labels_api():
+    async with httpx.AsyncClient() as client:
+        # 1. Login
+        login_res = await client.post(f"{BASE_URL}/auth/login", json={
+            "email": ADMIN_EMAIL,
+            "password": ADMIN_PASSWORD
+        })
+        assert login_res.status_code == 200, f"Login failed: {login_res.text}"
+        headers = {"Authorization": f"Bearer {login_res.json()['access_token']}"}
+        print("✅ Login successful")
+
+        # 2. Project, tasks and two labels
+        project_res = await client.post(f"{BASE_URL}/projects/", json={
+            "name": "Label Filter Project",
+            "start_date": str(date.today()),
+            "end_date": str(date.today() + timedelta(days=30))
+        }, headers=headers)
+        project_id = project_res.json()["id"]
+        tasks = []
+        for title, priority in [("Bug", "HIGH"), ("Feature", "MEDIUM"), ("Chore", "LOW")]:
+            res = await client.post(f"{BASE_URL}/tasks/", json={
+                "title": title, "project_id": project_id, "priority": priority
+            }, headers=headers)
+            tasks.append(res.json()["id"])
+        suffix = uuid.uuid4().hex[:6]
+        urgent = (await client.post(f"{BASE_URL}/labels/", json={"name": f"urgent-{suffix}"}, headers=headers)).json()["id"]
+        backend = (await client.post(f"{BASE_URL}/labels/", json={"name": f"backend-{suffix}"}, headers=headers)).json()["id"]
+
+        # 3. Bulk attach
+        res = await client.post(f"{BASE_URL}/tasks/labels/attach", json={
+            "task_ids": tasks[:2], "label_ids": [backend]
+        }, headers=headers)
+        assert res.status_code == 200, f"Attach failed: {res.text}"
+        await client.post(f"{BASE_URL}/tasks/labels/attach", json={"task_ids": [tasks[0]], "label_ids": [urgent, backend]}, headers=headers)
+        task = (await client.get(f"{BASE_URL}/tasks/{tasks[0]}", headers=headers)).json()
+        assert {l["id"] for l in task["labels"]} == {urgent, backend}
+        print("✅ Labels attached and returned on tasks")
+
+        # 4. Filtering by any/all labels
+        async def filtered(label_ids, match):
+            res = await client.get(f"{BASE_URL}/tasks/", params={
+                "project_id": project_id, "label_ids": label_ids, "label_match": match
+            }, headers=headers)
+            assert res.status_code == 200, f"List failed: {res.text}"
+            return {t["id"] for t in res.json()}
+        assert await filtered([urgent, backend], "any") == set(tasks[:2])
+        assert await filtered([urgent, backend], "all") == {tasks[0]}
+        print("✅ Any/all label filtering")
+
+        # 5. Facets
+        facets = (await client.get(f"{BASE_URL}/tasks/facets", params={"project_id": project_id}, headers=headers)).json()
+        assert facets["total"] == 3
+        labels = {f["value"]: f["count"] for f in facets["labels"]}
+        assert labels == {backend: 2, urgent: 1, None: 1}, labels
+        assert {f["value"]: f["count"] for f in facets["priority"]} == {"HIGH": 1, "MEDIUM": 1, "LOW": 1}
+        assert {f["value"]: f["count"] for f in facets["status"]} == {"TODO": 3}
+        print("✅ Facet counts")
+
+        # 6. Bulk detach
+        res = await client.post(f"{BASE_URL}/tasks/labels/detach", json={
+            "task_ids": tasks, "label_ids": [backend]
+        }, headers=headers)
+        assert res.status_code == 200
+        assert await filtered([backend], "any") == set()
+        print("✅ Labels detached")
+
+        # Cleanup
+        await client.delete(f"{BASE_URL}/projects/{project_id}", headers=headers)
+        await client.delete(f"{BASE_URL}/labels/{urgent}", headers=headers)
+        await client.delete(f"{BASE_URL}/labels/{backend}", headers=headers)
+
+if __name__ == "__main__":
+    asyncio.run(test_task_labels_api())
@@ -0,0 +1,74 @@
+import asyncio
+import httpx
+from datetime import date, timedelta
+
+BASE_URL = "http://localhost:8000/api/v1"
+ADMIN_EMAIL = "admin@workprofit.com"
+ADMIN_PASSWORD = "admin123"
+
+async def test_time_entries_api():
+    async with httpx.AsyncClient() as client:
+        # 1. Login
+        login_res = await client.post(f"{BASE_URL}/auth/login", json={
+            "email": ADMIN_EMAIL,
+            "password": ADMIN_PASSWORD
+        })
+        assert login_res.status_code == 200, f"Login failed: {login_res.text}"
+        headers = {"Authorization": f"Bearer {login_res.json()['access_token']}"}
+        print("✅ Login successful")
+
+        # 2. Project with two tasks
+        project_res = await client.post(f"{BASE_URL}/projects/", json={
+            "name": "Timesheet Project",
+            "start_date": str(date.today()),
+            "end_date": str(date.today() + timedelta(days=30))
+        }, headers=headers)
+        project_id = project_res.json()["id"]
+        task_a = (await client.post(f"{BASE_URL}/tasks/", json={"title": "Billable work", "project_id": project_id}, headers=headers)).json()["id"]
+        task_b = (await client.post(f"{BASE_URL}/tasks/", json={"title": "Internal work", "project_id": project_id}, headers=headers)).json()["id"]
+
+        async def project_row():
+            res = await client.get(f"{BASE_URL}/reports/profitability", params={"project_id": project_id}, headers=headers)
+            assert res.status_code == 200, f"Report failed: {res.text}"
+            rows = res.json()["rows"]
+            return rows[0] if rows else None
+
+        # 3. Log time: 90 min billable at 100/h, 30 min non-billable
+        entry_res = await client.post(f"{BASE_URL}/time-entries/", json={
+            "task_id": task_a, "minutes": 90, "hourly_rate": "100.00"
+        }, headers=headers)
+        assert entry_res.status_code == 201, f"Create failed: {entry_res.text}"
+        entry_id = entry_res.json()["id"]
+        await client.post(f"{BASE_URL}/time-entries/", json={
+            "task_id": task_b, "minutes": 30, "billable": False
+        }, headers=headers)
+
+        row = await project_row()
+        assert row["hours"] == 2.0 and row["billable_hours"] == 1.5
+        assert row["billable_amount"] == 150.0
+        assert row["billable_ratio"] == 0.75
+        print("✅ Project rollup updated on insert")
+
+        # 4. Updates and deletes adjust the rollups incrementally
+        await client.patch(f"{BASE_URL}/time-entries/{entry_id}", json={"minutes": 120}, headers=headers)
+        row = await project_row()
+        assert row["hours"] == 2.5 and row["billable_amount"] == 200.0
+        await client.delete(f"{BASE_URL}/time-entries/{entry_id}", headers=headers)
+        row = await project_row()
+        assert row["hours"] == 0.5 and row["billable_amount"] == 0.0
+        print("✅ Rollups follow updates and deletes")
+
+        # 5. Per-task grouping and entry listing
+        res = await client.get(f"{BASE_URL}/reports/profitability", params={"project_id": project_id, "group_by": "task"}, headers=headers)
+        assert [r["key"] for r in res.json()["rows"]] == [task_b]
+        entries = (await client.get(f"{BASE_URL}/time-entries/", params={"project_id": project_id}, headers=headers)).json()
+        assert [e["task_id"] for e in entries] == [task_b]
+        bad_res = await client.post(f"{BASE_URL}/time-entries/", json={"task_id": task_a, "minutes": 0}, headers=headers)
+        assert bad_res.status_code == 422
+        print("✅ Task grouping, listing and validation")
+
+        # Cleanup (cascades to entries and their rollups)
+        await client.delete(f"{BASE_URL}/projects/{project_id}", headers=headers)
+
+if __name__ == "__main__":
+    asyncio.run(test_time_entries_api())
@@ -0,0 +1,47 @@
+from core.cache import TTLCache
+
+
+def test_set_skipped_after_invalidation():
+    """A value computed before an invalidation is not cached after it."""
+    cache = TTLCache()
+    version = cache.version(1)
+    cache.invalidate(1)  # A write commits while the value is being computed
+    cache.set(1, "stale", version=version)
+    assert cache.get(1) is None
+
+    version = cache.version(1)
+    cache.set(1, "fresh", version=version)
+    assert cache.get(1) == "fresh"
+    print("✓ Stale results are not stored")
+
+
+def test_clear_moves_every_version():
+    cache = TTLCache()
+    version = cache.version("a")
+    cache.clear()
+    cache.set("a", 1, version=version)
+    assert cache.get("a") is None
+    print("✓ clear() invalidates in-flight computations")
+
+
+def test_other_keys_unaffected():
+    cache = TTLCache()
+    version = cache.version(1)
+    cache.invalidate(2)
+    cache.set(1, "value", version=version)
+    assert cache.get(1) == "value"
+    print("✓ Invalidating one key leaves the others cacheable")
+
+
+def test_ttl_expiry():
+    cache = TTLCache(ttl=0)
+    cache.set(1, "value")
+    assert cache.get(1) is None
+    print("✓ Entries expire after the TTL")
+
+
+if __name__ == "__main__":
+    test_set_skipped_after_invalidation()
+    test_clear_moves_every_version()
+    test_other_keys_unaffected()
+    test_ttl_expiry()
@@ -0,0 +1,83 @@
+import asyncio
+import os
+import httpx
+
+BASE_URL = "http://localhost:8000/api/v1"
+ROOT_URL = "http://localhost:8000"
+ADMIN_EMAIL = "admin@workprofit.com"
+ADMIN_PASSWORD = "admin123"
+
+async def test_resumable_upload():
+    async with httpx.AsyncClient() as client:
+        # 1. Login
+        login_res = await client.post(f"{BASE_URL}/auth/login", json={
+            "email": ADMIN_EMAIL,
+            "password": ADMIN_PASSWORD
+        })
+        assert login_res.status_code == 200, f"Login failed: {login_res.text}"
+        token = login_res.json()["access_token"]
+        headers = {"Authorization": f"Bearer {token}"}
+        print("✅ Login successful")
+
+        payload = os.urandom(300_000)
+
+        # 2. Create session
+        create_res = await client.post(f"{BASE_URL}/files/uploads", json={
+            "filename": "spec.pdf",
+            "total_size": len(payload)
+        }, headers=headers)
+        assert create_res.status_code == 201, f"Create session failed: {create_res.text}"
+        upload_id = create_res.json()["upload_id"]
+        assert create_res.json()["offset"] == 0
+        print(f"✅ Upload session created ({upload_id})")
+
+        # 3. Send first chunk
+        chunk_res = await client.patch(f"{BASE_URL}/files/uploads/{upload_id}", content=payload[:100_000],
+                                       headers={**headers, "Upload-Offset": "0"})
+        assert chunk_res.status_code == 200, f"Chunk failed: {chunk_res.text}"
+        assert chunk_res.json()["offset"] == 100_000
+        print("✅ First chunk accepted")
+
+        # 4. Wrong offset is rejected with the expected offset
+        bad_res = await client.patch(f"{BASE_URL}/files/uploads/{upload_id}", content=payload[:10],
+                                     headers={**headers, "Upload-Offset": "0"})
+        assert bad_res.status_code == 409
+        assert bad_res.headers["Upload-Offset"] == "100000"
+        print("✅ Out-of-order chunk rejected")
+
+        # 5. Completing early fails
+        early_res = await client.post(f"{BASE_URL}/files/uploads/{upload_id}/complete", headers=headers)
+        assert early_res.status_code == 400
+        print("✅ Incomplete upload cannot be finalized")
+
+        # 6. Resume: ask for the offset, then send the rest
+        status_res = await client.get(f"{BASE_URL}/files/uploads/{upload_id}", headers=headers)
+        offset = status_res.json()["offset"]
+        chunk_res = await client.patch(f"{BASE_URL}/files/uploads/{upload_id}", content=payload[offset:],
+                                       headers={**headers, "Upload-Offset": str(offset)})
+        assert chunk_res.status_code == 200
+        assert chunk_res.json()["offset"] == len(payload)
+        print("✅ Upload resumed")
+
+        # 7. Finalize twice at once (e.g. a retried request) and download
+        results = await asyncio.gather(*[
+            client.post(f"{BASE_URL}/files/uploads/{upload_id}/complete", headers=headers) for _ in range(2)
+        ])
+        complete_res = next((res for res in results if res.status_code == 200), None)
+        assert complete_res is not None, f"Complete failed: {[res.text for res in results]}"
+        assert sorted(res.status_code for res in results)[0] == 200
+        assert sorted(res.status_code for res in results)[1] in (400, 404), [res.text for res in results]
+        print("✅ Concurrent complete is refused, not a server error")
+        url = complete_res.json()["url"]
+        file_res = await client.get(f"{ROOT_URL}{url}")
+        assert file_res.status_code == 200
+        assert file_res.content == payload
+        print("✅ Upload finalized and content matches")
+
+        # 8. Session is gone
+        gone_res = await client.get(f"{BASE_URL}/files/uploads/{upload_id}", headers=headers)
+        assert gone_res.status_code == 404
+        print("✅ Session cleaned up")
+
+if __name__ == "__main__":
+    asyncio.run(test_resumable_upload())
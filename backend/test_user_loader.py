@@ -0,0 +1,46 @@
+import asyncio
+from sqlalchemy import event, select
+from database import AsyncSessionLocal, engine
+from models.user import User
+from core.loaders import UserLoader
+
+statements = []
+
+
+def count_statement(conn, cursor, statement, parameters, context, executemany):
+    statements.append(statement)
+
+
+async def test_user_loader():
+    """Primed and concurrent loads share one query; repeats are memoized."""
+    event.listen(engine.sync_engine, "before_cursor_execute", count_statement)
+    try:
+        async with AsyncSessionLocal() as session:
+            user_ids = (await session.execute(select(User.id).limit(3))).scalars().all()
+            session.expunge_all()
+            missing_id = max(user_ids, default=0) + 1_000_000
+
+            loader = UserLoader(session)
+            statements.clear()
+            loader.prime(*user_ids, missing_id)
+            users = await asyncio.gather(*(loader.load(user_id) for user_id in user_ids))
+            assert [u.id for u in users] == list(user_ids), users
+            assert await loader.load(missing_id) is None
+            assert len(statements) == 1, statements
+            print(f"✓ {len(user_ids) + 1} users resolved with one query")
+
+            again = await loader.load_many([*user_ids, missing_id])
+            assert again[:-1] == users and again[-1] is None
+            assert len(statements) == 1, statements
+            print("✓ Repeated loads are served from the loader")
+
+            fresh = UserLoader(session)
+            await fresh.load_many(user_ids)
+            assert len(statements) == 1, statements
+            print("✓ Users already in the session are reused without a query")
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", count_statement)
+
+
+if __name__ == "__main__":
+    asyncio.run(test_user_loader())
@@ -0,0 +1,59 @@
+import asyncio
+import uuid
+import httpx
+
+BASE_URL = "http://localhost:8000/api/v1"
+ADMIN_EMAIL = "admin@workprofit.com"
+ADMIN_PASSWORD = "admin123"
+
+async def test_user_lookup_api():
+    async with httpx.AsyncClient() as client:
+        # 1. Login
+        login_res = await client.post(f"{BASE_URL}/auth/login", json={
+            "email": ADMIN_EMAIL,
+            "password": ADMIN_PASSWORD
+        })
+        assert login_res.status_code == 200, f"Login failed: {login_res.text}"
+        headers = {"Authorization": f"Bearer {login_res.json()['access_token']}"}
+        print("✅ Login successful")
+
+        # 2. A user with a distinctive name
+        surname = f"Zephyrine{uuid.uuid4().hex[:6]}"
+        user_res = await client.post(f"{BASE_URL}/users/", json={
+            "email": f"{surname.lower()}@workprofit.com",
+            "password": "lookup123",
+            "first_name": "Quinta",
+            "last_name": surname,
+            "role": "STAFF",
+            "department": "QA"
+        }, headers=headers)
+        assert user_res.status_code == 201, f"User creation failed: {user_res.text}"
+        user_id = user_res.json()["id"]
+
+        async def lookup(q, **params):
+            res = await client.get(f"{BASE_URL}/users/lookup", params={"q": q, **params}, headers=headers)
+            assert res.status_code == 200, f"Lookup failed: {res.text}"
+            return res.json()
+
+        # 3. Prefix, substring and typo-tolerant matches return a minimal payload
+        results = await lookup(surname[:8])
+        assert results and results[0]["id"] == user_id
+        assert set(results[0]) == {"id", "name", "avatar_url"}
+        assert results[0]["name"] == f"Quinta {surname}"
+        assert user_id in {u["id"] for u in await lookup(surname.upper())}
+        assert user_id in {u["id"] for u in await lookup(surname.lower()[1:])}
+        assert user_id in {u["id"] for u in await lookup("Zephyrin" + surname[9:])}
+        print("✅ Prefix, substring and fuzzy lookups")
+
+        # 4. Role filter
+        assert await lookup(surname, role="CLIENT") == []
+        print("✅ Role filter")
+
+        # 5. Deactivated users drop out, even for a cached query
+        await client.delete(f"{BASE_URL}/users/{user_id}", headers=headers)
+        await asyncio.sleep(0.5)
+        assert user_id not in {u["id"] for u in await lookup(surname[:8])}
+        print("✅ Inactive users excluded")
+
+if __name__ == "__main__":
+    asyncio.run(test_user_lookup_api())
@@ -0,0 +1,78 @@
+import asyncio
+import httpx
+from datetime import date, timedelta
+
+BASE_URL = "http://localhost:8000/api/v1"
+ADMIN_EMAIL = "admin@workprofit.com"
+ADMIN_PASSWORD = "admin123"
+
+async def test_workload_api():
+    async with httpx.AsyncClient() as client:
+        # 1. Login
+        login_res = await client.post(f"{BASE_URL}/auth/login", json={
+            "email": ADMIN_EMAIL,
+            "password": ADMIN_PASSWORD
+        })
+        assert login_res.status_code == 200, f"Login failed: {login_res.text}"
+        headers = {"Authorization": f"Bearer {login_res.json()['access_token']}"}
+        admin_id = (await client.get(f"{BASE_URL}/auth/me", headers=headers)).json()["id"]
+        print("✅ Login successful")
+
+        # 2. Project with tasks assigned to the admin
+        today = date.today()
+        project_res = await client.post(f"{BASE_URL}/projects/", json={
+            "name": "Workload Project",
+            "start_date": str(today),
+            "end_date": str(today + timedelta(days=30))
+        }, headers=headers)
+        project_id = project_res.json()["id"]
+
+        async def workload(**params):
+            res = await client.get(f"{BASE_URL}/reports/workload", params={"project_id": project_id, **params}, headers=headers)
+            assert res.status_code == 200, f"Workload failed: {res.text}"
+            return res.json()["groups"]
+
+        assert await workload() == []
+
+        specs = [
+            {"title": "Overdue", "due_date": str(today - timedelta(days=3))},
+            {"title": "Due today", "due_date": str(today), "status": "IN_PROGRESS"},
+            {"title": "No due date"},
+            {"title": "Finished", "status": "DONE", "due_date": str(today - timedelta(days=1))},
+        ]
+        task_ids = []
+        for spec in specs:
+            task_res = await client.post(f"{BASE_URL}/tasks/", json={
+                "project_id": project_id, "assignee_id": admin_id, **spec
+            }, headers=headers)
+            assert task_res.status_code == 201, task_res.text
+            task_ids.append(task_res.json()["id"])
+        await asyncio.sleep(0.2)  # Cache invalidation goes through the event bus
+
+        # 3. Per-assignee counts
+        [group] = await workload()
+        assert group["key"] == admin_id
+        assert group["open_tasks"] == 3
+        assert group["in_progress_tasks"] == 1
+        assert group["overdue_tasks"] == 1
+        assert group["due_this_week_tasks"] == 1
+        print("✅ Per-assignee counts")
+
+        # 4. Unassigning a task invalidates the cached report
+        await client.patch(f"{BASE_URL}/tasks/{task_ids[0]}", json={"assignee_id": None}, headers=headers)
+        await asyncio.sleep(0.2)
+        groups = {g["label"]: g for g in await workload()}
+        assert groups["Unassigned"]["overdue_tasks"] == 1
+        assert groups["Unassigned"]["open_tasks"] == 1
+        print("✅ Cache invalidated on assignment change")
+
+        # 5. Department and role grouping
+        assert {g["key"] for g in await workload(group_by="role")} == {"ADMIN", None}
+        assert sum(g["open_tasks"] for g in await workload(group_by="department")) == 3
+        print("✅ Department and role grouping")
+
+        # Cleanup
+        await client.delete(f"{BASE_URL}/projects/{project_id}", headers=headers)
+
+if __name__ == "__main__":
+    asyncio.run(test_workload_api())
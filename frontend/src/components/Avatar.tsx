@@ -0,0 +1,20 @@
+import { assetUrl } from '../services/api';
+
+interface AvatarProps {
+    name: string;
+    thumbnailUrl?: string | null;
+    className: string;
+    children: React.ReactNode;
+}
+
+// Shows the user's avatar thumbnail, or `children` (initials/icon) when they have none
+export default function Avatar({ name, thumbnailUrl, className, children }: AvatarProps) {
+    if (thumbnailUrl) {
+        return <img src={assetUrl(thumbnailUrl)} alt={name} title={name} loading="lazy" className={`${className} object-cover`} />;
+    }
+    return (
+        <div className={className} title={name}>
+            {children}
+        </div>
+    );
+}
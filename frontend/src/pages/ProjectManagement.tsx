@@ -1,7 +1,8 @@
 import { useEffect, useState } from 'react';
 import { useNavigate } from 'react-router-dom';
 import apiClient from '../services/api';
-import Layout from '../components/Layout';
+import Layout from '../components/Layout';
+import Avatar from '../components/Avatar';
 import { useAuthStore } from '../store/authStore';
 
 interface UserBrief {
@@ -10,6 +11,7 @@ interface UserBrief {
     last_name: string;
     email: string;
     role: string;
+    avatar_thumbnail_url?: string | null;
 }
 
 interface Project {
@@ -293,18 +295,27 @@ export default function ProjectManagement() {
                                     </td>
                                     <td className="px-6 py-4 whitespace-nowrap">
                                         <div className="flex items-center gap-3">
-                                            <div className="size-8 rounded-full bg-primary/20 dark:bg-primary/30 flex items-center justify-center text-primary">
+                                            <Avatar
+                                                name={getUserFullName(project.team_lead)}
+                                                thumbnailUrl={project.team_lead?.avatar_thumbnail_url}
+                                                className="size-8 rounded-full bg-primary/20 dark:bg-primary/30 flex items-center justify-center text-primary"
+                                            >
                                                 <span className="material-symbols-outlined text-lg">person</span>
-                                            </div>
+                                            </Avatar>
                                             <span className="text-sm text-gray-800 dark:text-gray-200">{getUserFullName(project.team_lead)}</span>
                                         </div>
                                     </td>
                                     <td className="px-6 py-4 whitespace-nowrap">
                                         <div className="flex -space-x-2">
                                             {(project.members || []).slice(0, 3).map((member) => (
-                                                <div key={member.id} className="size-8 rounded-full bg-primary/20 dark:bg-primary/30 ring-2 ring-white dark:ring-gray-900 flex items-center justify-center text-primary" title={getUserFullName(member)}>
+                                                <Avatar
+                                                    key={member.id}
+                                                    name={getUserFullName(member)}
+                                                    thumbnailUrl={member.avatar_thumbnail_url}
+                                                    className="size-8 rounded-full bg-primary/20 dark:bg-primary/30 ring-2 ring-white dark:ring-gray-900 flex items-center justify-center text-primary"
+                                                >
                                                     <span className="text-xs font-bold">{member.first_name.charAt(0)}{member.last_name.charAt(0)}</span>
-                                                </div>
+                                                </Avatar>
                                             ))}
                                             {(project.members?.length || 0) > 3 && (
                                                 <div className="size-8 rounded-full bg-gray-200 dark:bg-gray-700 ring-2 ring-white dark:ring-gray-900 flex items-center justify-center text-gray-600 dark:text-gray-300">
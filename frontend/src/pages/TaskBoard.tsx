@@ -1,6 +1,7 @@
 import { useEffect, useState } from 'react';
 import { useParams, useNavigate } from 'react-router-dom';
-import apiClient from '../services/api';
+import apiClient, { API_BASE_URL } from '../services/api';
+import Avatar from '../components/Avatar';
 import Layout from '../components/Layout';
 import { type Task, TaskStatus, TaskPriority, type TaskCreate } from '../types/task';
 
@@ -43,6 +44,39 @@ export default function TaskBoard() {
         }
     }, [projectId]);
 
+    // Live updates: apply other users' task changes without re-fetching the board
+    useEffect(() => {
+        const token = localStorage.getItem('token');
+        if (!projectId || !token) return;
+
+        const source = new EventSource(
+            `${API_BASE_URL}/events/stream?project_id=${projectId}&token=${encodeURIComponent(token)}`
+        );
+        source.onmessage = (e) => {
+            const event = JSON.parse(e.data);
+            switch (event.type) {
+                case 'task.created':
+                    setTasks(prev => prev.some(t => t.id === event.task.id) ? prev : [...prev, event.task]);
+                    break;
+                case 'task.updated':
+                    setTasks(prev =>
+                        prev.map(t => (t.id === event.task_id ? { ...t, ...event.changes, updated_at: event.updated_at } : t))
+                    );
+                    break;
+                case 'task.deleted':
+                    setTasks(prev => prev.filter(t => t.id !== event.task_id));
+                    break;
+                case 'resync':
+                    fetchProjectAndTasks();
+                    break;
+                case 'closed':
+                    source.close();
+                    break;
+            }
+        };
+        return () => source.close();
+    }, [projectId]);
+
     const fetchProjectAndTasks = async () => {
         try {
             const [projectRes, tasksRes] = await Promise.all([
@@ -239,12 +273,13 @@ export default function TaskBoard() {
                                                 {task.due_date || 'No date'}
                                             </div>
                                             {assignee ? (
-                                                <div
+                                                <Avatar
+                                                    name={`${assignee.first_name} ${assignee.last_name}`}
+                                                    thumbnailUrl={assignee.avatar_thumbnail_url}
                                                     className="size-7 rounded-full bg-primary/15 dark:bg-primary/25 flex items-center justify-center text-primary text-[10px] font-bold"
-                                                    title={`${assignee.first_name} ${assignee.last_name}`}
                                                 >
                                                     {initials || 'U'}
-                                                </div>
+                                                </Avatar>
                                             ) : (
                                                 <span className="text-gray-300 dark:text-gray-600">Unassigned</span>
                                             )}
@@ -1,6 +1,7 @@
 import { useEffect, useState } from 'react';
 import apiClient from '../services/api';
-import Layout from '../components/Layout';
+import Layout from '../components/Layout';
+import Avatar from '../components/Avatar';
 
 interface User {
     id: number;
@@ -13,6 +14,7 @@ interface User {
     phone_number?: string;
     created_at?: string;
     last_login?: string;
+    avatar_thumbnail_url?: string | null;
 }
 
 interface UserFormData {
@@ -370,9 +372,13 @@ export default function UserManagement() {
                                 <tr key={user.id} className="hover:bg-gray-50 dark:hover:bg-gray-800/50">
                                     <td className="px-6 py-4 whitespace-nowrap">
                                         <div className="flex items-center gap-3">
-                                            <div className="size-10 rounded-full bg-primary/20 dark:bg-primary/30 flex items-center justify-center text-primary">
+                                            <Avatar
+                                                name={`${user.first_name} ${user.last_name}`}
+                                                thumbnailUrl={user.avatar_thumbnail_url}
+                                                className="size-10 rounded-full bg-primary/20 dark:bg-primary/30 flex items-center justify-center text-primary"
+                                            >
                                                 <span className="material-symbols-outlined">person</span>
-                                            </div>
+                                            </Avatar>
                                             <span className="text-sm font-medium text-gray-900 dark:text-white">{user.first_name} {user.last_name}</span>
                                         </div>
                                     </td>
@@ -1,7 +1,7 @@
 import axios from 'axios';
 
 // Allow overriding API base URL via env; fall back to localhost
-const API_BASE_URL =
+export const API_BASE_URL =
     import.meta.env.VITE_API_BASE_URL ||
     'http://localhost:8000/api/v1';
 
@@ -40,4 +40,7 @@ apiClient.interceptors.response.use(
     }
 );
 
+// Server-relative URLs in API responses (e.g. avatar_thumbnail_url) point at the API host
+export const assetUrl = (path: string) => new URL(path, API_BASE_URL).toString();
+
 export default apiClient;